@@ -9,6 +9,8 @@ import math
 from collections import Counter, defaultdict
 from typing import Dict, List, Set, Any, Optional
 
+from .pair_analyzer import calculate_pairs
+
 
 # Common generic words that indicate low specificity
 GENERIC_WORDS = {
@@ -68,7 +70,8 @@ def detect_overbroad_tags(
 def calculate_tag_specificity(
     tag: str,
     tag_stats: Dict[str, Dict[str, Any]],
-    total_files: int
+    total_files: int,
+    cooccurrence_counts: Optional[Dict[str, int]] = None
 ) -> Dict[str, Any]:
     """Calculate specificity score for a tag.
 
@@ -82,6 +85,8 @@ def calculate_tag_specificity(
         tag: The tag to analyze
         tag_stats: Tag usage statistics
         total_files: Total number of files in vault
+        cooccurrence_counts: Co-occurring tag counts from count_cooccurring_tags,
+            to avoid comparing against every other tag when scoring many tags
 
     Returns:
         Dictionary with specificity analysis
@@ -100,14 +105,16 @@ def calculate_tag_specificity(
     generic_penalty = -5 if is_generic else 0
 
     # 4. Co-occurrence diversity (how many different tags does it appear with?)
-    cooccurring_tags = set()
-    for other_tag, stats in tag_stats.items():
-        if other_tag != tag:
-            if len(tag_stats[tag]['files'] & stats['files']) > 0:
-                cooccurring_tags.add(other_tag)
+    if cooccurrence_counts is not None:
+        cooccurring_count = cooccurrence_counts.get(tag, 0)
+    else:
+        cooccurring_count = sum(
+            1 for other_tag, stats in tag_stats.items()
+            if other_tag != tag and not tag_stats[tag]['files'].isdisjoint(stats['files'])
+        )
 
     # High diversity might indicate overuse
-    diversity_ratio = len(cooccurring_tags) / max(len(tag_stats) - 1, 1)
+    diversity_ratio = cooccurring_count / max(len(tag_stats) - 1, 1)
     diversity_penalty = -2 if diversity_ratio > 0.5 else 0
 
     # Combined specificity score
@@ -124,6 +131,32 @@ def calculate_tag_specificity(
     }
 
 
+def count_cooccurring_tags(tag_stats: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    """Count how many other tags share at least one file with each tag.
+
+    Pairs are counted from each file's tags, so only tags that actually
+    share files are ever compared.
+
+    Args:
+        tag_stats: Tag usage statistics
+
+    Returns:
+        Dictionary mapping tags to their number of co-occurring tags
+        (tags with none are left out)
+    """
+    # Each tag reaches a file once (files is a set), so lists need no dedup
+    file_to_tags: Dict[Any, List[str]] = defaultdict(list)
+    for tag, stats in tag_stats.items():
+        for file_path in stats['files']:
+            file_to_tags[file_path].append(tag)
+
+    counts: Counter[str] = Counter()
+    for tag1, tag2 in calculate_pairs(file_to_tags, min_pairs=1):
+        counts[tag1] += 1
+        counts[tag2] += 1
+    return counts
+
+
 def _assess_specificity(score: float) -> str:
     """Assess specificity level based on score.
 
@@ -209,8 +242,9 @@ def analyze_tag_quality(
     overbroad = detect_overbroad_tags(tag_stats, total_files)
 
     # Calculate specificity for all tags
+    cooccurrence_counts = count_cooccurring_tags(tag_stats)
     specificity_scores = {
-        tag: calculate_tag_specificity(tag, tag_stats, total_files)
+        tag: calculate_tag_specificity(tag, tag_stats, total_files, cooccurrence_counts)
         for tag in tag_stats.keys()
     }
 
@@ -27,13 +27,18 @@ The embedding approach is particularly effective at catching semantic relationsh
 that simple string matching misses, using character-level features that work well
 for short tag text.
 """
-import json
+import multiprocessing
+import os
 import sys
 import argparse
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from difflib import SequenceMatcher
 import re
-from typing import Dict, List, Set, Any, Optional, Iterable
+from typing import Callable, Dict, List, Set, Any, Optional, Iterable, Tuple
+from tagex.analysis.pair_analyzer import calculate_pairs
+from tagex.utils.input_handler import read_json_file
 from tagex.utils.tag_normalizer import is_valid_tag
 
 try:
@@ -44,10 +49,18 @@ try:
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 # Constants for similarity analysis
 MIN_TAG_LENGTH_FOR_SIMILARITY = 3  # Minimum tag length to check for similarity
 MIN_SHARED_FILES_FOR_OVERLAP = 5  # Minimum shared files to consider tags overlapping
+SIMILARITY_BLOCK_ROWS = 512  # Tags scored per block of a similarity matrix, bounding its size
+PARALLEL_MIN_TAGS = 5000  # Below this many tags, worker start-up costs more than the analyzers take
 
 
 def load_tag_data(json_file: str) -> List[Dict[str, Any]]:
@@ -59,8 +72,7 @@ def load_tag_data(json_file: str) -> List[Dict[str, Any]]:
     Returns:
         List of tag dictionaries
     """
-    with open(json_file, 'r') as f:
-        return json.load(f)  # type: ignore[no-any-return]
+    return read_json_file(json_file)  # type: ignore[no-any-return]
 
 
 def build_tag_stats(tag_data: List[Dict[str, Any]], filter_noise: bool = False) -> Dict[str, Dict[str, Any]]:
@@ -101,6 +113,14 @@ def find_similar_tags(tags: Iterable[str], similarity_threshold: float = 0.85) -
     processed: Set[str] = set()
 
     tags_list = list(tags)
+    lowered = [tag.lower() for tag in tags_list]
+    # Only consider very similar tags to avoid false positives
+    eligible = [i for i, tag in enumerate(tags_list) if len(tag) > MIN_TAG_LENGTH_FOR_SIMILARITY]
+    if RAPIDFUZZ_AVAILABLE:
+        candidates = _similarity_candidates_rapidfuzz(lowered, eligible, similarity_threshold)
+    else:
+        candidates = _similarity_candidates_by_length(lowered, eligible, similarity_threshold)
+
     for i, tag1 in enumerate(tags_list):
         if tag1 in processed:
             continue
@@ -108,16 +128,16 @@ def find_similar_tags(tags: Iterable[str], similarity_threshold: float = 0.85) -
         group = [tag1]
         processed.add(tag1)
 
-        for j, tag2 in enumerate(tags_list[i+1:], i+1):
+        for j in candidates.get(i, ()):
+            tag2 = tags_list[j]
             if tag2 in processed:
                 continue
 
-            # Only consider very similar tags to avoid false positives
-            if len(tag1) > MIN_TAG_LENGTH_FOR_SIMILARITY and len(tag2) > MIN_TAG_LENGTH_FOR_SIMILARITY:
-                similarity = SequenceMatcher(None, tag1.lower(), tag2.lower()).ratio()
-                if similarity >= similarity_threshold:
-                    group.append(tag2)
-                    processed.add(tag2)
+            # quick_ratio bounds ratio from above and costs far less
+            matcher = SequenceMatcher(None, lowered[i], lowered[j])
+            if matcher.quick_ratio() >= similarity_threshold and matcher.ratio() >= similarity_threshold:
+                group.append(tag2)
+                processed.add(tag2)
 
         if len(group) > 1:
             similar_groups.append(group)
@@ -125,6 +145,68 @@ def find_similar_tags(tags: Iterable[str], similarity_threshold: float = 0.85) -
     return similar_groups
 
 
+def _similarity_candidates_by_length(lowered: List[str], eligible: List[int],
+                                     similarity_threshold: float) -> Dict[int, List[int]]:
+    """Map each eligible index to the later indices whose length allows a match.
+
+    SequenceMatcher's ratio is at most 2*min(la, lb)/(la + lb), so pairs
+    whose lengths differ too much can never reach the threshold.
+
+    Args:
+        lowered: Lowercased tags
+        eligible: Indices of tags long enough to compare
+        similarity_threshold: Minimum similarity ratio (0-1)
+
+    Returns:
+        Dictionary mapping an index to its candidate indices, ascending
+    """
+    by_length = sorted(eligible, key=lambda i: len(lowered[i]))
+    candidates: Dict[int, List[int]] = defaultdict(list)
+    for pos, i in enumerate(by_length):
+        len_i = len(lowered[i])
+        for j in by_length[pos + 1:]:
+            if 2.0 * len_i / (len_i + len(lowered[j])) < similarity_threshold:
+                break
+            if i < j:
+                candidates[i].append(j)
+            else:
+                candidates[j].append(i)
+    for later in candidates.values():
+        later.sort()
+    return candidates
+
+
+def _similarity_candidates_rapidfuzz(lowered: List[str], eligible: List[int],
+                                     similarity_threshold: float) -> Dict[int, List[int]]:
+    """Map each eligible index to the later indices rapidfuzz scores as possible matches.
+
+    fuzz.ratio scores the longest common subsequence, which is never below
+    SequenceMatcher's ratio for the same pair, so no match is missed; the
+    caller still confirms each candidate with SequenceMatcher.
+
+    Args:
+        lowered: Lowercased tags
+        eligible: Indices of tags long enough to compare
+        similarity_threshold: Minimum similarity ratio (0-1)
+
+    Returns:
+        Dictionary mapping an index to its candidate indices, ascending
+    """
+    choices = [lowered[i] for i in eligible]
+    # Leave a little slack so float rounding can't drop a pair right at the threshold
+    score_cutoff = max(0.0, similarity_threshold * 100 - 0.01)
+    candidates: Dict[int, List[int]] = {}
+    for start in range(0, len(choices), SIMILARITY_BLOCK_ROWS):
+        scores = process.cdist(choices[start:start + SIMILARITY_BLOCK_ROWS], choices,
+                               scorer=fuzz.ratio, score_cutoff=score_cutoff, workers=-1)
+        rows, cols = (scores >= score_cutoff).nonzero()
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            # Each pair once, from the earlier tag; rows and columns come out ascending
+            if col > start + row:
+                candidates.setdefault(eligible[start + row], []).append(eligible[col])
+    return candidates
+
+
 def find_variant_patterns(tags: Iterable[str]) -> Dict[str, List[str]]:
     """Find tags that are likely variants of each other.
 
@@ -143,7 +225,9 @@ def find_variant_patterns(tags: Iterable[str]) -> Dict[str, List[str]]:
     """
     from tagex.analysis.plural_normalizer import normalize_plural_forms, normalize_compound_plurals, get_preferred_form
 
-    variants: Dict[str, List[str]] = defaultdict(list)
+    # Each group is a dict used as an ordered set: a tag is kept once, in
+    # first-seen order, without deduplicating every group afterwards
+    variants: Dict[str, Dict[str, None]] = defaultdict(dict)
 
     # Group by base patterns
     for tag in tags:
@@ -157,24 +241,21 @@ def find_variant_patterns(tags: Iterable[str]) -> Dict[str, List[str]]:
 
         # Get preferred form (usually plural)
         canonical = get_preferred_form(all_forms).lower()
-        for form in all_forms:
-            variants[canonical].append(tag)
+        variants[canonical][tag] = None
 
         # Remove -ing suffix
         if base.endswith('ing'):
-            base_form = base[:-3]
-            variants[base_form].append(tag)
+            variants[base[:-3]][tag] = None
 
         # Remove -ed suffix
         if base.endswith('ed'):
-            base_form = base[:-2]
-            variants[base_form].append(tag)
+            variants[base[:-2]][tag] = None
 
         # Add the tag to its own base form
-        variants[base].append(tag)
+        variants[base][tag] = None
 
     # Return only groups with multiple variants
-    return {k: list(set(v)) for k, v in variants.items() if len(set(v)) > 1}
+    return {k: list(v) for k, v in variants.items() if len(v) > 1}
 
 
 def find_semantic_duplicates_embedding(
@@ -198,18 +279,20 @@ def find_semantic_duplicates_embedding(
     if len(tags) < 2:
         return []
     
-    # Create character-level n-grams for better semantic matching
+    # Create character-level n-grams for better semantic matching.
+    # float32 halves the matrix and the similarity blocks built from it
     vectorizer = TfidfVectorizer(
         analyzer='char_wb',
         ngram_range=(2, 4),
         lowercase=True,
-        max_features=1000
+        max_features=1000,
+        dtype=np.float32
     )
     
     try:
         # Fit and transform tags
         tfidf_matrix = vectorizer.fit_transform(tags)
-        similarity_matrix = cosine_similarity(tfidf_matrix)
+        similar_later = _similar_rows_by_block(tfidf_matrix, similarity_threshold)
         
         # Find similar tag groups
         groups = []
@@ -219,27 +302,29 @@ def find_semantic_duplicates_embedding(
             if tag1 in processed:
                 continue
                 
-            group = [tag1]
+            group = [i]
             processed.add(tag1)
             
-            for j, tag2 in enumerate(tags[i+1:], i+1):
+            for j in similar_later.get(i, ()):
+                tag2 = tags[j]
                 if tag2 in processed:
                     continue
                     
-                if similarity_matrix[i][j] >= similarity_threshold:
-                    group.append(tag2)
-                    processed.add(tag2)
+                group.append(j)
+                processed.add(tag2)
             
             if len(group) > 1:
                 # Sort by usage count
-                sorted_group = sorted(group, key=lambda t: tag_stats[t]['count'], reverse=True)
+                sorted_group = sorted(group, key=lambda t: tag_stats[tags[t]]['count'], reverse=True)
+                group_tags = [tags[t] for t in sorted_group]
+                # Scores against the kept tag may fall below the threshold, so compute them here
+                keep_scores = cosine_similarity(tfidf_matrix[[sorted_group[0]]], tfidf_matrix[sorted_group[1:]])[0]
                 groups.append({
                     'method': 'embedding',
-                    'tags': sorted_group,
-                    'suggested_keep': sorted_group[0],
-                    'total_usage': sum(tag_stats[tag]['count'] for tag in sorted_group),
-                    'similarity_scores': [similarity_matrix[tags.index(sorted_group[0])][tags.index(t)] 
-                                        for t in sorted_group[1:]]
+                    'tags': group_tags,
+                    'suggested_keep': group_tags[0],
+                    'total_usage': sum(tag_stats[tag]['count'] for tag in group_tags),
+                    'similarity_scores': keep_scores.tolist()
                 })
         
         return groups
@@ -250,6 +335,29 @@ def find_semantic_duplicates_embedding(
         return find_semantic_duplicates_pattern(tag_stats)
 
 
+def _similar_rows_by_block(tfidf_matrix: Any, similarity_threshold: float) -> Dict[int, List[int]]:
+    """Map each row index to the later rows with cosine similarity at or above the threshold.
+
+    Similarities are computed SIMILARITY_BLOCK_ROWS rows at a time, so only
+    one block of the N x N matrix is held in memory at once.
+
+    Args:
+        tfidf_matrix: TF-IDF matrix with one row per tag
+        similarity_threshold: Minimum cosine similarity
+
+    Returns:
+        Dictionary mapping a row index to its similar later rows, ascending
+    """
+    similar_later: Dict[int, List[int]] = {}
+    for start in range(0, tfidf_matrix.shape[0], SIMILARITY_BLOCK_ROWS):
+        block = cosine_similarity(tfidf_matrix[start:start + SIMILARITY_BLOCK_ROWS], tfidf_matrix)
+        rows, cols = (block >= similarity_threshold).nonzero()
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            if col > start + row:
+                similar_later.setdefault(start + row, []).append(col)
+    return similar_later
+
+
 def find_semantic_duplicates_pattern(tag_stats: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Fallback pattern-based semantic duplicate detection using generic morphological patterns.
 
@@ -345,37 +453,45 @@ def find_overlapping_tags(
         List of overlapping tag pairs with metadata
     """
     overlaps = []
-    tags_list = list(tag_stats.keys())
-    
-    for i, tag1 in enumerate(tags_list):
-        for tag2 in tags_list[i+1:]:
-            files1 = tag_stats[tag1]['files']
-            files2 = tag_stats[tag2]['files']
-            
-            if len(files1) == 0 or len(files2) == 0:
-                continue
-                
-            intersection = len(files1.intersection(files2))
-            union = len(files1.union(files2))
-            overlap_ratio = intersection / union if union > 0 else 0
-            
-            if overlap_ratio >= overlap_threshold and intersection >= MIN_SHARED_FILES_FOR_OVERLAP:
-                overlaps.append({
-                    'tag1': tag1,
-                    'tag2': tag2,
-                    'overlap_ratio': overlap_ratio,
-                    'shared_files': intersection,
-                    'total_files': union,
-                    'suggested_keep': tag1 if tag_stats[tag1]['count'] > tag_stats[tag2]['count'] else tag2
-                })
-    
+    position = {tag: i for i, tag in enumerate(tag_stats)}
+
+    # Only tags sharing files can overlap, so count shared files per pair
+    # from each file's tags, as pair analysis does, rather than intersecting
+    # every pair of tag file sets. Tags in too few files can never qualify.
+    # Each tag reaches a file once (files is a set), so lists need no dedup
+    file_to_tags: Dict[str, List[str]] = defaultdict(list)
+    for tag, stats in tag_stats.items():
+        if len(stats['files']) >= MIN_SHARED_FILES_FOR_OVERLAP:
+            for file_path in stats['files']:
+                file_to_tags[file_path].append(tag)
+    shared_counts = calculate_pairs(file_to_tags, MIN_SHARED_FILES_FOR_OVERLAP)
+
+    # Visit pairs in tag order, so equal ratios keep the order of a pairwise scan
+    pairs = sorted((sorted(pair, key=position.__getitem__) for pair in shared_counts),
+                   key=lambda pair: (position[pair[0]], position[pair[1]]))
+    for tag1, tag2 in pairs:
+        intersection = shared_counts[(tag1, tag2) if tag1 < tag2 else (tag2, tag1)]
+        union = len(tag_stats[tag1]['files']) + len(tag_stats[tag2]['files']) - intersection
+        overlap_ratio = intersection / union
+
+        if overlap_ratio >= overlap_threshold:
+            overlaps.append({
+                'tag1': tag1,
+                'tag2': tag2,
+                'overlap_ratio': overlap_ratio,
+                'shared_files': intersection,
+                'total_files': union,
+                'suggested_keep': tag1 if tag_stats[tag1]['count'] > tag_stats[tag2]['count'] else tag2
+            })
+
     return sorted(overlaps, key=lambda x: x['overlap_ratio'], reverse=True)
 
 
 def suggest_merges(
     tag_stats: Dict[str, Dict[str, Any]],
     min_usage: int = 3,
-    args: Optional[argparse.Namespace] = None
+    args: Optional[argparse.Namespace] = None,
+    jobs: int = 0
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Generate merge suggestions.
 
@@ -383,6 +499,7 @@ def suggest_merges(
         tag_stats: Dictionary mapping tag names to their statistics
         min_usage: Minimum tag usage count to consider
         args: Command-line arguments (optional)
+        jobs: Worker processes for large tag sets (0 = all cores)
 
     Returns:
         Dictionary of suggestion categories with lists of suggestions
@@ -398,37 +515,48 @@ def suggest_merges(
     filtered_tags = {tag: stats for tag, stats in tag_stats.items() 
                     if stats['count'] >= min_usage}
     
-    # Find similar names
-    similar_groups = find_similar_tags(filtered_tags.keys())
-    for group in similar_groups:
-        # Suggest keeping the most used tag
-        sorted_group = sorted(group, key=lambda t: filtered_tags[t]['count'], reverse=True)
-        suggestions['similar_names'].append({
-            'tags': sorted_group,
-            'suggested_keep': sorted_group[0],
-            'total_usage': sum(filtered_tags[tag]['count'] for tag in sorted_group)
-        })
-    
-    # Find semantic duplicates using embeddings or fallback
+    # Choose the semantic duplicate analyzer
     if args and args.no_sklearn:
         print("\nSemantic analysis mode: Pattern-based (faster, less accurate)")
         print("Tip: Remove --no-sklearn for TF-IDF embeddings (slower, more accurate)\n")
-        suggestions['semantic_duplicates'] = find_semantic_duplicates_pattern(filtered_tags)
+        find_semantic_duplicates = find_semantic_duplicates_pattern
     elif not SKLEARN_AVAILABLE:
         print("\nSemantic analysis mode: Pattern-based fallback (scikit-learn not available)")
         print("Tip: Install scikit-learn for better results:")
         print("     uv add scikit-learn\n")
-        suggestions['semantic_duplicates'] = find_semantic_duplicates_pattern(filtered_tags)
+        find_semantic_duplicates = find_semantic_duplicates_pattern
     else:
         print("\nSemantic analysis mode: TF-IDF embeddings (slower, more accurate)")
         print("Tip: Use --no-sklearn for faster pattern-based mode\n")
-        suggestions['semantic_duplicates'] = find_semantic_duplicates_embedding(filtered_tags)
-    
-    # Find overlapping tags
-    suggestions['high_overlap'] = find_overlapping_tags(filtered_tags)
+        find_semantic_duplicates = find_semantic_duplicates_embedding
+
+    # The analyzers are independent; run them side by side on large tag sets
+    results = None
+    workers = _analyzer_worker_count(len(filtered_tags), jobs)
+    if workers > 1:
+        try:
+            results = _run_analyzers_parallel(filtered_tags, find_semantic_duplicates, workers)
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: parallel analysis unavailable, falling back to serial ({e})")
+    if results is None:
+        results = (
+            find_similar_tags(filtered_tags.keys()),
+            find_semantic_duplicates(filtered_tags),
+            find_overlapping_tags(filtered_tags),
+            find_variant_patterns(filtered_tags.keys())
+        )
+    similar_groups, suggestions['semantic_duplicates'], suggestions['high_overlap'], variant_groups = results
+
+    # Suggest keeping the most used tag of each similar-name group
+    for group in similar_groups:
+        sorted_group = sorted(group, key=lambda t: filtered_tags[t]['count'], reverse=True)
+        suggestions['similar_names'].append({
+            'tags': sorted_group,
+            'suggested_keep': sorted_group[0],
+            'total_usage': sum(filtered_tags[tag]['count'] for tag in sorted_group)
+        })
     
-    # Find variant patterns
-    variant_groups = find_variant_patterns(filtered_tags.keys())
+    # Variant groups with more than one tag
     for base, variants in variant_groups.items():
         if len(variants) > 1:
             sorted_variants = sorted(variants, key=lambda t: filtered_tags[t]['count'], reverse=True)
@@ -442,6 +570,46 @@ def suggest_merges(
     return suggestions
 
 
+def _analyzer_worker_count(tag_total: int, jobs: int) -> int:
+    """Number of worker processes to use for analyzing tag_total tags."""
+    if tag_total < PARALLEL_MIN_TAGS:
+        return 1
+    jobs = jobs or os.cpu_count() or 1
+    # Only the three name-based analyzers run in workers
+    return max(1, min(jobs, 3))
+
+
+def _run_analyzers_parallel(
+    filtered_tags: Dict[str, Dict[str, Any]],
+    find_semantic_duplicates: Callable[[Dict[str, Dict[str, Any]]], List[Dict[str, Any]]],
+    workers: int
+) -> Tuple[List[List[str]], List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, List[str]]]:
+    """Run the merge analyzers concurrently.
+
+    The similar-name, semantic and variant analyzers run in worker processes
+    and receive only tag names and counts. File overlap runs here meanwhile,
+    so the per-tag file sets are never pickled.
+
+    Args:
+        filtered_tags: Dictionary mapping tag names to their statistics
+        find_semantic_duplicates: Semantic duplicate analyzer to run
+        workers: Number of worker processes
+
+    Returns:
+        Tuple of (similar groups, semantic duplicates, overlapping tags, variant groups)
+    """
+    tags = list(filtered_tags)
+    tag_counts = {tag: {'count': stats['count']} for tag, stats in filtered_tags.items()}
+    # Same start method as the tag operations pool: plain fork doesn't copy threads safely
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method)) as executor:
+        similar_future = executor.submit(find_similar_tags, tags)
+        semantic_future = executor.submit(find_semantic_duplicates, tag_counts)
+        variant_future = executor.submit(find_variant_patterns, tags)
+        overlapping = find_overlapping_tags(filtered_tags)
+        return similar_future.result(), semantic_future.result(), overlapping, variant_future.result()
+
+
 def print_merge_suggestions(suggestions: Dict[str, List[Dict[str, Any]]]) -> None:
     """Print merge suggestions in a readable format.
 
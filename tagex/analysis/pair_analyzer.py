@@ -2,14 +2,20 @@
 """
 Tag pair analyzer for finding natural tag groupings.
 """
-import json
 from collections import defaultdict, Counter
-from itertools import combinations
+from itertools import chain, combinations
 import sys
 import argparse
-from typing import Dict, List, Set, Tuple, Any
+from typing import Collection, Dict, List, Mapping, Set, Tuple, Any
+from tagex.utils.input_handler import read_json_file
 from tagex.utils.tag_normalizer import is_valid_tag
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 def load_tag_data(json_file: str) -> List[Dict[str, Any]]:
     """Load tag data from JSON file.
@@ -20,8 +26,7 @@ def load_tag_data(json_file: str) -> List[Dict[str, Any]]:
     Returns:
         List of tag dictionaries
     """
-    with open(json_file, 'r') as f:
-        return json.load(f)  # type: ignore[no-any-return]
+    return read_json_file(json_file)  # type: ignore[no-any-return]
 
 
 def build_file_to_tags_map(tag_data: List[Dict[str, Any]], filter_noise: bool = False) -> Dict[str, Set[str]]:
@@ -34,76 +39,129 @@ def build_file_to_tags_map(tag_data: List[Dict[str, Any]], filter_noise: bool =
     Returns:
         Dictionary mapping file paths to sets of tags
     """
-    file_to_tags: Dict[str, Set[str]] = defaultdict(set)
+    # Appending is cheaper than hashing into a set per (tag, file); each
+    # file's list becomes a set once at the end
+    file_tag_lists: Dict[str, List[str]] = defaultdict(list)
 
     for tag_info in tag_data:
         tag = tag_info['tag']
         if filter_noise and not is_valid_tag(tag):
             continue
         for file_path in tag_info['relativePaths']:
-            file_to_tags[file_path].add(tag)
+            file_tag_lists[file_path].append(tag)
 
-    return file_to_tags
+    return {file_path: set(tags) for file_path, tags in file_tag_lists.items()}
 
 
-def calculate_pairs(file_to_tags: Dict[str, Set[str]], min_pairs: int = 2) -> Dict[Tuple[str, str], int]:
+def calculate_pairs(file_to_tags: Mapping[str, Collection[str]], min_pairs: int = 2) -> Dict[Tuple[str, str], int]:
     """Calculate tag pair frequencies.
 
     Args:
-        file_to_tags: Dictionary mapping file paths to sets of tags
+        file_to_tags: Dictionary mapping file paths to sets (or repeat-free lists) of tags
         min_pairs: Minimum number of occurrences for a pair to be included
 
     Returns:
         Dictionary mapping tag pairs to occurrence counts
     """
-    pairs: Dict[Tuple[str, str], int] = defaultdict(int)
+    if NUMPY_AVAILABLE:
+        return _calculate_pairs_numpy(file_to_tags, min_pairs)
+
+    pairs: Counter[Tuple[str, str]] = Counter()
 
-    for file_path, tags in file_to_tags.items():
+    for tags in file_to_tags.values():
         if len(tags) < 2:
             continue
 
-        # Generate all pairs of tags that appear together
-        for tag1, tag2 in combinations(sorted(tags), 2):
-            pairs[(tag1, tag2)] += 1
+        # Generate all pairs of tags that appear together; Counter.update
+        # counts an iterable in C rather than one += per pair
+        pairs.update(combinations(sorted(tags), 2))
 
     # Filter by minimum pairs
     return {pair: count for pair, count in pairs.items()
             if count >= min_pairs}
 
 
-def find_tag_clusters(pairs: Dict[Tuple[str, str], int], min_cluster_size: int = 3) -> List[Set[str]]:
+def _calculate_pairs_numpy(file_to_tags: Mapping[str, Collection[str]], min_pairs: int) -> Dict[Tuple[str, str], int]:
+    """calculate_pairs with the pair generation and counting done in numpy.
+
+    Every pair occurrence is encoded as one integer and counted with a sort,
+    instead of a Python dict update per pair. The result is identical to the
+    pure-Python loop, including its first-seen key order.
+    """
+    # Ids follow sorted tag order, so sorting ids sorts tags as combinations(sorted(tags)) does
+    tag_names = sorted(set().union(*file_to_tags.values()))
+    tag_ids = {tag: i for i, tag in enumerate(tag_names)}
+    groups = [sorted([tag_ids[tag] for tag in tags]) for tags in file_to_tags.values() if len(tags) >= 2]
+    if not groups:
+        return {}
+
+    # Pair every tag with each tag after it in the same file
+    sizes = np.fromiter(map(len, groups), dtype=np.int64, count=len(groups))
+    ids = np.fromiter(chain.from_iterable(groups), dtype=np.int64, count=int(sizes.sum()))
+    positions = np.arange(ids.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    partners = np.repeat(sizes, sizes) - positions - 1
+    left = np.repeat(np.arange(ids.size), partners)
+    right = left + 1 + np.arange(left.size) - np.repeat(np.cumsum(partners) - partners, partners)
+    codes = ids[left] * len(tag_names) + ids[right]
+
+    # Count each distinct code and find where it first occurred
+    order = np.argsort(codes)
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_codes[1:] != sorted_codes[:-1])))
+    counts = np.diff(np.append(starts, codes.size))
+    first_seen = np.minimum.reduceat(order, starts)
+
+    keep = np.flatnonzero(counts >= min_pairs)
+    keep = keep[np.argsort(first_seen[keep])]
+    first, second = np.divmod(sorted_codes[starts[keep]], len(tag_names))
+    names = np.array(tag_names, dtype=object)
+    pairs = zip(names[first].tolist(), names[second].tolist(), strict=True)
+    return dict(zip(pairs, counts[keep].tolist(), strict=True))
+
+
+def find_tag_clusters(
+    pairs: Dict[Tuple[str, str], int],
+    min_cluster_size: int = 3,
+    min_connection_strength: int = 3
+) -> List[Set[str]]:
     """Find clusters of tags that frequently appear together.
 
     Args:
         pairs: Dictionary mapping tag pairs to occurrence counts
         min_cluster_size: Minimum size for a cluster to be included
+        min_connection_strength: Minimum pair count for two tags to be connected
 
     Returns:
         List of tag clusters (sets of tags)
     """
-    # Build adjacency graph
-    tag_connections: Dict[str, Set[Tuple[str, int]]] = defaultdict(set)
+    # Build adjacency graph of strong connections only; every tag in a pair
+    # still seeds a search, in first-seen order
+    strong_neighbors: Dict[str, Set[str]] = defaultdict(set)
+    tags: Dict[str, None] = {}
 
     for (tag1, tag2), count in pairs.items():
-        tag_connections[tag1].add((tag2, count))
-        tag_connections[tag2].add((tag1, count))
+        tags[tag1] = None
+        tags[tag2] = None
+        if count >= min_connection_strength:
+            strong_neighbors[tag1].add(tag2)
+            strong_neighbors[tag2].add(tag1)
 
     # Find connected components / clusters
     clusters: List[Set[str]] = []
     visited: Set[str] = set()
 
-    def dfs_cluster(tag: str, current_cluster: Set[str], min_connection_strength: int = 3) -> None:
-        if tag in visited:
-            return
-        visited.add(tag)
-        current_cluster.add(tag)
-
-        # Add strongly connected neighbors
-        for neighbor, strength in tag_connections[tag]:
-            if neighbor not in visited and strength >= min_connection_strength:
-                dfs_cluster(neighbor, current_cluster, min_connection_strength)
-
-    for tag in tag_connections:
+    def dfs_cluster(tag: str, current_cluster: Set[str]) -> None:
+        # Explicit stack: dense tag graphs would otherwise exceed the recursion limit
+        stack = [tag]
+        while stack:
+            tag = stack.pop()
+            if tag in visited:
+                continue
+            visited.add(tag)
+            current_cluster.add(tag)
+            stack.extend(strong_neighbors[tag] - visited)
+
+    for tag in tags:
         if tag not in visited:
             cluster: Set[str] = set()
             dfs_cluster(tag, cluster)
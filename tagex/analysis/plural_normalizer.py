@@ -183,14 +183,14 @@ def get_preferred_form(forms: Set[str], usage_counts: dict = None,
     # Singular preference
     if preference == 'singular':
         return min(forms_list, key=lambda t: (
-            t.lower().endswith('s') or t.lower() in IRREGULAR_PLURALS.values(),  # Prefer non-plurals
+            t.lower().endswith('s') or t.lower() in IRREGULAR_SINGULARS,  # Prefer non-plurals
             -len(t),  # Shorter forms (usually singular)
             t.lower()  # Alphabetical for tiebreaker
         ))
 
     # Plural preference (default)
     return max(forms_list, key=lambda t: (
-        t.lower().endswith('s') or t.lower() in IRREGULAR_PLURALS.values(),  # Prefer plurals
+        t.lower().endswith('s') or t.lower() in IRREGULAR_SINGULARS,  # Prefer plurals
         len(t),  # Longer forms (often plurals)
         t.lower()  # Alphabetical for tiebreaker
     ))
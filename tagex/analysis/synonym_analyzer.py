@@ -6,6 +6,7 @@ This module provides both:
 2. Semantic similarity based synonym detection (tags with similar meanings)
 """
 
+from collections import defaultdict
 from typing import Dict, List, Set, Any
 
 
@@ -174,6 +175,15 @@ def find_acronym_expansions(
     acronym_candidates = []
     tags = list(tag_stats.keys())
 
+    # Index every multi-word tag by the acronym of its words once, so each
+    # short tag looks up its expansions instead of rebuilding all acronyms
+    # Simple heuristic: acronym letters match the first letters of words
+    expansions_by_acronym: Dict[str, List[str]] = defaultdict(list)
+    for other_tag in tags:
+        words = other_tag.lower().replace('-', ' ').replace('/', ' ').split()
+        if len(words) >= 2:
+            expansions_by_acronym[''.join(w[0] for w in words)].append(other_tag)
+
     for tag in tags:
         tag_lower = tag.lower()
 
@@ -182,38 +192,28 @@ def find_acronym_expansions(
             continue
 
         # Look for potential expansions
-        for other_tag in tags:
-            if tag == other_tag:
+        for other_tag in expansions_by_acronym.get(tag_lower, ()):
+            if other_tag == tag:
                 continue
 
-            other_lower = other_tag.lower()
-
-            # Check if other tag could be an expansion
-            # Simple heuristic: check if acronym letters match first letters of words
-            words = other_lower.replace('-', ' ').replace('/', ' ').split()
-            if len(words) >= 2:
-                # Build acronym from first letters
-                potential_acronym = ''.join(w[0] for w in words if w)
-
-                if potential_acronym == tag_lower:
-                    # Calculate file overlap
-                    shared = len(tag_stats[tag]['files'] & tag_stats[other_tag]['files'])
-                    tag_files = len(tag_stats[tag]['files'])
-                    other_files = len(tag_stats[other_tag]['files'])
-                    min_files = min(tag_files, other_files)
-
-                    overlap_ratio = shared / min_files if min_files > 0 else 0
-
-                    if overlap_ratio >= min_overlap_ratio:
-                        acronym_candidates.append({
-                            'acronym': tag,
-                            'expansion': other_tag,
-                            'overlap_ratio': overlap_ratio,
-                            'shared_files': shared,
-                            'acronym_count': tag_stats[tag]['count'],
-                            'expansion_count': tag_stats[other_tag]['count'],
-                            'suggestion': f"merge {tag} → {other_tag} (acronym expansion)"
-                        })
+            # Calculate file overlap
+            shared = len(tag_stats[tag]['files'] & tag_stats[other_tag]['files'])
+            tag_files = len(tag_stats[tag]['files'])
+            other_files = len(tag_stats[other_tag]['files'])
+            min_files = min(tag_files, other_files)
+
+            overlap_ratio = shared / min_files if min_files > 0 else 0
+
+            if overlap_ratio >= min_overlap_ratio:
+                acronym_candidates.append({
+                    'acronym': tag,
+                    'expansion': other_tag,
+                    'overlap_ratio': overlap_ratio,
+                    'shared_files': shared,
+                    'acronym_count': tag_stats[tag]['count'],
+                    'expansion_count': tag_stats[other_tag]['count'],
+                    'suggestion': f"merge {tag} → {other_tag} (acronym expansion)"
+                })
 
     return sorted(acronym_candidates, key=lambda x: x['overlap_ratio'], reverse=True)
 
@@ -269,46 +269,45 @@ def detect_synonyms_by_semantics(
 
     synonym_candidates = []
 
-    # Find high-similarity pairs
-    for i, tag1 in enumerate(tags):
-        for j in range(i + 1, len(tags)):
-            tag2 = tags[j]
-            similarity = similarity_matrix[i][j]
-
-            if similarity < similarity_threshold:
-                continue
-
-            # Calculate co-occurrence ratio
-            shared_files = len(tag_stats[tag1]['files'] & tag_stats[tag2]['files'])
-            min_files = min(len(tag_stats[tag1]['files']), len(tag_stats[tag2]['files']))
-            co_occurrence_ratio = shared_files / min_files if min_files > 0 else 0
-
-            # True synonyms should NOT co-occur much (they're alternatives)
-            # But allow some co-occurrence for transitional periods
-            if co_occurrence_ratio > max_co_occurrence_ratio:
-                continue
+    # Find high-similarity pairs, visiting only the ones above the threshold
+    # (row by row, in the same order as a scan of every pair)
+    rows, cols = np.nonzero(np.triu(similarity_matrix >= similarity_threshold, k=1))
+    for i, j in zip(rows.tolist(), cols.tolist(), strict=True):
+        tag1 = tags[i]
+        tag2 = tags[j]
+        similarity = similarity_matrix[i, j]
+
+        # Calculate co-occurrence ratio
+        shared_files = len(tag_stats[tag1]['files'] & tag_stats[tag2]['files'])
+        min_files = min(len(tag_stats[tag1]['files']), len(tag_stats[tag2]['files']))
+        co_occurrence_ratio = shared_files / min_files if min_files > 0 else 0
+
+        # True synonyms should NOT co-occur much (they're alternatives)
+        # But allow some co-occurrence for transitional periods
+        if co_occurrence_ratio > max_co_occurrence_ratio:
+            continue
 
-            # Suggest merging into the more commonly used tag
-            if tag_stats[tag1]['count'] > tag_stats[tag2]['count']:
-                suggestion = f"merge {tag2} → {tag1}"
-                target = tag1
-                source = tag2
-            else:
-                suggestion = f"merge {tag1} → {tag2}"
-                target = tag2
-                source = tag1
-
-            synonym_candidates.append({
-                'tag1': tag1,
-                'tag2': tag2,
-                'target': target,
-                'source': source,
-                'semantic_similarity': float(similarity),
-                'co_occurrence_ratio': co_occurrence_ratio,
-                'shared_files': shared_files,
-                'suggestion': suggestion,
-                'tag1_count': tag_stats[tag1]['count'],
-                'tag2_count': tag_stats[tag2]['count']
-            })
+        # Suggest merging into the more commonly used tag
+        if tag_stats[tag1]['count'] > tag_stats[tag2]['count']:
+            suggestion = f"merge {tag2} → {tag1}"
+            target = tag1
+            source = tag2
+        else:
+            suggestion = f"merge {tag1} → {tag2}"
+            target = tag2
+            source = tag1
+
+        synonym_candidates.append({
+            'tag1': tag1,
+            'tag2': tag2,
+            'target': target,
+            'source': source,
+            'semantic_similarity': float(similarity),
+            'co_occurrence_ratio': co_occurrence_ratio,
+            'shared_files': shared_files,
+            'suggestion': suggestion,
+            'tag1_count': tag_stats[tag1]['count'],
+            'tag2_count': tag_stats[tag2]['count']
+        })
 
     return sorted(synonym_candidates, key=lambda x: x['semantic_similarity'], reverse=True)
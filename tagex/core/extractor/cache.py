@@ -0,0 +1,82 @@
+"""
+Per-file extraction cache so repeated runs skip re-parsing unchanged files.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached entry layout or tag extraction semantics change
+CACHE_VERSION = 3
+
+# relative path -> (mtime_ns, size, tags)
+CacheEntries = Dict[str, Tuple[int, int, List[str]]]
+
+
+def cache_file_name(vault_path: str, tag_types: str, filter_tags: bool) -> str:
+    """
+    Build the cache file name for a vault and extraction settings.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+        tag_types: Which tag types are extracted ('both', 'frontmatter', 'inline')
+        filter_tags: Whether invalid tags are filtered
+
+    Returns:
+        File name unique to the resolved vault path and settings
+    """
+    key = f"{Path(vault_path).resolve()}|{tag_types}|{filter_tags}|{CACHE_VERSION}"
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+    return f"extract_{digest}.json.gz"
+
+
+def load_cache(cache_path: Path) -> CacheEntries:
+    """
+    Load cached per-file tags.
+
+    Args:
+        cache_path: Path to the cache file
+
+    Returns:
+        Cached entries, or an empty dict if the cache is missing or unreadable
+    """
+    try:
+        with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable extraction cache {cache_path}: {e}")
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+
+    # Interned as the parsers do, so cached and freshly parsed tags share strings
+    return {
+        rel_path: (entry[0], entry[1], [sys.intern(tag) for tag in entry[2]])
+        for rel_path, entry in data.get("files", {}).items()
+    }
+
+
+def save_cache(cache_path: Path, entries: CacheEntries) -> None:
+    """
+    Write per-file tags to the cache. Failures are logged and ignored.
+
+    Args:
+        cache_path: Path to the cache file
+        entries: Entries to persist
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+            json.dump({"version": CACHE_VERSION, "files": entries}, f, ensure_ascii=False)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write extraction cache {cache_path}: {e}")
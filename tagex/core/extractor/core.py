@@ -2,23 +2,30 @@
 Core tag extraction pipeline.
 """
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import logging
+import os
 
 from ...utils.file_discovery import find_markdown_files, get_relative_path
 from ..parsers.frontmatter_parser import extract_frontmatter, extract_tags_from_frontmatter
 from ..parsers.inline_parser import extract_inline_tags
 from ...utils.tag_normalizer import normalize_tags, deduplicate_tags, filter_valid_tags
+from .cache import CacheEntries, cache_file_name, load_cache, save_cache
 
 
 logger = logging.getLogger(__name__)
 
+# Below this many files to parse, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 200
+
 
 class TagExtractor:
     """Main tag extraction engine."""
     
-    def __init__(self, vault_path: str, exclude_patterns: Optional[Set[str]] = None, filter_tags: bool = True, tag_types: str = 'both'):
+    def __init__(self, vault_path: str, exclude_patterns: Optional[Set[str]] = None, filter_tags: bool = True, tag_types: str = 'both', cache_dir: Optional[Path] = None, jobs: int = 1):
         """
         Initialize the tag extractor.
 
@@ -27,13 +34,18 @@ class TagExtractor:
             exclude_patterns: Additional patterns to exclude from scanning (merged with config)
             filter_tags: Whether to filter out invalid tags (default: True)
             tag_types: Which tag types to extract ('both', 'frontmatter', 'inline')
+            cache_dir: Directory for the per-file extraction cache (default: no caching)
+            jobs: Worker processes for parsing large vaults (0 = all cores, default: 1)
         """
         self.vault_path = Path(vault_path)
         self.exclude_patterns = exclude_patterns  # Will be merged with config in find_markdown_files
         self.filter_tags = filter_tags
         self.tag_types = tag_types
+        self.cache_path = Path(cache_dir) / cache_file_name(vault_path, tag_types, filter_tags) if cache_dir else None
+        self.jobs = jobs
         self.file_count = 0
         self.error_count = 0
+        self.tagged_file_count = 0
         
     def extract_tags(self) -> Dict[str, Dict]:
         """
@@ -48,33 +60,104 @@ class TagExtractor:
         markdown_files = find_markdown_files(str(self.vault_path), self.exclude_patterns)
         logger.info(f"Found {len(markdown_files)} markdown files")
         
-        # Process each file
-        tag_data: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "files": set()})
-        
+        # Files whose mtime and size are unchanged reuse their cached tags
+        cached = load_cache(self.cache_path) if self.cache_path else {}
+        fresh_cache: CacheEntries = {}
+
+        entries = []
         for file_path in markdown_files:
-            try:
-                file_tags = self._process_file(file_path)
-                if file_tags:
-                    relative_path = get_relative_path(file_path, self.vault_path)
-                    for tag in file_tags:
-                        tag_data[tag]["count"] += 1
-                        tag_data[tag]["files"].add(relative_path)
-                self.file_count += 1
-
-            except (UnicodeDecodeError, IOError, OSError, ValueError) as e:
-                logger.error(f"Error processing file {file_path}: {e}")
-                self.error_count += 1
-                continue
-            except Exception as e:
-                logger.exception(f"Unexpected error processing {file_path}")
-                self.error_count += 1
-                continue
-        
+            relative_path = get_relative_path(file_path, self.vault_path)
+            stat = None
+            file_tags = None
+            if self.cache_path:
+                try:
+                    stat = file_path.stat()
+                except OSError as e:
+                    logger.error(f"Error processing file {file_path}: {e}")
+                    self.error_count += 1
+                    continue
+                entry = cached.get(relative_path)
+                if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    file_tags = entry[2]
+            entries.append((file_path, relative_path, stat, file_tags))
+
+        # Parse everything that wasn't served from the cache
+        to_parse = [file_path for file_path, _, _, file_tags in entries if file_tags is None]
+        parsed = dict(zip(to_parse, self._parse_files(to_parse), strict=True))
+
+        # Aggregate in file order so tag insertion order stays deterministic
+        tag_data: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "files": set()})
+
+        for file_path, relative_path, stat, file_tags in entries:
+            if file_tags is None:
+                file_tags, failed = parsed[file_path]
+                if failed:
+                    self.error_count += 1
+                    continue
+            if stat is not None:
+                fresh_cache[relative_path] = (stat.st_mtime_ns, stat.st_size, file_tags)
+
+            if file_tags:
+                self.tagged_file_count += 1
+                for tag in file_tags:
+                    tag_data[tag]["count"] += 1
+                    tag_data[tag]["files"].add(relative_path)
+            self.file_count += 1
+
+        if self.cache_path:
+            save_cache(self.cache_path, fresh_cache)
+
         logger.info(f"Processed {self.file_count} files, {self.error_count} errors")
         logger.info(f"Found {len(tag_data)} unique tags")
         
         return dict(tag_data)
     
+    def _worker_count(self, file_total: int) -> int:
+        """Number of worker processes to use for parsing file_total files."""
+        if file_total < PARALLEL_MIN_FILES:
+            return 1
+        jobs = self.jobs or os.cpu_count() or 1
+        return max(1, min(jobs, file_total))
+
+    def _parse_files(self, file_paths: List[Path]) -> List[Tuple[List[str], bool]]:
+        """
+        Parse files, in a process pool when there are enough of them.
+
+        Args:
+            file_paths: Markdown files to parse
+
+        Returns:
+            (tags, failed) for each file, in input order
+        """
+        workers = self._worker_count(len(file_paths))
+        if workers > 1:
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(self._process_file_safely, file_paths, chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel parsing unavailable, falling back to serial: {e}")
+
+        return [self._process_file_safely(file_path) for file_path in file_paths]
+
+    def _process_file_safely(self, file_path: Path) -> Tuple[List[str], bool]:
+        """
+        Process a file, logging instead of raising on errors.
+
+        Args:
+            file_path: Path to the markdown file
+
+        Returns:
+            Tuple of (normalized tags, whether processing failed)
+        """
+        try:
+            return self._process_file(file_path), False
+        except (UnicodeDecodeError, IOError, OSError, ValueError) as e:
+            logger.error(f"Error processing file {file_path}: {e}")
+        except Exception:
+            logger.exception(f"Unexpected error processing {file_path}")
+        return [], True
+
     def _process_file(self, file_path: Path) -> List[str]:
         """
         Process a single markdown file to extract tags.
@@ -85,14 +168,16 @@ class TagExtractor:
         Returns:
             List of normalized tags from the file
         """
+        # Read the file in a single call and decode in memory, so the
+        # latin-1 fallback doesn't need to reopen and re-read the file
+        raw = file_path.read_bytes()
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = raw.decode('utf-8')
         except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
+            content = raw.decode('latin-1')
+        if '\r' in content:
+            # Match text-mode universal newline handling
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         # Extract frontmatter and remaining content
         frontmatter, markdown_content = extract_frontmatter(content)
@@ -128,5 +213,6 @@ class TagExtractor:
         return {
             "files_processed": self.file_count,
             "errors": self.error_count,
+            "tagged_file_count": self.tagged_file_count,
             "vault_path": str(self.vault_path)
         }
\ No newline at end of file
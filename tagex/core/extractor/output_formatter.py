@@ -3,7 +3,7 @@ Output formatting utilities for tag extraction results.
 """
 import json
 import csv
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 from pathlib import Path
 
 
@@ -33,6 +33,23 @@ def format_as_plugin_json(tag_data: Dict[str, Dict]) -> List[Dict[str, Any]]:
     return formatted_tags
 
 
+def iter_csv_rows(tag_data: Dict[str, Dict]) -> Iterator[List[str]]:
+    """
+    Yield tag data as CSV rows, header first, without building the full row list.
+    
+    Args:
+        tag_data: Tag data from extractor
+        
+    Yields:
+        CSV rows sorted by count (descending) then by tag name
+    """
+    yield ["tag", "count", "files"]
+    
+    # Sort by count (descending) then by tag name
+    for tag_name, data in sorted(tag_data.items(), key=lambda x: (-x[1]["count"], x[0])):
+        yield [tag_name, str(data["count"]), "; ".join(sorted(data["files"]))]
+
+
 def format_as_csv(tag_data: Dict[str, Dict]) -> List[List[str]]:
     """
     Format tag data as CSV rows.
@@ -43,16 +60,7 @@ def format_as_csv(tag_data: Dict[str, Dict]) -> List[List[str]]:
     Returns:
         List of CSV rows (including header)
     """
-    rows = [["tag", "count", "files"]]
-    
-    for tag_name, data in tag_data.items():
-        files_str = "; ".join(sorted(list(data["files"])))
-        rows.append([tag_name, str(data["count"]), files_str])
-    
-    # Sort by count (descending) then by tag name
-    rows[1:] = sorted(rows[1:], key=lambda x: (-int(x[1]), x[0]))
-    
-    return rows
+    return list(iter_csv_rows(tag_data))
 
 
 def format_as_text(tag_data: Dict[str, Dict]) -> str:
@@ -10,10 +10,9 @@ This operation adds specified tags to notes, handling:
 
 from pathlib import Path
 from typing import List, Dict, Any
-import re
 import yaml
 
-from .tag_operations import TagOperationEngine
+from .tag_operations import FRONTMATTER_RE, TagOperationEngine
 from ..parsers.frontmatter_parser import extract_frontmatter, extract_tags_from_frontmatter
 
 
@@ -26,7 +25,8 @@ class AddTagsOperation(TagOperationEngine):
         file_tag_map: Dict[str, List[str]],
         dry_run: bool = False,
         tag_types: str = 'frontmatter',
-        quiet: bool = False
+        quiet: bool = False,
+        jobs: int = 1
     ):
         """
         Initialize add tags operation.
@@ -37,8 +37,9 @@ class AddTagsOperation(TagOperationEngine):
             dry_run: If True, preview changes without modifying files
             tag_types: Tag types to process (only 'frontmatter' supported for adding)
             quiet: If True, suppress progress output
+            jobs: Worker processes for large vaults (0 = all cores, default: 1)
         """
-        super().__init__(vault_path, dry_run, tag_types, quiet)
+        super().__init__(vault_path, dry_run, tag_types, quiet, jobs)
         self.file_tag_map = file_tag_map
         self.operation_log.update({
             "operation_type": "add_tags",
@@ -129,7 +130,7 @@ class AddTagsOperation(TagOperationEngine):
             Content with updated frontmatter
         """
         # Extract frontmatter section
-        frontmatter_match = re.match(r'^---\s*\n(.*?)\n---(\s*\n)', content, re.DOTALL)
+        frontmatter_match = FRONTMATTER_RE.match(content)
         if not frontmatter_match:
             # Shouldn't happen since we already parsed frontmatter
             return self._create_frontmatter(content, new_tags)
@@ -1,18 +1,30 @@
 """Fix duplicate 'tags:' fields in markdown frontmatter."""
 
+import codecs
+import os
 import shutil
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from datetime import datetime
 
+from .tag_operations import PARALLEL_MIN_FILES
+from ...utils.file_discovery import iter_files_with_suffix
+
+# Console lines collected before one write while fixing a file list
+ECHO_BATCH_SIZE = 64
+# Bytes read first to rule a file out before reading the rest of it
+HEAD_SIZE = 4096
+
 
 class DuplicateTagsFixer:
   """Fix duplicate tags: fields in markdown frontmatter."""
 
-  def __init__(self, dry_run: bool = True, quiet: bool = False):
+  def __init__(self, dry_run: bool = True, quiet: bool = False, jobs: int = 1):
     self.dry_run = dry_run
     self.quiet = quiet
+    self.jobs = jobs  # Worker threads for large file lists; 0 = automatic
     self.stats = {
       'total_files': 0,
       'files_with_duplicates': 0,
@@ -21,6 +33,8 @@ class DuplicateTagsFixer:
       'errors': 0
     }
     self.log_entries = []
+    self._echo: Callable[[str], None] = print
+    self._echo_buffer: List[str] = []
 
   def log(self, message: str, level: str = "INFO"):
     """Log a message with timestamp."""
@@ -28,7 +42,28 @@ class DuplicateTagsFixer:
     entry = f"[{timestamp}] {level}: {message}"
     self.log_entries.append(entry)
     if not self.quiet or level == "ERROR":
-      print(entry)
+      self._echo(entry)
+
+  @staticmethod
+  def head_rules_out_duplicates(head: bytes) -> bool:
+    """
+    Check whether the start of a file proves find_duplicate_tags would find nothing.
+
+    True when the file doesn't open with a '---' line, or when the whole
+    frontmatter fits in head and has fewer than two 'tags:'. A frontmatter
+    running past head is never ruled out. Any line ending counts, since
+    the content is checked after newlines are normalised.
+    """
+    if head[:4] not in (b'---\n', b'---\r'):
+      return True
+    closing = head.find(b'---\n', 4)
+    closing_cr = head.find(b'---\r', 4, None if closing == -1 else closing)
+    if closing_cr != -1:
+      closing = closing_cr
+    if closing == -1:
+      # No closing line means no frontmatter, unless the file goes on past head
+      return len(head) < HEAD_SIZE
+    return head.count(b'tags:', 0, closing) < 2
 
   def find_duplicate_tags(self, content: str) -> Tuple[bool, Optional[str]]:
     """
@@ -41,12 +76,18 @@ class DuplicateTagsFixer:
     if not content.startswith('---\n'):
       return False, None
 
-    parts = content.split('---\n', 2)
-    if len(parts) < 3:
+    end = content.find('---\n', 4)
+    if end == -1:
+      return False, None
+
+    frontmatter = content[4:end]
+
+    # A duplicate needs 'tags:' at least twice; most files have it once or
+    # not at all, so skip splitting lines and copying the body for them
+    if frontmatter.count('tags:') < 2:
       return False, None
 
-    frontmatter = parts[1]
-    body = parts[2]
+    body = content[end + 4:]
 
     # Find all lines that start with 'tags:'
     lines = frontmatter.split('\n')
@@ -55,11 +96,11 @@ class DuplicateTagsFixer:
 
     for i, line in enumerate(lines):
       # Match 'tags:' at start of line (may have leading whitespace)
-      if re.match(r'^\s*tags:\s*', line):
+      stripped = line.lstrip()
+      if stripped.startswith('tags:'):
         tag_line_indices.append(i)
         # Extract what comes after 'tags:'
-        match = re.match(r'^\s*tags:\s*(.*)', line)
-        tag_line_values.append(match.group(1).strip() if match else '')
+        tag_line_values.append(stripped[5:].strip())
 
     # If no duplicates, nothing to fix
     if len(tag_line_indices) <= 1:
@@ -117,6 +158,43 @@ class DuplicateTagsFixer:
 
     return True, new_content
 
+  def create_backup(self, file_path: Path, backup_path: Path, hardlink: bool = True):
+    """
+    Snapshot a file before modifying it.
+
+    Hardlinks the original instead of copying its bytes. The fixed content
+    is then written to a new inode (see replace_file_content), so the
+    backup keeps the original. Copies instead when hardlink is False, or
+    where linking isn't supported (e.g. some network or FAT filesystems).
+    """
+    backup_path.unlink(missing_ok=True)
+    if hardlink:
+      try:
+        os.link(file_path, backup_path)
+        return
+      except OSError:
+        pass
+    shutil.copy2(file_path, backup_path)
+
+  def replace_file_content(self, file_path: Path, content: str, in_place: bool = False):
+    """
+    Write content to a temporary file and swap it in, leaving the old inode untouched.
+
+    With in_place, the file is overwritten directly instead, so every hard
+    link to it sees the new content.
+    """
+    if in_place:
+      file_path.write_text(content, encoding='utf-8')
+      return
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+      tmp_path.write_text(content, encoding='utf-8')
+      shutil.copymode(file_path, tmp_path)
+      os.replace(tmp_path, file_path)
+    except BaseException:
+      tmp_path.unlink(missing_ok=True)
+      raise
+
   def fix_file(self, file_path: Path) -> bool:
     """
     Fix duplicate tags in a single file.
@@ -129,12 +207,29 @@ class DuplicateTagsFixer:
     try:
       # Read file
       self.log(f"\nProcessing: {file_path.name}")
-      content = file_path.read_text(encoding='utf-8')
+      # Most notes can be ruled out from their first page; only read the
+      # rest of a file that may need fixing
+      with open(file_path, 'rb') as fh:
+        raw = fh.read(HEAD_SIZE)
+        if self.head_rules_out_duplicates(raw):
+          # Still report a head that isn't UTF-8; a character may straddle its end
+          if not raw.isascii():
+            codecs.getincrementaldecoder('utf-8')().decode(raw, final=len(raw) < HEAD_SIZE)
+          self.log("  No duplicate tags found")
+          self.stats['files_skipped'] += 1
+          return False
+        if len(raw) == HEAD_SIZE:
+          raw += fh.read()
+
+      # Decode once, then match text-mode newline handling
+      content = raw.decode('utf-8')
+      if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
       # Check for duplicates and get fixed content
       has_duplicates, fixed_content = self.find_duplicate_tags(content)
 
-      if not has_duplicates:
+      if not has_duplicates or fixed_content is None:
         self.log("  No duplicate tags found")
         self.stats['files_skipped'] += 1
         return False
@@ -145,26 +240,29 @@ class DuplicateTagsFixer:
         self.log("  [DRY-RUN] Would fix this file", "DRYRUN")
         return False
 
+      # Validate the fix before touching the file; the write is exactly
+      # fixed_content, so reading it back would only parse the same text
+      still_has_dupes, _ = self.find_duplicate_tags(fixed_content)
+
+      if still_has_dupes:
+        self.log(f"  ERROR: Fix failed validation, file left unchanged", "ERROR")
+        self.stats['errors'] += 1
+        return False
+
+      # Write through symlinks to the real note; one with other hard links is
+      # rewritten in place so they keep sharing it, which needs a copied backup
+      real_path = Path(os.path.realpath(file_path))
+      in_place = real_path.stat().st_nlink > 1
+
       # Create backup
-      backup_path = file_path.with_suffix(file_path.suffix + '.bak')
-      shutil.copy2(file_path, backup_path)
+      backup_path = file_path.with_name(file_path.name + '.bak')
+      self.create_backup(real_path, backup_path, hardlink=not in_place)
       self.log(f"  Created backup: {backup_path.name}")
 
       # Write fixed content
-      file_path.write_text(fixed_content, encoding='utf-8')
+      self.replace_file_content(real_path, fixed_content, in_place=in_place)
       self.log(f"  ✓ Fixed duplicate tags", "SUCCESS")
 
-      # Validate the fix
-      new_content = file_path.read_text(encoding='utf-8')
-      still_has_dupes, _ = self.find_duplicate_tags(new_content)
-
-      if still_has_dupes:
-        # Restore from backup
-        shutil.copy2(backup_path, file_path)
-        self.log(f"  ERROR: Fix failed validation, restored from backup", "ERROR")
-        self.stats['errors'] += 1
-        return False
-
       self.stats['files_fixed'] += 1
       return True
 
@@ -175,26 +273,91 @@ class DuplicateTagsFixer:
 
   def fix_files(self, file_paths: List[Path]):
     """Fix multiple files."""
-    self.log(f"\n{'='*70}")
-    self.log(f"Starting duplicate tags fix")
-    self.log(f"Mode: {'DRY-RUN (no changes will be made)' if self.dry_run else 'LIVE (files will be modified)'}")
-    self.log(f"Files to process: {len(file_paths)}")
-    self.log(f"{'='*70}\n")
+    # A print per line makes console output the bulk of a verbose run;
+    # batch the lines into a few writes and flush them however the run ends
+    echo = self._echo
+    if echo is print:
+      self._echo = self._buffered_echo
+    try:
+      self.log(f"\n{'='*70}")
+      self.log(f"Starting duplicate tags fix")
+      self.log(f"Mode: {'DRY-RUN (no changes will be made)' if self.dry_run else 'LIVE (files will be modified)'}")
+      self.log(f"Files to process: {len(file_paths)}")
+      self.log(f"{'='*70}\n")
+
+      self._fix_all(file_paths)
+      self.print_summary()
+    finally:
+      self._flush_echo()
+      self._echo = echo
+
+  def _fix_all(self, file_paths: List[Path]):
+    """Fix every path, with worker threads when the list is large enough."""
+    workers = self._worker_count(len(file_paths))
+    if workers == 1:
+      for file_path in file_paths:
+        self.fix_path(file_path)
+    else:
+      # Reads and writes release the GIL, so threads overlap the file I/O.
+      # Each run of files logs into its own fixer; merging in input order keeps the
+      # log and console output identical to a serial run
+      with ThreadPoolExecutor(max_workers=workers) as executor:
+        chunk_size = max(1, len(file_paths) // (workers * 4))
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        for log_entries, echoed, stats in executor.map(self._fix_paths_isolated, chunks):
+          self.log_entries.extend(log_entries)
+          for entry in echoed:
+            self._echo(entry)
+          for key, count in stats.items():
+            self.stats[key] += count
+
+  def _buffered_echo(self, entry: str):
+    """Queue a console line, writing the queue out once it reaches ECHO_BATCH_SIZE."""
+    self._echo_buffer.append(entry + '\n')
+    if len(self._echo_buffer) >= ECHO_BATCH_SIZE:
+      self._flush_echo()
+
+  def _flush_echo(self):
+    """Write out queued console lines."""
+    if self._echo_buffer:
+      sys.stdout.write(''.join(self._echo_buffer))
+      sys.stdout.flush()
+      self._echo_buffer.clear()
+
+  def fix_path(self, file_path: Path) -> bool:
+    """Fix one entry of a file list, logging an error if it is missing or not a file."""
+    if not file_path.exists():
+      self.log(f"File not found: {file_path}", "ERROR")
+      self.stats['errors'] += 1
+      return False
 
-    for file_path in file_paths:
-      if not file_path.exists():
-        self.log(f"File not found: {file_path}", "ERROR")
-        self.stats['errors'] += 1
-        continue
+    if not file_path.is_file():
+      self.log(f"Not a file: {file_path}", "ERROR")
+      self.stats['errors'] += 1
+      return False
 
-      if not file_path.is_file():
-        self.log(f"Not a file: {file_path}", "ERROR")
-        self.stats['errors'] += 1
-        continue
+    return self.fix_file(file_path)
 
-      self.fix_file(file_path)
+  def _worker_count(self, file_total: int) -> int:
+    """Number of threads to use for fixing file_total files."""
+    if file_total < PARALLEL_MIN_FILES:
+      return 1
+    # Same automatic size as ThreadPoolExecutor: the work is mostly waiting on disk
+    return self.jobs or min(32, (os.cpu_count() or 1) + 4)
 
-    self.print_summary()
+  def _fix_paths_isolated(self, file_paths: List[Path]) -> Tuple[List[str], List[str], Dict[str, int]]:
+    """
+    Fix a run of files on a private fixer so worker threads share no state.
+
+    Returns:
+      (log entries, entries to print, stats counts) for fix_files to merge
+    """
+    fixer = DuplicateTagsFixer(dry_run=self.dry_run, quiet=self.quiet)
+    echoed: List[str] = []
+    fixer._echo = echoed.append
+    for file_path in file_paths:
+      fixer.fix_path(file_path)
+    return fixer.log_entries, echoed, fixer.stats
 
   def print_summary(self):
     """Print summary statistics."""
@@ -222,7 +385,8 @@ class DuplicateTagsFixer:
 
 def run_operation(vault_path: str, filelist: Optional[str] = None,
                  execute: bool = False, recursive: bool = True,
-                 quiet: bool = False, log_file: Optional[str] = None) -> dict:
+                 quiet: bool = False, log_file: Optional[str] = None,
+                 jobs: int = 1) -> dict:
   """
   Run duplicate tags fix operation.
 
@@ -233,6 +397,7 @@ def run_operation(vault_path: str, filelist: Optional[str] = None,
     recursive: Search subdirectories
     quiet: Reduce output verbosity
     log_file: Optional path to save log
+    jobs: Worker threads for large file lists (0 = automatic)
 
   Returns:
     Statistics dictionary with results
@@ -240,15 +405,11 @@ def run_operation(vault_path: str, filelist: Optional[str] = None,
   vault = Path(vault_path)
 
   # Collect files to process
-  files_to_process = []
+  files_to_process: List[Path] = []
 
   if vault.is_dir():
     # Find all .md files
-    if recursive:
-      md_files = list(vault.rglob("**/*.md"))
-    else:
-      md_files = list(vault.glob("*.md"))
-    files_to_process.extend(md_files)
+    files_to_process.extend(iter_files_with_suffix(vault, '.md', recursive=recursive))
   elif vault.is_file():
     # Single file
     files_to_process.append(vault)
@@ -275,11 +436,11 @@ def run_operation(vault_path: str, filelist: Optional[str] = None,
       if file_path.exists():
         files_to_process.append(file_path)
 
-  # Remove duplicates
-  files_to_process = list(set(files_to_process))
+  # Remove duplicates, keeping discovery order so runs are repeatable
+  files_to_process = list(dict.fromkeys(files_to_process))
 
   # Create fixer and run
-  fixer = DuplicateTagsFixer(dry_run=not execute, quiet=quiet)
+  fixer = DuplicateTagsFixer(dry_run=not execute, quiet=quiet, jobs=jobs)
   fixer.fix_files(files_to_process)
 
   # Save log if requested
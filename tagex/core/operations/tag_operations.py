@@ -3,20 +3,118 @@
 Tag operation engine for modifying tags across Obsidian vaults.
 Provides base functionality for rename, merge, and delete operations.
 """
+import functools
+import io
 import json
+import logging
+import multiprocessing
 import os
 import re
 import shutil
+import sys
 import hashlib
 import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set, Tuple, Optional, Any
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from ..parsers.frontmatter_parser import extract_frontmatter, extract_tags_from_frontmatter
+from ..parsers.frontmatter_parser import (
+    FRONTMATTER_RE as FRONTMATTER_BLOCK_RE, FrontmatterLoader, extract_tags_from_frontmatter
+)
 from ..parsers.inline_parser import extract_inline_tags
 
+# Optional faster non-cryptographic hash for change logs
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for the many-tag pre-filter
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+# Directory listings are I/O bound; threads mostly help on network-mounted vaults
+SCAN_MAX_THREADS = 8
+
+# Compiled once at import; these run for every file in every operation
+# Frontmatter with the spacing after its closing --- captured, for tag addition
+FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---(\s*\n)', re.DOTALL)
+# One match per frontmatter line: a tags/tag key, a "- item" array entry, or any other line
+YAML_LINE_RE = re.compile(
+    r'^(?P<indent>[ \t]*)(?:(?P<key>tags?):(?P<value>.*)|- (?P<item>.*)|(?P<other>.*))$',
+    re.MULTILINE
+)
+YAML_TAG_KEY_RE = re.compile(r'^[ \t]*tags?:', re.MULTILINE)
+# Fenced blocks are set aside over the whole body first, so a stray backtick can't pair with a fence
+FENCED_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+# Inline code spans; matched ahead of tags so code is copied through untouched
+CODE_SPAN_PATTERN = r'`[^`]*`'
+# Same pattern as the proven inline parser
+INLINE_TAG_RE = re.compile(r'(?:^|(?<=\s))#([a-zA-Z0-9][a-zA-Z0-9_\-\/]*)')
+INLINE_TAG_NAME_RE = re.compile(r'[a-zA-Z0-9][a-zA-Z0-9_\-\/]*')
+# Code spans and inline tags in one scan; group 1 is None for code spans
+INLINE_SCAN_RE = re.compile(rf'(?:{CODE_SPAN_PATTERN})|{INLINE_TAG_RE.pattern}', re.DOTALL)
+
+# Above this many target tags, one union regex beats repeated substring scans
+PREFILTER_REGEX_MIN_NEEDLES = 8
+
+
+# Tag occurrences repeat heavily within and across files; folding case and
+# whitespace once per distinct tag string skips two allocations per repeat
+@functools.lru_cache(maxsize=4096)
+def _normalize_tag_key(tag: str) -> str:
+    """Case- and whitespace-insensitive key used to match tags against operation targets."""
+    return tag.lower().strip()
+
+
+# Keyed by the YAML text rather than the file: `tag apply` runs operations one
+# after another over the same unchanged files, and notes created from a
+# template share their frontmatter, so each distinct block is parsed once
+@functools.lru_cache(maxsize=2048)
+def _load_frontmatter_tags(yaml_text: str) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+    """Parse a frontmatter block into (is_valid_yaml, tags); tags is None for empty frontmatter.
+
+    Only the tags are kept, as an immutable tuple, so cached results can't be
+    changed by the caller that received them.
+    """
+    try:
+        frontmatter = yaml.load(yaml_text, Loader=FrontmatterLoader)  # noqa: S506 - a SafeLoader
+    except yaml.YAMLError:
+        return False, None
+    if not frontmatter:
+        return True, None
+    return True, tuple(extract_tags_from_frontmatter(frontmatter))
+
+
+def _parse_frontmatter_tags(content: str) -> Tuple[Optional[re.Match], Optional[Tuple[str, ...]], str]:
+    """Locate the frontmatter and return (match, tags, remaining_content).
+
+    Follows extract_frontmatter: tags is None when there is no usable
+    frontmatter, and remaining_content is the whole file when the YAML is
+    malformed. The match is kept either way so the file can be rewritten
+    around it.
+    """
+    match = FRONTMATTER_BLOCK_RE.match(content)
+    if not match:
+        return None, None, content
+    is_valid_yaml, tags = _load_frontmatter_tags(match.group(1))
+    if not is_valid_yaml:
+        return match, None, content
+    return match, tags, content[match.end():]
+
 
 class TagOperationEngine(ABC):
     """Base class for all tag operations with backup, logging, and reversibility.
@@ -26,17 +124,35 @@ class TagOperationEngine(ABC):
     safe-by-default behavior for all tag modification operations.
     """
 
-    def __init__(self, vault_path: str, dry_run: bool = False, tag_types: str = 'both', quiet: bool = False):
+    # Per-instance counters (besides operation_log) that workers must report back
+    PARALLEL_COUNTERS: Tuple[str, ...] = ()
+
+    def __init__(self, vault_path: str, dry_run: bool = False, tag_types: str = 'both', quiet: bool = False, jobs: int = 1):
         self.vault_path = Path(vault_path)
         self.dry_run = dry_run
         self.tag_types = tag_types
         self.quiet = quiet
+        self.jobs = jobs
+        # Target-tag pre-filters; None means "can't rule anything out"
+        self._needles: Optional[Tuple[str, ...]] = None
+        self._needle_re: Optional[re.Pattern[str]] = None
+        self._needle_automaton: Optional[Any] = None
+        self._byte_needles: Tuple[bytes, ...] = ()
+        self._byte_needle_re: Optional[re.Pattern[bytes]] = None
+        # Literal inline rewrite set up by _set_inline_rewrite; None means use _transform_one_tag
+        self._inline_target_re: Optional[re.Pattern[str]] = None
+        self._inline_target_scan_re: Optional[re.Pattern[str]] = None
+        self._inline_replacement = ''
+        self._inline_replacement_template = ''
+        # Read the clock once so the log's timestamp and its file name agree
+        self.started_at = datetime.now()
         self.operation_log: Dict[str, Any] = {
             "operation": self.__class__.__name__.lower(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self.started_at.isoformat(),
             "vault_path": str(self.vault_path),
             "dry_run": self.dry_run,
             "tag_types": self.tag_types,
+            "hash_algorithm": "xxh3_64" if XXHASH_AVAILABLE else "blake2b-64",
             "changes": [],
             "stats": {
                 "files_processed": 0,
@@ -47,31 +163,39 @@ class TagOperationEngine(ABC):
         }
     
     
-    def calculate_file_hash(self, content: str) -> str:
-        """Calculate hash of file content for integrity checking."""
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+    def calculate_file_hash(self, data: bytes) -> str:
+        """Calculate a 64-bit hash of raw file bytes for integrity checking (see operation_log["hash_algorithm"])."""
+        if XXHASH_AVAILABLE:
+            return str(xxhash.xxh3_64_hexdigest(data))
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
     
     def process_file_tags(self, file_path: Path) -> bool:
         """Process tags in a single file. Returns True if file was modified."""
+        relative_path = str(file_path.relative_to(self.vault_path))
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-            
-            before_hash = self.calculate_file_hash(original_content)
-            relative_path = str(file_path.relative_to(self.vault_path))
+            # Read raw bytes once: pre-filter and hash them directly, decode only for the tag work
+            raw_content = file_path.read_bytes()
+            if not self.raw_may_contain_target_tags(raw_content):
+                # Nothing to change; only ASCII files are ruled out, and ASCII is valid UTF-8
+                return False
+            original_content = raw_content.decode('utf-8')
+            if '\r' in original_content:
+                # Match text-mode universal newline handling
+                original_content = original_content.replace('\r\n', '\n').replace('\r', '\n')
             
             # Apply tag transformations
             modified_content = self.transform_tags(original_content, relative_path)
             
             # Check if content changed
             if modified_content != original_content:
-                after_hash = self.calculate_file_hash(modified_content)
+                # Only changed files are logged, so only they need hashing
+                modified_bytes = modified_content.encode('utf-8')
+                before_hash = self.calculate_file_hash(raw_content)
+                after_hash = self.calculate_file_hash(modified_bytes)
                 
                 # Write back if not dry run
                 if not self.dry_run:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(modified_content)
+                    self.replace_file_bytes(file_path, modified_bytes)
                 
                 # Log the change
                 self.operation_log["changes"].append({
@@ -93,7 +217,7 @@ class TagOperationEngine(ABC):
                 "error": str(e)
             })
             if not self.quiet:
-                print(f"Error processing {file_path}: {e}")
+                logger.error(f"Error processing {file_path}: {e}")
             return False
         except Exception as e:
             self.operation_log["stats"]["errors"] += 1
@@ -101,13 +225,30 @@ class TagOperationEngine(ABC):
                 "file": relative_path,
                 "error": str(e)
             })
-            if not self.quiet:
-                print(f"Unexpected error processing {file_path}: {e}")
-            logger.exception(f"Unexpected error in process_file for {file_path}")
+            logger.exception(f"Unexpected error processing {file_path}: {e}")
             return False
         finally:
             self.operation_log["stats"]["files_processed"] += 1
     
+    def replace_file_bytes(self, file_path: Path, data: bytes) -> None:
+        """Write data to a temporary file and swap it in, so a failed write never leaves a truncated note.
+
+        Symlinked notes are written through to their target. A note with other hard links is
+        written in place, since swapping in a new file would detach it from those links.
+        """
+        real_path = Path(os.path.realpath(file_path))
+        if real_path.stat().st_nlink > 1:
+            real_path.write_bytes(data)
+            return
+        tmp_path = real_path.with_name(real_path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(data)
+            shutil.copymode(real_path, tmp_path)
+            os.replace(tmp_path, real_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     @abstractmethod
     def transform_tags(self, content: str, file_path: str) -> str:
         """Transform tags in file content. Implemented by subclasses."""
@@ -123,126 +264,191 @@ class TagOperationEngine(ABC):
         """Get standardized operation name for log files."""
         pass
     
-    def file_contains_tag(self, content: str, target_tag: str) -> bool:
-        """Check if file contains the target tag using proven parsers, respecting tag_types filter."""
-        target_tag_lower = target_tag.lower().strip()
-
-        # Parse content
-        frontmatter, remaining_content = extract_frontmatter(content)
-
-        # Check frontmatter tags if enabled
-        if self.tag_types in ('both', 'frontmatter') and frontmatter:
-            frontmatter_tags = extract_tags_from_frontmatter(frontmatter)
-            for tag in frontmatter_tags:
-                if tag.lower().strip() == target_tag_lower:
-                    return True
-
-        # Check inline tags if enabled
-        if self.tag_types in ('both', 'inline'):
-            inline_tags = extract_inline_tags(remaining_content)
-            for tag in inline_tags:
-                if tag.lower().strip() == target_tag_lower:
-                    return True
-
-        return False
+    def _set_target_tags(self, target_tags: List[str]) -> None:
+        """Precompute the substring pre-filter for the lowercased tags this operation targets."""
+        self._needles = tuple(dict.fromkeys(tag for tag in target_tags if tag))
+        self._needle_re = None
+        self._needle_automaton = None
+        if len(self._needles) >= PREFILTER_REGEX_MIN_NEEDLES:
+            if AHOCORASICK_AVAILABLE:
+                # One linear scan regardless of how many source tags there are
+                self._needle_automaton = ahocorasick.Automaton()
+                for needle in self._needles:
+                    self._needle_automaton.add_word(needle, needle)
+                self._needle_automaton.make_automaton()
+            else:
+                self._needle_re = re.compile('|'.join(map(re.escape, self._needles)))
+        # Raw bytes can be checked before decoding, but bytes.lower() only folds ASCII and some
+        # non-ASCII characters lowercase to ASCII (U+212A KELVIN SIGN is 'k'), so only
+        # pure-ASCII files are checked this way; they can't contain the non-ASCII targets
+        self._byte_needles = tuple(needle.encode('ascii') for needle in self._needles if needle.isascii())
+        self._byte_needle_re = None
+        if len(self._byte_needles) >= PREFILTER_REGEX_MIN_NEEDLES:
+            self._byte_needle_re = re.compile(b'|'.join(map(re.escape, self._byte_needles)))
+
+    def _set_inline_rewrite(self, target_tags: List[str], replacement: str) -> None:
+        """Precompile a literal match for whole inline occurrences of the lowercased target_tags.
+
+        Every match becomes replacement ("" deletes it), so the inline pass needs no per-tag
+        Python callback. Targets that can't be inline tags are left out; none at all leaves
+        the generic _transform_one_tag path in place.
+        """
+        names = [tag for tag in dict.fromkeys(target_tags) if INLINE_TAG_NAME_RE.fullmatch(tag)]
+        if not names:
+            return
+        pattern = rf'(?:^|(?<=\s))#(?:{"|".join(map(re.escape, names))})(?![a-zA-Z0-9_\-\/])'
+        self._inline_target_re = re.compile(pattern, re.IGNORECASE | re.ASCII)
+        # With code present, the code spans are matched first and kept as they are
+        self._inline_target_scan_re = re.compile(
+            rf'(?:{CODE_SPAN_PATTERN})|({pattern})',
+            re.IGNORECASE | re.ASCII | re.DOTALL
+        )
+        self._inline_replacement = replacement
+        self._inline_replacement_template = replacement.replace('\\', '\\\\')
     
-    def transform_file_tags(self, content: str, tag_transform_func) -> str:
-        """Transform tags in file content using proven parsers, respecting tag_types filter."""
-        # Parse frontmatter and content
-        frontmatter, remaining_content = extract_frontmatter(content)
+    def may_contain_target_tags(self, content: str) -> bool:
+        """Cheap check that rules out files where no target tag text appears at all."""
+        if self._needles is None:
+            return True
+        return self._lowered_contains_needle(content.lower())
+
+    def _lowered_contains_needle(self, lowered: str, start: int = 0) -> bool:
+        """Whether a target needle occurs in already-lowercased text at or after start."""
+        if self._needles is None:
+            return True
+        if self._needle_automaton is not None:
+            return next(self._needle_automaton.iter(lowered, start), None) is not None
+        if self._needle_re is not None:
+            return self._needle_re.search(lowered, start) is not None
+        return any(lowered.find(needle, start) != -1 for needle in self._needles)
+
+    def _body_may_contain_target_tags(self, content: str, lowered: str, remaining_content: str) -> bool:
+        """may_contain_target_tags(remaining_content), reusing lowered == content.lower() for the suffix."""
+        # Only U+0130 lowercases to two characters, so equal lengths mean the offsets line up
+        if len(lowered) != len(content):
+            return self.may_contain_target_tags(remaining_content)
+        return self._lowered_contains_needle(lowered, len(content) - len(remaining_content))
+
+    def raw_may_contain_target_tags(self, raw_content: bytes) -> bool:
+        """Same check as may_contain_target_tags on undecoded file bytes; True when it can't tell."""
+        if self._needles is None:
+            return True
+        if not raw_content.isascii():
+            return True
+        lowered = raw_content.lower()
+        if self._byte_needle_re is not None:
+            return self._byte_needle_re.search(lowered) is not None
+        return any(needle in lowered for needle in self._byte_needles)
+
+    def _transform_one_tag(self, tag: str) -> Optional[str]:
+        """Map one tag occurrence to its replacement, or None to delete it. Used by transform_file_tags."""
+        return tag
+
+    def transform_file_tags(self, content: str, parsed: Optional[Tuple[Optional[re.Match], Optional[Tuple[str, ...]], str]] = None) -> str:
+        """Transform tags in file content with _transform_one_tag, respecting tag_types filter.
+
+        parsed is the _parse_frontmatter_tags(content) result when the caller already has it,
+        so the frontmatter is only matched once per file.
+        """
+        # Parse frontmatter; the match spans locate the YAML text and the body
+        frontmatter_match, frontmatter_tags, _ = parsed if parsed is not None else _parse_frontmatter_tags(content)
+        out = io.StringIO()
+        body = content
 
         # Handle frontmatter transformation based on tag_types
-        frontmatter_match = re.match(r'^---\s*\n(.*?)\n---(\s*\n)', content, re.DOTALL)
-        if frontmatter and frontmatter_match and self.tag_types in ('both', 'frontmatter'):
-            original_yaml = frontmatter_match.group(1)
-            original_ending = frontmatter_match.group(2)  # Preserve original spacing after ---
-            transformed_yaml = self._transform_yaml_text(original_yaml, tag_transform_func)
-            frontmatter_section = f"---\n{transformed_yaml}\n---{original_ending}"
-        elif frontmatter_match:
-            # Frontmatter exists but either couldn't parse or frontmatter processing disabled - preserve original
-            frontmatter_section = frontmatter_match.group(0)
-        else:
-            frontmatter_section = ""
+        if frontmatter_match:
+            body_start = frontmatter_match.end()
+            body = content[body_start:]
+            if (frontmatter_tags is not None and self.tag_types in ('both', 'frontmatter')
+                    and self._frontmatter_may_need_changes(content, frontmatter_match)):
+                out.write("---\n")
+                self._write_yaml_text(out, content, frontmatter_match.start(1), frontmatter_match.end(1))
+                out.write(content[frontmatter_match.end(1):body_start])  # Closing --- and original spacing
+            else:
+                # Frontmatter exists but either couldn't parse or frontmatter processing disabled - preserve original
+                out.write(content[:body_start])
 
         # Handle inline transformation based on tag_types
         if self.tag_types in ('both', 'inline'):
-            transformed_content = self._transform_inline_tags(remaining_content, tag_transform_func)
+            out.write(self._transform_inline_tags(body))
         else:
             # Inline processing disabled - preserve original content
-            transformed_content = remaining_content
+            out.write(body)
 
-        return frontmatter_section + transformed_content
+        return out.getvalue()
+    
+    def _frontmatter_may_need_changes(self, content: str, frontmatter_match: re.Match) -> bool:
+        """Whether the frontmatter has a tags key and mentions a target tag, so the line walk can be skipped otherwise."""
+        start, end = frontmatter_match.span(1)
+        if not YAML_TAG_KEY_RE.search(content, start, end):
+            return False
+        return self.may_contain_target_tags(content[start:end])
     
-    def _transform_yaml_text(self, yaml_text: str, tag_transform_func) -> str:
-        """Transform only tag lines in YAML text, preserving all other formatting."""
-        lines = yaml_text.split('\n')
-        transformed_lines = []
-        i = 0
+    def _write_yaml_text(self, out: io.StringIO, content: str, start: int, end: int) -> None:
+        """Write the YAML text content[start:end] to out, transforming only tag lines."""
+        in_tags_array = False
+        separator = ""
+        
+        # Lines before the first tags key pass through unchanged, so copy them in one write
+        first_key = YAML_TAG_KEY_RE.search(content, start, end)
+        if first_key is None:
+            out.write(content[start:end])
+            return
+        if first_key.start() > start:
+            # Drop the prefix's trailing newline; separator restores it before the next kept line
+            out.write(content[start:first_key.start() - 1])
+            separator = "\n"
         
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
+        # Lines are matched in place, so the YAML block is never split or copied
+        for m in YAML_LINE_RE.finditer(content, first_key.start(), end):
+            key = m.group('key')
+            item = m.group('item')
             
-            # Check if this is a tag field line
-            if stripped.startswith('tags:') or stripped.startswith('tag:'):
-                # Extract the key and value parts
-                if ':' in line:
-                    key_part = line.split(':', 1)[0] + ':'
-                    value_part = line.split(':', 1)[1].strip() if len(line.split(':', 1)) > 1 else ''
-                    
-                    if value_part:
-                        # Single line tag format: "tags: [tag1, tag2]" or "tags: single-tag"
-                        transformed_value = self._transform_yaml_tag_value(value_part, tag_transform_func)
-                        indent = line[:len(line) - len(line.lstrip())]
-                        if transformed_value:
-                            transformed_lines.append(f"{indent}{key_part} {transformed_value}")
-                        elif transformed_value is None and value_part.strip().startswith('['):
-                            # Preserve empty array format when all tags were deleted from an array
-                            transformed_lines.append(f"{indent}{key_part} []")
-                        else:
-                            # Skip non-array empty tag fields
-                            pass
-                    else:
-                        # Multi-line array format starts here
-                        indent = line[:len(line) - len(line.lstrip())]
-                        transformed_lines.append(line)  # Keep the "tags:" line
-
-                        # Process following array items
-                        i += 1
-                        array_has_items = False
-                        while i < len(lines) and (lines[i].strip().startswith('- ') or lines[i].strip() == ''):
-                            item_line = lines[i]
-                            if item_line.strip().startswith('- '):
-                                tag_value = item_line.strip()[2:].strip()
-                                if tag_value:
-                                    transformed_tag = tag_transform_func(tag_value.strip('"\''))
-                                    if transformed_tag:
-                                        item_indent = item_line[:len(item_line) - len(item_line.lstrip())]
-                                        transformed_lines.append(f"{item_indent}- {transformed_tag}")
-                                        array_has_items = True
-                            else:
-                                # Empty line in array, preserve it
-                                transformed_lines.append(item_line)
-                            i += 1
-
-                        # If array had items but all were deleted, add empty array placeholder
-                        if not array_has_items and i > len([l for l in lines[len(transformed_lines):i] if l.strip().startswith('- ')]):
-                            # There were list items originally but none remain, preserve as empty array
-                            pass  # Keep the "tags:" line without items (YAML empty array)
-
-                        i -= 1  # Back up one since we'll increment at end of loop
-                else:
-                    # Malformed tag line, preserve as-is
-                    transformed_lines.append(line)
-            else:
+            if in_tags_array:
+                if key is None and item is None and not m.group('other'):
+                    # Empty line in array, preserve it
+                    out.write(separator)
+                    out.write(m.group(0))
+                    separator = "\n"
+                    continue
+                if item is not None and item.strip():
+                    tag_value = item.strip()
+                    transformed_tag = self._transform_one_tag(tag_value.strip('"\''))
+                    if transformed_tag:
+                        out.write(f"{separator}{m.group('indent')}- {transformed_tag}")
+                        separator = "\n"
+                    continue
+                # Any other line ends the multi-line array
+                in_tags_array = False
+            
+            if key is None:
                 # Not a tag line, preserve as-is
-                transformed_lines.append(line)
+                out.write(separator)
+                out.write(m.group(0))
+                separator = "\n"
+                continue
             
-            i += 1
-        
-        return '\n'.join(transformed_lines)
+            indent = m.group('indent')
+            value_part = m.group('value').strip()
+            if value_part:
+                # Single line tag format: "tags: [tag1, tag2]" or "tags: single-tag"
+                transformed_value = self._transform_yaml_tag_value(value_part)
+                if transformed_value:
+                    out.write(f"{separator}{indent}{key}: {transformed_value}")
+                    separator = "\n"
+                elif transformed_value is None and value_part.startswith('['):
+                    # Preserve empty array format when all tags were deleted from an array
+                    out.write(f"{separator}{indent}{key}: []")
+                    separator = "\n"
+                # Otherwise skip non-array empty tag fields
+            else:
+                # Multi-line array format starts here; keep the "tags:" line
+                out.write(separator)
+                out.write(m.group(0))
+                separator = "\n"
+                in_tags_array = True
     
-    def _transform_yaml_tag_value(self, value: str, tag_transform_func) -> Optional[str]:
+    def _transform_yaml_tag_value(self, value: str) -> Optional[str]:
         """Transform a YAML tag value while preserving format."""
         value = value.strip()
         
@@ -252,90 +458,146 @@ class TagOperationEngine(ABC):
             if not inner.strip():
                 return None  # Empty array
             
+            # Preserve original quoting style if possible; decided once for the whole array
+            quote_tags = '"' in inner
+            transform = self._transform_one_tag
             tags = []
             for tag in inner.split(','):
                 tag = tag.strip().strip('"\'')
                 if tag:
-                    transformed = tag_transform_func(tag)
-                    if transformed:
-                        # Preserve original quoting style if possible
-                        if '"' in inner:
-                            tags.append(f'"{transformed}"')
-                        else:
-                            tags.append(transformed)
+                    transformed = transform(tag)
+                    if transformed is not None:  # None deletes the tag
+                        tags.append(f'"{transformed}"' if quote_tags else transformed)
             
             return f"[{', '.join(tags)}]" if tags else None
             
         elif ',' in value:
             # Comma-separated format: tag1, tag2, tag3
+            transform = self._transform_one_tag
             tags = []
             for tag in value.split(','):
                 tag = tag.strip().strip('"\'')
                 if tag:
-                    transformed = tag_transform_func(tag)
-                    if transformed:
+                    transformed = transform(tag)
+                    if transformed is not None:  # None deletes the tag
                         tags.append(transformed)
             return ', '.join(tags) if tags else None
             
         else:
             # Single tag
             tag = value.strip().strip('"\'')
-            return tag_transform_func(tag) if tag else None
+            return self._transform_one_tag(tag) if tag else None
     
-    def _transform_inline_tags(self, content: str, tag_transform_func) -> str:
+    def _transform_inline_tags(self, content: str) -> str:
         """Transform inline tags in content while preserving code blocks."""
-        # We need to preserve code blocks, so we'll use a placeholder approach
-        code_blocks = []
-        
-        # Store fenced code blocks
-        def store_fenced_block(match):
-            code_blocks.append(match.group(0))
-            return f"__FENCED_BLOCK_{len(code_blocks)-1}__"
-        
-        content = re.sub(r'```.*?```', store_fenced_block, content, flags=re.DOTALL)
-        
-        # Store inline code
-        def store_inline_code(match):
-            code_blocks.append(match.group(0))
-            return f"__INLINE_CODE_{len(code_blocks)-1}__"
-        
-        content = re.sub(r'`[^`]*`', store_inline_code, content)
-        
-        # Transform tags in the content with placeholders
-        def replace_tag(match):
-            tag = match.group(1)
-            transformed_tag = tag_transform_func(tag)
-            if transformed_tag is None:
-                return ""  # Delete tag
-            elif transformed_tag != tag:
-                return f"#{transformed_tag}"
-            else:
-                return match.group(0)  # No change
-        
-        # Use the same pattern as the proven inline parser
-        tag_pattern = r'(?:^|(?<=\s))#([a-zA-Z0-9][a-zA-Z0-9_\-\/]*)'
-        content = re.sub(tag_pattern, replace_tag, content)
-        
-        # Restore code blocks
-        def restore_fenced_block(match):
-            index = int(match.group(1))
-            return code_blocks[index] if index < len(code_blocks) else match.group(0)
-        
-        def restore_inline_code(match):
-            index = int(match.group(1))
-            return code_blocks[index] if index < len(code_blocks) else match.group(0)
+        # Most bodies have no inline tag at all; bail out before any substitution pass
+        if not INLINE_TAG_RE.search(content):
+            return content
         
-        content = re.sub(r'__FENCED_BLOCK_(\d+)__', restore_fenced_block, content)
-        content = re.sub(r'__INLINE_CODE_(\d+)__', restore_inline_code, content)
+        # Code needs a backtick, so prose-only bodies can skip the code-span arms
+        if '`' not in content:
+            return self._substitute_inline_tags(content, False)
+        fenced_blocks = FENCED_BLOCK_RE.findall(content) if '```' in content else []
+        if not fenced_blocks:
+            return self._substitute_inline_tags(content, True)
         
+        # Stand each fenced block in for one character that is neither whitespace, a
+        # backtick nor a tag character, transform the rest, then put the blocks back
+        sentinel = next(chr(code) for code in (0, *range(0xE000, 0xF900)) if chr(code) not in content)
+        outside = FENCED_BLOCK_RE.sub(sentinel, content)
+        pieces = self._substitute_inline_tags(outside, '`' in outside).split(sentinel)
+        result = [pieces[0]]
+        for block, piece in zip(fenced_blocks, pieces[1:], strict=True):
+            result += (block, piece)
+        return ''.join(result)
+    
+    def _substitute_inline_tags(self, content: str, has_code: bool) -> str:
+        """Transform every inline tag outside code in a single regex pass."""
+        # _set_inline_rewrite sets both patterns together
+        if self._inline_target_re is None or self._inline_target_scan_re is None:
+            pattern = INLINE_SCAN_RE if has_code else INLINE_TAG_RE
+            return pattern.sub(self._replace_inline_match, content)
+        if has_code:
+            return self._inline_target_scan_re.sub(self._replace_inline_target_match, content)
+        content, count = self._inline_target_re.subn(self._inline_replacement_template, content)
+        self.operation_log["stats"]["tags_modified"] += count
         return content
     
+    def _replace_inline_target_match(self, match: re.Match[str]) -> str:
+        """_inline_target_scan_re replacement: keep code spans, rewrite target tag occurrences."""
+        if match.group(1) is None:
+            return match.group(0)  # Code span
+        self.operation_log["stats"]["tags_modified"] += 1
+        return self._inline_replacement
+    
+    def _replace_inline_match(self, match: re.Match[str]) -> str:
+        """INLINE_SCAN_RE replacement: keep code spans, transform the matched tag, dropping it when deleted."""
+        tag = match.group(1)
+        if tag is None:
+            return match.group(0)  # Code span
+        transformed_tag = self._transform_one_tag(tag)
+        if transformed_tag is None:
+            return ""  # Delete tag
+        elif transformed_tag != tag:
+            return f"#{transformed_tag}"
+        else:
+            return match.group(0)  # No change
+    
+    @staticmethod
+    def _scan_directory(directory: str) -> Tuple[List[Path], List[str]]:
+        """List one directory as (markdown files, subdirectories to descend into), in scandir order.
+
+        Any entry whose name contains ".obsidian" is left out, so nothing under such a path is touched.
+        """
+        markdown_files = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if ".obsidian" in entry.name:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
+                        elif entry.name.endswith(".md") and entry.is_file():
+                            markdown_files.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except PermissionError:
+            pass
+        return markdown_files, subdirectories
+    
     def find_markdown_files(self) -> List[Path]:
-        """Find all markdown files in vault."""
+        """Find all markdown files in vault, skipping any path that contains ".obsidian"."""
+        root = str(self.vault_path)
+        if ".obsidian" in root:
+            return []
+        listings = {}
+        executor = None
+        try:
+            # List the tree one depth level at a time; sibling directories are
+            # listed concurrently unless the caller asked for a single job
+            level = [root]
+            while level:
+                if len(level) > 1 and self.jobs != 1 and executor is None:
+                    executor = ThreadPoolExecutor(max_workers=SCAN_MAX_THREADS)
+                scanned = executor.map(self._scan_directory, level) if executor else map(self._scan_directory, level)
+                next_level = []
+                for directory, listing in zip(level, scanned, strict=True):
+                    listings[directory] = listing
+                    next_level.extend(listing[1])
+                level = next_level
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        # Assemble depth first in scandir order, so results don't depend on thread timing
         markdown_files = []
-        for file_path in self.vault_path.rglob("*.md"):
-            if ".obsidian" not in str(file_path):
-                markdown_files.append(file_path)
+        pending = [root]
+        while pending:
+            files, subdirectories = listings.pop(pending.pop())
+            markdown_files.extend(files)
+            pending.extend(reversed(subdirectories))
         return markdown_files
     
     def run_operation(self):
@@ -350,8 +612,12 @@ class TagOperationEngine(ABC):
         if not self.quiet:
             print(f"Found {len(markdown_files)} markdown files")
 
-        for file_path in markdown_files:
-            self.process_file_tags(file_path)
+        workers = self._worker_count(len(markdown_files))
+        if workers > 1:
+            self._process_files_parallel(markdown_files, workers)
+        else:
+            for file_path in markdown_files:
+                self.process_file_tags(file_path)
 
         # Save operation log (only if not quiet, to avoid creating tons of logs)
         if not self.quiet:
@@ -364,9 +630,88 @@ class TagOperationEngine(ABC):
         # Return operation results for testing/inspection
         return self.operation_log
     
+    def _worker_count(self, file_total: int) -> int:
+        """Number of worker processes to use for processing file_total files."""
+        if file_total < PARALLEL_MIN_FILES:
+            return 1
+        jobs = self.jobs or os.cpu_count() or 1
+        return max(1, min(jobs, file_total))
+
+    def _process_files_parallel(self, file_paths: List[Path], workers: int) -> None:
+        """
+        Process files in a process pool and fold each worker's results into this operation.
+
+        Files without a result, because the pool couldn't start or a worker died, are
+        processed serially here instead.
+
+        Args:
+            file_paths: Markdown files to process
+            workers: Number of worker processes
+        """
+        # Discovery may have started threads, which plain fork does not copy safely
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+        # One future per file, so a worker dying mid-run only loses the files it hadn't finished
+        futures: Dict[Future, int] = {}
+        failure: Optional[BaseException] = None
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method)) as executor:
+                for index, file_path in enumerate(file_paths):
+                    futures[executor.submit(self._process_file_isolated, file_path)] = index
+        except (OSError, BrokenProcessPool) as e:
+            failure = e
+
+        # The pool has shut down, so every future is settled; keep each result that came back
+        results: List[Optional[Tuple[Dict[str, List], Dict[str, int], Dict[str, int]]]] = [None] * len(file_paths)
+        for future, index in futures.items():
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                results[index] = future.result()
+            else:
+                failure = error
+
+        unfinished = results.count(None)
+        if unfinished == len(file_paths):
+            logger.warning(f"Parallel processing unavailable, falling back to serial: {failure}")
+        elif unfinished:
+            logger.warning(f"Worker process failed, processing the {unfinished} unfinished files serially: {failure}")
+
+        # Aggregate in file order so the operation log stays deterministic
+        for file_path, result in zip(file_paths, results, strict=True):
+            if result is None:
+                self.process_file_tags(file_path)
+                continue
+            log_entries, stats_delta, counter_deltas = result
+            for key, entries in log_entries.items():
+                self.operation_log[key].extend(entries)
+            for key, delta in stats_delta.items():
+                self.operation_log["stats"][key] += delta
+            for name, delta in counter_deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _process_file_isolated(self, file_path: Path) -> Tuple[Dict[str, List], Dict[str, int], Dict[str, int]]:
+        """
+        Process one file in a worker and report its effect on the operation state.
+
+        Returns:
+            Tuple of (new operation_log list entries by key, stats deltas, counter deltas)
+        """
+        log = self.operation_log
+        list_lengths = {key: len(value) for key, value in log.items() if isinstance(value, list)}
+        stats_before = dict(log["stats"])
+        counters_before = {name: getattr(self, name) for name in self.PARALLEL_COUNTERS}
+
+        self.process_file_tags(file_path)
+
+        log_entries = {key: log[key][length:] for key, length in list_lengths.items() if len(log[key]) > length}
+        stats_delta = {key: log["stats"][key] - stats_before[key] for key in stats_before}
+        counter_deltas = {name: getattr(self, name) - before for name, before in counters_before.items()}
+        return log_entries, stats_delta, counter_deltas
+
     def save_operation_log(self):
         """Save detailed operation log in log/ directory."""
-        log_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_timestamp = self.started_at.strftime("%Y%m%d_%H%M%S")
         # Use standardized operation name format
         operation_name = self.get_operation_log_name()
         log_filename = f"{operation_name}_{log_timestamp}.json"
@@ -378,35 +723,53 @@ class TagOperationEngine(ABC):
         # Save in log/ directory
         log_path = log_dir / log_filename
 
-        with open(log_path, 'w') as f:
-            json.dump(self.operation_log, f, indent=2, ensure_ascii=False)
+        # Compact separators: logs are machine-read and can hold thousands of
+        # change records, where indenting dominates the encoding time and size.
+        # orjson, when installed, encodes straight to UTF-8 bytes in one call
+        try:
+            import orjson
+        except ImportError:
+            with open(log_path, 'w', encoding='utf-8') as f:
+                json.dump(self.operation_log, f, separators=(',', ':'), ensure_ascii=False)
+        else:
+            log_path.write_bytes(orjson.dumps(self.operation_log, option=orjson.OPT_NON_STR_KEYS))
 
         print(f"Operation log saved: log/{log_filename}")
         return log_path
     
     def generate_report(self):
-        """Generate operation summary report."""
+        """Generate operation summary report, written to stdout in a single call."""
+        sys.stdout.write("\n".join(self.report_lines()) + "\n")
+    
+    def report_lines(self) -> List[str]:
+        """Lines of the operation summary report."""
         stats = self.operation_log["stats"]
-        print("\n" + "="*50)
-        print(f"{self.operation_log['operation'].upper()} OPERATION REPORT")
-        print("="*50)
-        print(f"Files processed: {stats['files_processed']}")
-        print(f"Files modified: {stats['files_modified']}")
-        print(f"Tags modified: {stats['tags_modified']}")
-        print(f"Errors: {stats['errors']}")
+        lines = [
+            "",
+            "="*50,
+            f"{self.operation_log['operation'].upper()} OPERATION REPORT",
+            "="*50,
+            f"Files processed: {stats['files_processed']}",
+            f"Files modified: {stats['files_modified']}",
+            f"Tags modified: {stats['tags_modified']}",
+            f"Errors: {stats['errors']}",
+        ]
         
         if self.dry_run:
-            print("\n[PREVIEW MODE] No files were modified")
-            print("To apply these changes, add --execute flag to your command")
+            lines.append("\n[PREVIEW MODE] No files were modified")
+            lines.append("To apply these changes, add --execute flag to your command")
+        return lines
 
 
 class RenameOperation(TagOperationEngine):
     """Operation to rename a single tag across all files."""
 
-    def __init__(self, vault_path: str, old_tag: str, new_tag: str, dry_run: bool = False, tag_types: str = 'both', quiet: bool = False):
-        super().__init__(vault_path, dry_run, tag_types, quiet)
+    def __init__(self, vault_path: str, old_tag: str, new_tag: str, dry_run: bool = False, tag_types: str = 'both', quiet: bool = False, jobs: int = 1):
+        super().__init__(vault_path, dry_run, tag_types, quiet, jobs)
         self.old_tag = old_tag.lower().strip()
         self.new_tag = new_tag.strip()
+        self._set_target_tags([self.old_tag])
+        self._set_inline_rewrite([self.old_tag], f"#{self.new_tag}")
         self.operation_log.update({
             "operation_type": "rename",
             "old_tag": self.old_tag,
@@ -415,18 +778,36 @@ class RenameOperation(TagOperationEngine):
     
     def transform_tags(self, content: str, file_path: str) -> str:
         """Rename old_tag to new_tag in content, but only if file contains the tag."""
-        # First check if this file actually contains the target tag
-        if not self.file_contains_tag(content, self.old_tag):
+        # Skip the parsers entirely when the tag text can't be in the file;
+        # lowercased once, the body check below reuses it
+        lowered = content.lower()
+        if not self._lowered_contains_needle(lowered):
             return content  # No changes needed
         
-        def tag_transform(tag: str) -> str:
-            if tag.lower().strip() == self.old_tag:
-                self.operation_log["stats"]["tags_modified"] += 1
-                return self.new_tag
-            return tag
+        # Check if this file actually contains the target tag in enabled locations
+        parsed = _parse_frontmatter_tags(content)
+        _, frontmatter_tags, remaining_content = parsed
+        has_old_tag = False
+        if self.tag_types in ('both', 'frontmatter') and frontmatter_tags:
+            has_old_tag = any(_normalize_tag_key(tag) == self.old_tag for tag in frontmatter_tags)
+        
+        if (not has_old_tag and self.tag_types in ('both', 'inline')
+                and self._body_may_contain_target_tags(content, lowered, remaining_content)):
+            inline_tags = extract_inline_tags(remaining_content)
+            has_old_tag = any(_normalize_tag_key(tag) == self.old_tag for tag in inline_tags)
+        
+        if not has_old_tag:
+            return content  # No changes needed
         
         # Use the proven parser-based transformation
-        return self.transform_file_tags(content, tag_transform)
+        return self.transform_file_tags(content, parsed)
+    
+    def _transform_one_tag(self, tag: str) -> str:
+        """Rename a single tag occurrence if it is old_tag."""
+        if _normalize_tag_key(tag) == self.old_tag:
+            self.operation_log["stats"]["tags_modified"] += 1
+            return self.new_tag
+        return tag
     
     def get_file_modifications(self, original: str, modified: str) -> List[Dict]:
         """Get specific tag rename modifications."""
@@ -444,10 +825,14 @@ class RenameOperation(TagOperationEngine):
 class MergeOperation(TagOperationEngine):
     """Operation to merge multiple tags into a single tag."""
 
-    def __init__(self, vault_path: str, source_tags: List[str], target_tag: str, dry_run: bool = False, tag_types: str = 'both', quiet: bool = False):
-        super().__init__(vault_path, dry_run, tag_types, quiet)
+    def __init__(self, vault_path: str, source_tags: List[str], target_tag: str, dry_run: bool = False, tag_types: str = 'both', quiet: bool = False, jobs: int = 1):
+        super().__init__(vault_path, dry_run, tag_types, quiet, jobs)
         self.source_tags = [tag.lower().strip() for tag in source_tags]
         self.target_tag = target_tag.strip()
+        # Set for O(1) per-tag lookups; the list keeps the logged order
+        self._source_tag_set = frozenset(self.source_tags)
+        self._set_target_tags(self.source_tags)
+        self._set_inline_rewrite(self.source_tags, f"#{self.target_tag}")
         self.operation_log.update({
             "operation_type": "merge",
             "source_tags": self.source_tags,
@@ -456,23 +841,29 @@ class MergeOperation(TagOperationEngine):
     
     def transform_tags(self, content: str, file_path: str) -> str:
         """Merge source tags into target tag, respecting tag_types filter."""
+        # Lowercased once; the body checks below reuse it
+        lowered = content.lower()
+        if not self._lowered_contains_needle(lowered):
+            return content  # No source tag text anywhere in the file
+
         # Check if file contains any of the source tags in enabled locations
         has_source_tags = False
-        frontmatter, remaining_content = extract_frontmatter(content)
+        parsed = _parse_frontmatter_tags(content)
+        _, frontmatter_tags, remaining_content = parsed
 
         # Check frontmatter tags if enabled
-        if self.tag_types in ('both', 'frontmatter') and frontmatter:
-            frontmatter_tags = extract_tags_from_frontmatter(frontmatter)
+        if self.tag_types in ('both', 'frontmatter') and frontmatter_tags:
             for tag in frontmatter_tags:
-                if tag.lower().strip() in self.source_tags:
+                if _normalize_tag_key(tag) in self._source_tag_set:
                     has_source_tags = True
                     break
 
         # Check inline tags if enabled
-        if not has_source_tags and self.tag_types in ('both', 'inline'):
+        if (not has_source_tags and self.tag_types in ('both', 'inline')
+                and self._body_may_contain_target_tags(content, lowered, remaining_content)):
             inline_tags = extract_inline_tags(remaining_content)
             for tag in inline_tags:
-                if tag.lower().strip() in self.source_tags:
+                if _normalize_tag_key(tag) in self._source_tag_set:
                     has_source_tags = True
                     break
 
@@ -480,14 +871,15 @@ class MergeOperation(TagOperationEngine):
         if not has_source_tags:
             return content  # No changes needed
 
-        def tag_transform(tag: str) -> str:
-            if tag.lower().strip() in self.source_tags:
-                self.operation_log["stats"]["tags_modified"] += 1
-                return self.target_tag
-            return tag
-
         # Use the proven parser-based transformation
-        return self.transform_file_tags(content, tag_transform)
+        return self.transform_file_tags(content, parsed)
+    
+    def _transform_one_tag(self, tag: str) -> str:
+        """Replace a single tag occurrence with target_tag if it is a source tag."""
+        if _normalize_tag_key(tag) in self._source_tag_set:
+            self.operation_log["stats"]["tags_modified"] += 1
+            return self.target_tag
+        return tag
     
     def get_file_modifications(self, original: str, modified: str) -> List[Dict]:
         """Get specific tag merge modifications."""
@@ -505,9 +897,15 @@ class MergeOperation(TagOperationEngine):
 class DeleteOperation(TagOperationEngine):
     """Operation to delete tags entirely from all files."""
 
-    def __init__(self, vault_path: str, tags_to_delete: List[str], dry_run: bool = False, tag_types: str = 'both', quiet: bool = False):
-        super().__init__(vault_path, dry_run, tag_types, quiet)
+    PARALLEL_COUNTERS = ("inline_deletions", "frontmatter_deletions")
+
+    def __init__(self, vault_path: str, tags_to_delete: List[str], dry_run: bool = False, tag_types: str = 'both', quiet: bool = False, jobs: int = 1):
+        super().__init__(vault_path, dry_run, tag_types, quiet, jobs)
         self.tags_to_delete = [tag.lower().strip() for tag in tags_to_delete]
+        # Set for O(1) per-tag lookups; the list keeps the logged order
+        self._delete_tag_set = frozenset(self.tags_to_delete)
+        self._set_target_tags(self.tags_to_delete)
+        self._set_inline_rewrite(self.tags_to_delete, "")
         self.inline_deletions = 0
         self.frontmatter_deletions = 0
         self.operation_log.update({
@@ -518,23 +916,30 @@ class DeleteOperation(TagOperationEngine):
 
     def transform_tags(self, content: str, file_path: str) -> str:
         """Delete specified tags from content, respecting tag_types filter."""
+        # Lowercased once; the body check below reuses it
+        lowered = content.lower()
+        if not self._lowered_contains_needle(lowered):
+            return content  # No tag text to delete anywhere in the file
+
         # Track what types of tags we're deleting for warnings
-        frontmatter, remaining_content = extract_frontmatter(content)
+        parsed = _parse_frontmatter_tags(content)
+        _, frontmatter_tags, remaining_content = parsed
         has_frontmatter_tags = False
         has_inline_tags = False
 
         # Check if file contains target tags in enabled locations
-        if self.tag_types in ('both', 'frontmatter') and frontmatter:
-            frontmatter_tags = extract_tags_from_frontmatter(frontmatter)
+        if self.tag_types in ('both', 'frontmatter') and frontmatter_tags:
             for tag in frontmatter_tags:
-                if tag.lower().strip() in self.tags_to_delete:
+                if _normalize_tag_key(tag) in self._delete_tag_set:
                     has_frontmatter_tags = True
                     break
 
-        if self.tag_types in ('both', 'inline'):
+        # Frontmatter-only matches are common, so rule out the body before parsing it
+        if (self.tag_types in ('both', 'inline')
+                and self._body_may_contain_target_tags(content, lowered, remaining_content)):
             inline_tags = extract_inline_tags(remaining_content)
             for tag in inline_tags:
-                if tag.lower().strip() in self.tags_to_delete:
+                if _normalize_tag_key(tag) in self._delete_tag_set:
                     has_inline_tags = True
                     break
 
@@ -545,8 +950,7 @@ class DeleteOperation(TagOperationEngine):
                 f"WARNING: Deleting inline tags from '{file_path}'. "
                 f"This removes tags from content text, which may affect readability."
             )
-            if not self.quiet:
-                print(f"WARNING: {warning_msg}")
+            # Shown with the report rather than printed once per file
             self.operation_log["warnings"].append({
                 "file": file_path,
                 "type": "inline_deletion",
@@ -560,15 +964,15 @@ class DeleteOperation(TagOperationEngine):
         if not has_frontmatter_tags and not has_inline_tags:
             return content  # No changes needed
 
-        # Perform the deletion using tag transform function
-        def tag_transform(tag: str) -> Optional[str]:
-            if tag.lower().strip() in self.tags_to_delete:
-                self.operation_log["stats"]["tags_modified"] += 1
-                return None  # Return None to delete the tag
-            return tag
-
         # Use the proven parser-based transformation
-        return self.transform_file_tags(content, tag_transform)
+        return self.transform_file_tags(content, parsed)
+
+    def _transform_one_tag(self, tag: str) -> Optional[str]:
+        """Delete a single tag occurrence if it is one of tags_to_delete."""
+        if _normalize_tag_key(tag) in self._delete_tag_set:
+            self.operation_log["stats"]["tags_modified"] += 1
+            return None  # Return None to delete the tag
+        return tag
 
     def get_file_modifications(self, original: str, modified: str) -> List[Dict]:
         """Get specific tag deletion modifications."""
@@ -581,63 +985,24 @@ class DeleteOperation(TagOperationEngine):
         """Get standardized operation name for log files."""
         return "tag-delete-op"
 
-    def generate_report(self):
-        """Generate operation summary report with deletion-specific warnings."""
-        # Call parent report first
-        super().generate_report()
+    def report_lines(self) -> List[str]:
+        """Report lines with per-file warnings first and deletion-specific details after."""
+        lines = [warning["message"] for warning in self.operation_log["warnings"]]
+        lines.extend(super().report_lines())
 
         # Add deletion-specific information
-        print(f"\nDELETION DETAILS:")
-        print(f"Files with frontmatter tag deletions: {self.frontmatter_deletions}")
-        print(f"Files with inline tag deletions: {self.inline_deletions}")
+        lines.append("\nDELETION DETAILS:")
+        lines.append(f"Files with frontmatter tag deletions: {self.frontmatter_deletions}")
+        lines.append(f"Files with inline tag deletions: {self.inline_deletions}")
 
         if self.inline_deletions > 0:
-            print(f"\nWARNING: {self.inline_deletions} files had inline tags deleted.")
-            print("   Inline tag deletion removes tags from content text, which may affect")
-            print("   readability and context. Consider reviewing these files manually.")
+            lines.append(f"\nWARNING: {self.inline_deletions} files had inline tags deleted.")
+            lines.append("   Inline tag deletion removes tags from content text, which may affect")
+            lines.append("   readability and context. Consider reviewing these files manually.")
 
         if len(self.operation_log["warnings"]) > 0:
-            print(f"\n{len(self.operation_log['warnings'])} warnings logged. Check operation log for details.")
-
-    def _transform_yaml_tag_value(self, value: str, tag_transform_func) -> Optional[str]:
-        """Transform a YAML tag value, handling None returns for deletion."""
-        value = value.strip()
-
-        if value.startswith('[') and value.endswith(']'):
-            # Array format: [tag1, tag2, tag3]
-            inner = value[1:-1]
-            if not inner.strip():
-                return None  # Empty array
-
-            tags = []
-            for tag in inner.split(','):
-                tag = tag.strip().strip('"\'')
-                if tag:
-                    transformed = tag_transform_func(tag)
-                    if transformed is not None:  # Keep tags that aren't deleted
-                        # Preserve original quoting style if possible
-                        if '"' in inner:
-                            tags.append(f'"{transformed}"')
-                        else:
-                            tags.append(transformed)
-
-            return f"[{', '.join(tags)}]" if tags else None
-
-        elif ',' in value:
-            # Comma-separated format: tag1, tag2, tag3
-            tags = []
-            for tag in value.split(','):
-                tag = tag.strip().strip('"\'')
-                if tag:
-                    transformed = tag_transform_func(tag)
-                    if transformed is not None:  # Keep tags that aren't deleted
-                        tags.append(transformed)
-            return ', '.join(tags) if tags else None
-
-        else:
-            # Single tag
-            tag = value.strip().strip('"\'')
-            return tag_transform_func(tag) if tag else None
+            lines.append(f"\n{len(self.operation_log['warnings'])} warnings logged. Check operation log for details.")
+        return lines
 
 
 
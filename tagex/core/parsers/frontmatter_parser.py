@@ -2,9 +2,22 @@
 Frontmatter parser for extracting tags from YAML frontmatter in markdown files.
 """
 import re
+import sys
 from typing import List, Optional, Union, Tuple, Dict, Any
 import yaml
 
+# libyaml's C loader parses frontmatter several times faster than the pure-Python
+# one; PyYAML can be installed without it, so fall back to the same safe subset
+try:
+    from yaml import CSafeLoader as FrontmatterLoader
+except ImportError:
+    from yaml import SafeLoader as FrontmatterLoader  # type: ignore[assignment]
+
+
+# Match frontmatter pattern: --- at start, content, --- delimiter
+# Allow optional trailing content after closing ---
+FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*(?:\n|$)', re.DOTALL)
+
 
 def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
     """
@@ -16,10 +29,7 @@ def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
     Returns:
         Tuple of (frontmatter_dict, remaining_content)
     """
-    # Match frontmatter pattern: --- at start, content, --- delimiter
-    # Allow optional trailing content after closing ---
-    frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*(?:\n|$)'
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     
     if not match:
         return None, content
@@ -28,7 +38,7 @@ def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
     remaining_content = content[match.end():]
     
     try:
-        frontmatter = yaml.safe_load(yaml_content)
+        frontmatter = yaml.load(yaml_content, Loader=FrontmatterLoader)
         return frontmatter, remaining_content
     except yaml.YAMLError:
         # Return None if YAML is malformed
@@ -56,7 +66,8 @@ def extract_tags_from_frontmatter(frontmatter: Optional[Dict[str, Any]]) -> List
             tag_value = frontmatter[field]
             tags.extend(_parse_tag_value(tag_value))
     
-    return tags
+    # Interned like inline tags, so repeats across files share one string
+    return [sys.intern(tag) for tag in tags]
 
 
 def _parse_tag_value(tag_value: Any) -> List[str]:
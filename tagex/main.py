@@ -2,25 +2,15 @@
 """
 Obsidian Tag Extractor - Extract tags from Obsidian vault markdown files
 """
+import heapq
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
 import click
 from collections import Counter, defaultdict
 import math
 
-from .core.extractor.core import TagExtractor
-from .core.extractor.output_formatter import (
-    format_as_plugin_json,
-    format_as_csv,
-    format_as_text,
-    save_output,
-    print_summary
-)
-from .core.operations.tag_operations import RenameOperation, MergeOperation, DeleteOperation
-from .core.operations.add_tags import AddTagsOperation
-
 
 @click.group()
 @click.version_option()
@@ -71,6 +61,83 @@ def tag():
     pass
 
 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def _configure_logging(level: int):
+    """Install the root log handler on first use; afterwards only adjust the level.
+
+    logging.basicConfig is a no-op once the root logger has handlers, which would
+    silently ignore the level requested by later commands in the same process.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        root.setLevel(level)
+    else:
+        logging.basicConfig(level=level, format=_LOG_FORMAT)
+
+
+def _extraction_cache_dir(no_cache: bool):
+    """Return the directory for the per-file extraction cache, or None when disabled."""
+    if no_cache:
+        return None
+    return Path(click.get_app_dir('tagex')) / 'cache'
+
+
+def _extract_vault(vault_path, tag_types, no_filter, no_cache, jobs, exclude_patterns=None):
+    """Run tag extraction for a CLI command.
+
+    Returns:
+        Tuple of (tag_data, extraction statistics)
+    """
+    from .core.extractor.core import TagExtractor
+
+    extractor = TagExtractor(vault_path, exclude_patterns, filter_tags=not no_filter, tag_types=tag_types,
+                             cache_dir=_extraction_cache_dir(no_cache), jobs=jobs)
+    tag_data = extractor.extract_tags()
+    return tag_data, extractor.get_statistics()
+
+
+def _print_json_stdout(formatted_data):
+    """Write JSON to stdout, using orjson when it is installed.
+
+    The stdlib fallback streams with json.dump rather than building the full
+    string first.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        json.dump(formatted_data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
+        return
+
+    payload = orjson.dumps(
+        formatted_data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+    )
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(payload.decode('utf-8'))
+    else:
+        sys.stdout.flush()
+        buffer.write(payload)
+        buffer.flush()
+
+
+def _print_csv_stdout(formatted_data):
+    """Write CSV rows directly to stdout."""
+    import csv
+    csv.writer(sys.stdout).writerows(formatted_data)
+
+
+_STDOUT_PRINTERS: Dict[str, Callable[[Any], None]] = {
+    'json': _print_json_stdout,
+    'csv': _print_csv_stdout,
+    'txt': print,
+}
+
+
 @tag.command('export')
 @click.argument('vault_path', type=click.Path(exists=True, file_okay=False, dir_okay=True), default='.', required=False)
 @click.option('--output', '-o', type=click.Path(), help='Output file path (default: stdout)')
@@ -80,7 +147,9 @@ def tag():
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress summary output')
 @click.option('--no-filter', is_flag=True, help='Disable tag filtering (include all raw tags)')
-def export(vault_path, output, format, tag_types, exclude, verbose, quiet, no_filter):
+@click.option('--no-cache', is_flag=True, help='Re-parse every file instead of reusing cached tags for unchanged files')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for parsing large vaults (0 = all cores)')
+def export(vault_path, output, format, tag_types, exclude, verbose, quiet, no_filter, no_cache, jobs):
     """Export tags from the vault to JSON, CSV, or text format.
 
     VAULT_PATH: Path to the Obsidian vault directory (defaults to current directory)
@@ -88,34 +157,31 @@ def export(vault_path, output, format, tag_types, exclude, verbose, quiet, no_fi
     This is a read-only operation that extracts tag information without
     modifying any files.
     """
-    # Set up logging
-    log_level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    from .core.extractor.output_formatter import (
+        format_as_plugin_json,
+        iter_csv_rows,
+        format_as_text,
+        save_output,
+        print_summary
     )
 
+    # Set up logging
+    _configure_logging(logging.DEBUG if verbose else logging.INFO)
+
     # Convert exclude patterns to set
     exclude_patterns = set(exclude) if exclude else None
 
     try:
-        # Initialize extractor
-        extractor = TagExtractor(vault_path, exclude_patterns, filter_tags=not no_filter, tag_types=tag_types)
-
-        # Extract tags
-        tag_data = extractor.extract_tags()
-
-        # Get statistics
-        stats = extractor.get_statistics()
+        # Extract tags and statistics
+        tag_data, stats = _extract_vault(vault_path, tag_types, no_filter, no_cache, jobs, exclude_patterns)
 
         # Format output
-        formatted_data: Any
-        if format == 'json':
-            formatted_data = format_as_plugin_json(tag_data)
-        elif format == 'csv':
-            formatted_data = format_as_csv(tag_data)
-        elif format == 'txt':
-            formatted_data = format_as_text(tag_data)
+        formatters = {
+            'json': format_as_plugin_json,
+            'csv': iter_csv_rows,  # rows are generated lazily while writing
+            'txt': format_as_text,
+        }
+        formatted_data: Any = formatters[format](tag_data)
 
         # Save or print output
         if output:
@@ -123,18 +189,7 @@ def export(vault_path, output, format, tag_types, exclude, verbose, quiet, no_fi
             if not quiet:
                 print(f"Output saved to: {output}")
         else:
-            if format == 'json':
-                import json
-                print(json.dumps(formatted_data, indent=2, ensure_ascii=False))
-            elif format == 'csv':
-                import csv
-                import io
-                output_buffer = io.StringIO()
-                writer = csv.writer(output_buffer)
-                writer.writerows(formatted_data)
-                print(output_buffer.getvalue().strip())
-            elif format == 'txt':
-                print(formatted_data)
+            _STDOUT_PRINTERS[format](formatted_data)
 
         # Print summary if not quiet
         if not quiet and output:
@@ -151,7 +206,8 @@ def export(vault_path, output, format, tag_types, exclude, verbose, quiet, no_fi
 @click.argument('new_tag')
 @click.option('--tag-types', type=click.Choice(['both', 'frontmatter', 'inline']), default='frontmatter', help='Tag types to process (default: frontmatter)')
 @click.option('--execute', is_flag=True, help='REQUIRED to actually apply changes. Without this flag, runs in preview mode')
-def rename(vault_path, old_tag, new_tag, tag_types, execute):
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for large vaults (0 = all cores)')
+def rename(vault_path, old_tag, new_tag, tag_types, execute, jobs):
     """Rename a tag across all files in the vault.
 
     VAULT_PATH: Path to the Obsidian vault directory (defaults to current directory)
@@ -162,7 +218,9 @@ def rename(vault_path, old_tag, new_tag, tag_types, execute):
 
     By default, runs in preview mode (dry-run). Use --execute to apply changes.
     """
-    operation = RenameOperation(vault_path, old_tag, new_tag, dry_run=not execute, tag_types=tag_types)
+    from .core.operations.tag_operations import RenameOperation
+
+    operation = RenameOperation(vault_path, old_tag, new_tag, dry_run=not execute, tag_types=tag_types, jobs=jobs)
     operation.run_operation()
 
 
@@ -172,7 +230,8 @@ def rename(vault_path, old_tag, new_tag, tag_types, execute):
 @click.option('--into', 'target_tag', required=True, help='Target tag to merge into')
 @click.option('--tag-types', type=click.Choice(['both', 'frontmatter', 'inline']), default='frontmatter', help='Tag types to process (default: frontmatter)')
 @click.option('--execute', is_flag=True, help='REQUIRED to actually apply changes. Without this flag, runs in preview mode')
-def merge(vault_path, source_tags, target_tag, tag_types, execute):
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for large vaults (0 = all cores)')
+def merge(vault_path, source_tags, target_tag, tag_types, execute, jobs):
     """Merge multiple tags into a single tag.
 
     VAULT_PATH: Path to the Obsidian vault directory (defaults to current directory)
@@ -181,7 +240,9 @@ def merge(vault_path, source_tags, target_tag, tag_types, execute):
 
     By default, runs in preview mode (dry-run). Use --execute to apply changes.
     """
-    operation = MergeOperation(vault_path, list(source_tags), target_tag, dry_run=not execute, tag_types=tag_types)
+    from .core.operations.tag_operations import MergeOperation
+
+    operation = MergeOperation(vault_path, list(source_tags), target_tag, dry_run=not execute, tag_types=tag_types, jobs=jobs)
     operation.run_operation()
 
 
@@ -190,7 +251,8 @@ def merge(vault_path, source_tags, target_tag, tag_types, execute):
 @click.argument('operations_file', type=click.Path(exists=True, file_okay=True, dir_okay=False))
 @click.option('--execute', is_flag=True, help='REQUIRED to actually apply changes. Without this flag, runs in preview mode (dry-run)')
 @click.option('--tag-types', type=click.Choice(['both', 'frontmatter', 'inline']), default='frontmatter', help='Tag types to process (default: frontmatter)')
-def apply(vault_path, operations_file, execute, tag_types):
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for large vaults (0 = all cores)')
+def apply(vault_path, operations_file, execute, tag_types, jobs):
     """Apply tag operations from a YAML operations file.
 
     VAULT_PATH: Path to the Obsidian vault directory (defaults to current directory)
@@ -206,6 +268,8 @@ def apply(vault_path, operations_file, execute, tag_types):
     """
     import yaml
     from pathlib import Path
+    from .core.operations.tag_operations import RenameOperation, MergeOperation, DeleteOperation
+    from .core.operations.add_tags import AddTagsOperation
 
     # Load operations file
     ops_file = Path(operations_file)
@@ -278,7 +342,8 @@ def apply(vault_path, operations_file, execute, tag_types):
                     target_tag=target_tag,
                     dry_run=dry_run,
                     tag_types=tag_types,
-                    quiet=True
+                    quiet=True,
+                    jobs=jobs
                 )
                 result = operation.run_operation()
 
@@ -294,7 +359,8 @@ def apply(vault_path, operations_file, execute, tag_types):
                     new_tag=target_tag,
                     dry_run=dry_run,
                     tag_types=tag_types,
-                    quiet=True
+                    quiet=True,
+                    jobs=jobs
                 )
                 result = operation.run_operation()
 
@@ -304,7 +370,8 @@ def apply(vault_path, operations_file, execute, tag_types):
                     tags_to_delete=source_tags,
                     dry_run=dry_run,
                     tag_types=tag_types,
-                    quiet=True
+                    quiet=True,
+                    jobs=jobs
                 )
                 result = operation.run_operation()
 
@@ -322,7 +389,8 @@ def apply(vault_path, operations_file, execute, tag_types):
                     file_tag_map=file_tag_map,
                     dry_run=dry_run,
                     tag_types='frontmatter',  # add_tags only supports frontmatter
-                    quiet=True
+                    quiet=True,
+                    jobs=jobs
                 )
                 result = operation.run_operation()
 
@@ -375,7 +443,8 @@ def apply(vault_path, operations_file, execute, tag_types):
 @click.argument('tags_to_delete', nargs=-1, required=True)
 @click.option('--tag-types', type=click.Choice(['both', 'frontmatter', 'inline']), default='frontmatter', help='Tag types to process (default: frontmatter)')
 @click.option('--execute', is_flag=True, help='REQUIRED to actually apply changes. Without this flag, runs in preview mode')
-def delete(vault_path, tags_to_delete, tag_types, execute):
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for large vaults (0 = all cores)')
+def delete(vault_path, tags_to_delete, tag_types, execute, jobs):
     """Delete tags entirely from all files in the vault.
 
     VAULT_PATH: Path to the Obsidian vault directory (defaults to current directory)
@@ -386,7 +455,9 @@ def delete(vault_path, tags_to_delete, tag_types, execute):
     By default, runs in preview mode (dry-run). Use --execute to apply changes.
     Inline tag deletion may affect readability.
     """
-    operation = DeleteOperation(vault_path, list(tags_to_delete), dry_run=not execute, tag_types=tag_types)
+    from .core.operations.tag_operations import DeleteOperation
+
+    operation = DeleteOperation(vault_path, list(tags_to_delete), dry_run=not execute, tag_types=tag_types, jobs=jobs)
     operation.run_operation()
 
 
@@ -418,6 +489,7 @@ def add(vault_path, file_path, tags, execute):
       tagex tag add note.md python
     """
     from pathlib import Path
+    from .core.operations.add_tags import AddTagsOperation
 
     # Create file_tag_map for AddTagsOperation
     file_tag_map = {str(Path(file_path)): list(tags)}
@@ -443,7 +515,8 @@ def add(vault_path, file_path, tags, execute):
 @click.option('--recursive/--no-recursive', default=True, help='Search subdirectories (default: recursive)')
 @click.option('--quiet', is_flag=True, help='Reduce output verbosity')
 @click.option('--log', type=click.Path(), help='Save log to file')
-def fix(vault_path, filelist, execute, recursive, quiet, log):
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker threads for large vaults (0 = automatic)')
+def fix(vault_path, filelist, execute, recursive, quiet, log, jobs):
     """Fix duplicate 'tags:' fields in frontmatter.
 
     VAULT_PATH: Path to Obsidian vault directory (defaults to current directory)
@@ -462,7 +535,8 @@ def fix(vault_path, filelist, execute, recursive, quiet, log):
             execute=execute,
             recursive=recursive,
             quiet=quiet,
-            log_file=log
+            log_file=log,
+            jobs=jobs
         )
 
         # Exit with error code if there were errors
@@ -586,6 +660,7 @@ def verify(vault_path):
     """
     from pathlib import Path
     import yaml
+    from .core.parsers.frontmatter_parser import FrontmatterLoader
 
     vault = Path(vault_path)
 
@@ -611,7 +686,7 @@ def verify(vault_path):
                 if len(parts) >= 3:
                     frontmatter = parts[1]
                     try:
-                        yaml.safe_load(frontmatter)
+                        yaml.load(frontmatter, Loader=FrontmatterLoader)  # noqa: S506 - a SafeLoader
                     except yaml.YAMLError as e:
                         errors.append(f"{md_file.relative_to(vault)}: Invalid YAML frontmatter - {e}")
 
@@ -1069,10 +1144,12 @@ def edit(vault_path, file):
 @main.command()
 @click.argument('vault_path', type=click.Path(exists=True, file_okay=False, dir_okay=True), default='.', required=False)
 @click.option('--tag-types', type=click.Choice(['both', 'frontmatter', 'inline']), default='frontmatter', help='Tag types to process (default: frontmatter)')
-@click.option('--top', '-t', type=int, default=20, help='Number of top tags to show (default: 20)')
+@click.option('--top', '-t', type=click.IntRange(min=0), default=20, help='Number of top tags to show (default: 20)')
 @click.option('--format', '-f', type=click.Choice(['text', 'json']), default='text', help='Output format')
 @click.option('--no-filter', is_flag=True, help='Disable tag filtering (include all raw tags)')
-def stats(vault_path, tag_types, top, format, no_filter):
+@click.option('--no-cache', is_flag=True, help='Re-parse every file instead of reusing cached tags for unchanged files')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for parsing large vaults (0 = all cores)')
+def stats(vault_path, tag_types, top, format, no_filter, no_cache, jobs):
     """Display comprehensive tag statistics for the vault.
 
     VAULT_PATH: Path to the Obsidian vault directory (defaults to current directory)
@@ -1080,24 +1157,17 @@ def stats(vault_path, tag_types, top, format, no_filter):
     Shows tag counts, distribution patterns, and vault health metrics.
     """
     # Set up logging
-    logging.basicConfig(level=logging.WARNING)  # Suppress info logs for cleaner output
+    _configure_logging(logging.WARNING)  # Suppress info logs for cleaner output
 
     try:
-        # Initialize extractor
-        extractor = TagExtractor(vault_path, filter_tags=not no_filter, tag_types=tag_types)
-
-        # Extract tags
-        tag_data = extractor.extract_tags()
-
-        # Get basic statistics
-        basic_stats = extractor.get_statistics()
+        # Extract tags and basic statistics
+        tag_data, basic_stats = _extract_vault(vault_path, tag_types, no_filter, no_cache, jobs)
 
         # Calculate comprehensive statistics
         stats_result = calculate_tag_statistics(tag_data, basic_stats, top)
 
         if format == 'json':
-            import json
-            print(json.dumps(stats_result, indent=2, ensure_ascii=False))
+            _print_json_stdout(stats_result)
         else:
             print_tag_statistics(stats_result, tag_types)
 
@@ -1358,7 +1428,8 @@ def pairs(input_path, tag_types, min_pairs, no_filter):
 @click.option('--no-filter', is_flag=True, help='Disable noise filtering')
 @click.option('--no-sklearn', is_flag=True, help='Force use of pattern-based fallback instead of embeddings')
 @click.option('--export', type=click.Path(), help='Export operations to YAML file')
-def merges(input_path, tag_types, min_usage, no_filter, no_sklearn, export):
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, help='Worker processes for large tag sets (0 = all cores)')
+def merges(input_path, tag_types, min_usage, no_filter, no_sklearn, export, jobs):
     """Suggest tag merge opportunities.
 
     INPUT_PATH: Vault directory or JSON file containing tag data (defaults to current directory)
@@ -1402,7 +1473,7 @@ def merges(input_path, tag_types, min_usage, no_filter, no_sklearn, export):
     # Create a minimal args object for the suggest_merges function
     args = argparse.Namespace(no_sklearn=no_sklearn)
 
-    suggestions = suggest_merges(tag_stats, min_usage, args)
+    suggestions = suggest_merges(tag_stats, min_usage, args, jobs=jobs)
 
     # Filter excluded tags from suggestions
     if excluded_tags:
@@ -1521,81 +1592,125 @@ def calculate_tag_statistics(tag_data, basic_stats, top_count):
 
     # Basic counts
     total_tags = len(tag_data)
-    # tag_data is a dict where keys are tag names and values are tag info
-    tag_counts = [(tag_name, tag_info['count']) for tag_name, tag_info in tag_data.items()]
-    tag_counts.sort(key=lambda x: x[1], reverse=True)
-
-    # Usage distribution analysis
-    usage_counts = [count for _, count in tag_counts]
+    # tag_data is a dict where keys are tag names and values are tag info.
+    # Only the top_count most-used tags are shown, so select them with a heap instead of sorting every tag.
+    top_tags = [
+        (tag_name, tag_info['count'])
+        for tag_name, tag_info in heapq.nlargest(top_count, tag_data.items(), key=lambda kv: kv[1]['count'])
+    ]
+
+    # Usage distribution analysis (sorted descending for the concentration score)
+    usage_counts = sorted((tag_info['count'] for tag_info in tag_data.values()), reverse=True)
     usage_counter = Counter(usage_counts)
 
     # Singletons, doubletons, tripletons
-    singletons = usage_counter[1] if 1 in usage_counter else 0
-    doubletons = usage_counter[2] if 2 in usage_counter else 0
-    tripletons = usage_counter[3] if 3 in usage_counter else 0
+    singletons = usage_counter[1]
+    doubletons = usage_counter[2]
+    tripletons = usage_counter[3]
+    frequent_tags = total_tags - singletons - doubletons - tripletons
+
+    # total_tags > 0 is guaranteed by the early return above
+    pct_per_tag = 100.0 / total_tags
 
     # Calculate tag health metrics
     total_tag_uses = sum(usage_counts)
     files_processed = basic_stats.get('files_processed', 0)
 
     # Diversity metrics
-    shannon_entropy = calculate_shannon_entropy(usage_counts) if usage_counts else 0
+    # Convert counts to an array once so entropy and Gini share it
+    np = _load_numpy()
+    count_values = np.asarray(usage_counts, dtype=np.float64) if np is not None else usage_counts
+    shannon_entropy = calculate_shannon_entropy(count_values) if usage_counts else 0
     tag_density = total_tag_uses / files_processed if files_processed > 0 else 0
 
-    # Coverage analysis - how many files have tags
-    tagged_files = set()
-    for tag_info in tag_data.values():
-        tagged_files.update(tag_info.get('files', []))
+    # Coverage analysis - how many files have tags (counted during extraction
+    # when available, otherwise derived from the per-tag file sets)
+    tagged_file_count = basic_stats.get('tagged_file_count')
+    if tagged_file_count is None:
+        tagged_file_count = len(set().union(*(tag_info.get('files', ()) for tag_info in tag_data.values())))
 
-    tag_coverage = len(tagged_files) / files_processed if files_processed > 0 else 0
+    tag_coverage = tagged_file_count / files_processed if files_processed > 0 else 0
 
     # Concentration analysis (Gini-like metric)
-    concentration_score = calculate_concentration_score(usage_counts)
+    concentration_score = calculate_concentration_score(count_values, presorted=True)
 
     return {
         "basic": basic_stats,
         "total_tags": total_tags,
         "total_tag_uses": total_tag_uses,
         "tag_distribution": {
-            "singletons": {"count": singletons, "percentage": singletons/total_tags*100 if total_tags > 0 else 0},
-            "doubletons": {"count": doubletons, "percentage": doubletons/total_tags*100 if total_tags > 0 else 0},
-            "tripletons": {"count": tripletons, "percentage": tripletons/total_tags*100 if total_tags > 0 else 0},
-            "frequent_tags": {"count": total_tags - singletons - doubletons - tripletons,
-                            "percentage": (total_tags - singletons - doubletons - tripletons)/total_tags*100 if total_tags > 0 else 0}
+            "singletons": {"count": singletons, "percentage": singletons * pct_per_tag},
+            "doubletons": {"count": doubletons, "percentage": doubletons * pct_per_tag},
+            "tripletons": {"count": tripletons, "percentage": tripletons * pct_per_tag},
+            "frequent_tags": {"count": frequent_tags, "percentage": frequent_tags * pct_per_tag}
         },
         "vault_health": {
             "tag_density": round(tag_density, 2),
             "tag_coverage": round(tag_coverage * 100, 1),
             "diversity_score": round(shannon_entropy, 2),
             "concentration_score": round(concentration_score, 2),
-            "tagged_files": len(tagged_files),
-            "untagged_files": files_processed - len(tagged_files)
+            "tagged_files": tagged_file_count,
+            "untagged_files": files_processed - tagged_file_count
         },
-        "top_tags": tag_counts[:top_count],
-        "usage_distribution": dict(sorted(usage_counter.items())[:20])  # Top 20 usage patterns
+        "top_tags": top_tags,
+        "usage_distribution": dict(heapq.nsmallest(20, usage_counter.items()))  # 20 lowest usage counts
     }
 
 
+def _load_numpy():
+    """Return numpy if it is installed, otherwise None."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
 def calculate_shannon_entropy(usage_counts):
     """Calculate Shannon entropy for tag diversity."""
-    if not usage_counts:
+    if len(usage_counts) == 0:
         return 0
 
+    np = _load_numpy()
+    if np is not None:
+        counts = np.asarray(usage_counts, dtype=np.float64)
+        counts = counts[counts > 0]
+        if counts.size == 0:
+            return 0
+        p = counts / counts.sum()
+        return 0.0 - float((p * np.log2(p)).sum())
+
     total = sum(usage_counts)
-    entropy = 0
-    for count in usage_counts:
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
-    return entropy
+    if total == 0:
+        return 0
+
+    log2 = math.log2
+    inv_total = 1.0 / total
+    return 0.0 - sum(p * log2(p) for p in (count * inv_total for count in usage_counts if count > 0))
+
 
+def calculate_concentration_score(usage_counts, presorted=False):
+    """Calculate how concentrated tag usage is (0-1, where 1 is maximum concentration).
 
-def calculate_concentration_score(usage_counts):
-    """Calculate how concentrated tag usage is (0-1, where 1 is maximum concentration)."""
+    Pass presorted=True when usage_counts is already sorted in descending order
+    to skip the internal sort.
+    """
     if len(usage_counts) <= 1:
         return 1.0
 
-    sorted_counts = sorted(usage_counts, reverse=True)
+    n = len(usage_counts)
+    np = _load_numpy()
+    if np is not None:
+        counts = np.asarray(usage_counts, dtype=np.float64)
+        if not presorted:
+            counts = np.sort(counts)[::-1]
+        total = counts.sum()
+        if total == 0:
+            return 0
+        weights = 2 * np.arange(1, n + 1) - n - 1
+        return abs(float(weights.dot(counts) / (total * n)))
+
+    sorted_counts = usage_counts if presorted else sorted(usage_counts, reverse=True)
     total = sum(sorted_counts)
 
     # Calculate cumulative distribution
@@ -1603,109 +1718,132 @@ def calculate_concentration_score(usage_counts):
     gini_sum = 0
     for i, count in enumerate(sorted_counts):
         cumulative += count
-        gini_sum += (2 * (i + 1) - len(sorted_counts) - 1) * count
+        gini_sum += (2 * (i + 1) - n - 1) * count
 
     if total == 0:
         return 0
 
-    gini = gini_sum / (total * len(sorted_counts))
+    gini = gini_sum / (total * n)
     return abs(gini)
 
 
 def print_tag_statistics(stats, tag_types):
-    """Print formatted tag statistics."""
+    """Print formatted tag statistics.
+
+    The report is assembled as a list of lines and written to stdout in a
+    single call.
+    """
     basic = stats["basic"]
     vault_health = stats["vault_health"]
     distribution = stats["tag_distribution"]
 
-    print("Vault Tag Statistics")
-    print("=" * 50)
+    out: List[str] = []
+    append = out.append
+
+    append("Vault Tag Statistics")
+    append("=" * 50)
 
     # Basic information
-    print(f"\nVault Overview:")
-    print(f"   Path: {basic['vault_path']}")
-    print(f"   Tag types: {tag_types}")
-    print(f"   Files processed: {basic['files_processed']:,}")
-    print(f"   Processing errors: {basic['errors']}")
+    append("\nVault Overview:")
+    append(f"   Path: {basic['vault_path']}")
+    append(f"   Tag types: {tag_types}")
+    append(f"   Files processed: {basic['files_processed']:,}")
+    append(f"   Processing errors: {basic['errors']}")
 
     # Core metrics
-    print(f"\nTag Metrics:")
-    print(f"   Total unique tags: {stats['total_tags']:,}")
-    print(f"   Total tag uses: {stats['total_tag_uses']:,}")
-    print(f"   Average tags per file: {vault_health['tag_density']}")
+    append("\nTag Metrics:")
+    append(f"   Total unique tags: {stats['total_tags']:,}")
+    append(f"   Total tag uses: {stats['total_tag_uses']:,}")
+    append(f"   Average tags per file: {vault_health['tag_density']}")
 
     # Coverage
-    print(f"\nTag Coverage:")
-    print(f"   Files with tags: {vault_health['tagged_files']:,} ({vault_health['tag_coverage']}%)")
-    print(f"   Files without tags: {vault_health['untagged_files']:,}")
+    append("\nTag Coverage:")
+    append(f"   Files with tags: {vault_health['tagged_files']:,} ({vault_health['tag_coverage']}%)")
+    append(f"   Files without tags: {vault_health['untagged_files']:,}")
 
     # Distribution analysis
-    print(f"\nTag Distribution:")
-    print(f"   Singletons (used once): {distribution['singletons']['count']:,} ({distribution['singletons']['percentage']:.1f}%)")
-    print(f"   Doubletons (used twice): {distribution['doubletons']['count']:,} ({distribution['doubletons']['percentage']:.1f}%)")
-    print(f"   Tripletons (used 3x): {distribution['tripletons']['count']:,} ({distribution['tripletons']['percentage']:.1f}%)")
-    print(f"   Frequent tags (4+ uses): {distribution['frequent_tags']['count']:,} ({distribution['frequent_tags']['percentage']:.1f}%)")
+    append("\nTag Distribution:")
+    append(f"   Singletons (used once): {distribution['singletons']['count']:,} ({distribution['singletons']['percentage']:.1f}%)")
+    append(f"   Doubletons (used twice): {distribution['doubletons']['count']:,} ({distribution['doubletons']['percentage']:.1f}%)")
+    append(f"   Tripletons (used 3x): {distribution['tripletons']['count']:,} ({distribution['tripletons']['percentage']:.1f}%)")
+    append(f"   Frequent tags (4+ uses): {distribution['frequent_tags']['count']:,} ({distribution['frequent_tags']['percentage']:.1f}%)")
 
     # Health metrics
-    print(f"\nVault Health:")
-    print(f"   Diversity score: {vault_health['diversity_score']:.2f} (higher = more diverse)")
-    print(f"   Concentration score: {vault_health['concentration_score']:.2f} (lower = more balanced)")
+    append("\nVault Health:")
+    append(f"   Diversity score: {vault_health['diversity_score']:.2f} (higher = more diverse)")
+    append(f"   Concentration score: {vault_health['concentration_score']:.2f} (lower = more balanced)")
 
     # Health interpretation
-    interpret_vault_health(vault_health, distribution, stats['total_tags'])
+    out.extend(vault_health_assessment_lines(vault_health, distribution, stats['total_tags']))
 
     # Top tags
-    print(f"\nTop {len(stats['top_tags'])} Most Used Tags:")
-    for i, (tag, count) in enumerate(stats['top_tags'], 1):
-        percentage = count / stats['total_tag_uses'] * 100
-        print(f"   {i:2d}. {tag:<20} {count:4d} uses ({percentage:4.1f}%)")
+    append(f"\nTop {len(stats['top_tags'])} Most Used Tags:")
+    total_tag_uses = stats['total_tag_uses']
+    out.extend(
+        f"   {i:2d}. {tag:<20} {count:4d} uses ({count / total_tag_uses * 100:4.1f}%)"
+        for i, (tag, count) in enumerate(stats['top_tags'], 1)
+    )
 
     # Usage patterns
-    print(f"\nUsage Patterns:")
+    append("\nUsage Patterns:")
     usage_dist = stats['usage_distribution']
-    for usage_count in sorted(usage_dist.keys())[:10]:  # Show first 10 patterns
-        tag_count = usage_dist[usage_count]
-        print(f"   {tag_count:3d} tags used {usage_count:2d}x each")
+    out.extend(
+        f"   {usage_dist[usage_count]:3d} tags used {usage_count:2d}x each"
+        for usage_count in sorted(usage_dist.keys())[:10]  # Show first 10 patterns
+    )
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def interpret_vault_health(health, distribution, total_tags):
     """Provide health interpretation and recommendations."""
-    print(f"\nHealth Assessment:")
+    sys.stdout.write("\n".join(vault_health_assessment_lines(health, distribution, total_tags)) + "\n")
+
+
+_DIVERSITY_ASSESSMENTS = [
+    (0.8, "   + High tag diversity - well-distributed usage"),
+    (0.6, "   + Good tag diversity - reasonably balanced"),
+    (0.4, "   * Moderate diversity - some tags dominate"),
+    (0.0, "   - Low diversity - heavily concentrated on few tags"),
+]
+
+
+def vault_health_assessment_lines(health, distribution, total_tags):
+    """Build the health assessment section as a list of lines."""
+    lines = ["\nHealth Assessment:"]
 
     # Tag coverage assessment
     coverage = health['tag_coverage']
     if coverage >= 80:
-        print("   + Excellent tag coverage - most files are tagged")
+        lines.append("   + Excellent tag coverage - most files are tagged")
     elif coverage >= 60:
-        print("   + Good tag coverage - majority of files tagged")
+        lines.append("   + Good tag coverage - majority of files tagged")
     elif coverage >= 40:
-        print("   * Moderate tag coverage - consider tagging more files")
+        lines.append("   * Moderate tag coverage - consider tagging more files")
     else:
-        print("   - Low tag coverage - many files lack tags")
+        lines.append("   - Low tag coverage - many files lack tags")
 
     # Singleton analysis
     singleton_pct = distribution['singletons']['percentage']
     if singleton_pct >= 50:
-        print("   - High singleton ratio - many tags used only once (consider consolidation)")
+        lines.append("   - High singleton ratio - many tags used only once (consider consolidation)")
     elif singleton_pct >= 30:
-        print("   * Moderate singleton ratio - some cleanup opportunities")
+        lines.append("   * Moderate singleton ratio - some cleanup opportunities")
     else:
-        print("   + Good tag reuse - low singleton ratio")
+        lines.append("   + Good tag reuse - low singleton ratio")
 
     # Diversity assessment
     diversity = health['diversity_score']
-    if total_tags > 0:
-        max_diversity = math.log2(total_tags)
-        diversity_ratio = diversity / max_diversity if max_diversity > 0 else 0
-
-        if diversity_ratio >= 0.8:
-            print("   + High tag diversity - well-distributed usage")
-        elif diversity_ratio >= 0.6:
-            print("   + Good tag diversity - reasonably balanced")
-        elif diversity_ratio >= 0.4:
-            print("   * Moderate diversity - some tags dominate")
-        else:
-            print("   - Low diversity - heavily concentrated on few tags")
+    if diversity <= 0 or total_tags < 2:
+        lines.append("   * Insufficient data for diversity assessment")
+        return lines
+
+    diversity_ratio = diversity / math.log2(total_tags)
+    for threshold, message in _DIVERSITY_ASSESSMENTS:
+        if diversity_ratio >= threshold:
+            lines.append(message)
+            break
+    return lines
 
 
 @analyze.command()
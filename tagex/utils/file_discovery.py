@@ -1,8 +1,9 @@
 """
 File discovery utilities for finding markdown files in an Obsidian vault.
 """
+import os
 from pathlib import Path
-from typing import List, Set, Union, Optional
+from typing import Iterator, List, Set, Union, Optional
 
 
 def find_markdown_files(vault_path: str, exclude_patterns: Union[Set[str], List[str], None] = None, use_config: bool = True) -> List[Path]:
@@ -64,6 +65,43 @@ def find_markdown_files(vault_path: str, exclude_patterns: Union[Set[str], List[
     return sorted(markdown_files)
 
 
+def iter_files_with_suffix(directory: Path, suffix: str, recursive: bool = True) -> Iterator[Path]:
+    """
+    Yield the regular files in directory whose names end with suffix.
+
+    Each directory is listed once with os.scandir, and only matching entries
+    become Path objects. Subdirectories are visited depth first in scandir
+    order; as with Path.rglob, symlinked directories are not descended into.
+
+    Args:
+        directory: Directory to search
+        suffix: File name ending to match, e.g. '.md'
+        recursive: Whether to search subdirectories
+
+    Returns:
+        Iterator over matching file paths
+    """
+    pending = [str(directory)]
+    while pending:
+        matches = []
+        subdirectories = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
+                        elif entry.name.endswith(suffix) and entry.is_file():
+                            matches.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        yield from matches
+        if recursive:
+            pending.extend(reversed(subdirectories))
+
+
 def get_relative_path(file_path: Path, vault_root: Path) -> str:
     """
     Get relative path from vault root for a file.
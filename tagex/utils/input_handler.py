@@ -47,6 +47,29 @@ def load_or_extract_tags(input_path: str, tag_types: str = 'frontmatter',
     raise ValueError(f"Invalid input path: {input_path}")
 
 
+def read_json_file(json_file: str) -> Any:
+    """Parse a JSON file as UTF-8, using orjson when it is installed.
+
+    orjson parses the raw bytes without a separate decode step. Its
+    JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    malformed files the same way either way.
+
+    Args:
+        json_file: Path to the JSON file
+
+    Returns:
+        The parsed JSON value
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    with open(json_file, 'rb') as f:
+        return orjson.loads(f.read())
+
+
 def _load_json_file(json_file: str) -> List[Dict[str, Any]]:
     """Load tag data from JSON file.
 
@@ -56,8 +79,7 @@ def _load_json_file(json_file: str) -> List[Dict[str, Any]]:
     Returns:
         List of tag dictionaries
     """
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    data = read_json_file(json_file)
 
     # Handle both old and new formats
     # Old format: direct list
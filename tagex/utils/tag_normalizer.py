@@ -1,10 +1,14 @@
 """
 Tag normalization utilities for consistent tag processing.
 """
+from functools import lru_cache
 from typing import List, Set
 import re
 
 
+# The same raw tag strings recur across every file of a vault, so each
+# distinct spelling is normalized once
+@lru_cache(maxsize=8192)
 def normalize_tag(tag: str) -> str:
     """
     Normalize a single tag to consistent format.
@@ -51,9 +55,11 @@ def normalize_tags(tags: List[str]) -> List[str]:
     
     # Normalize each tag
     normalized_tags = []
+    seen = set()
     for tag in tags:
         normalized = normalize_tag(tag)
-        if normalized and normalized not in normalized_tags:
+        if normalized and normalized not in seen:
+            seen.add(normalized)
             normalized_tags.append(normalized)
     
     return normalized_tags
@@ -135,6 +141,25 @@ def flatten_nested_tags(tags: List[str]) -> List[str]:
     return deduplicate_tags(flattened)
 
 
+# Rule 4 noise patterns, searched as one alternation instead of eight patterns
+NOISE_TAG_RE = re.compile(
+    '|'.join([
+        r'^[a-f0-9]{8,}$',  # Long hex strings
+        r'^[0-9a-f]{2,}-[0-9a-f]{2,}',  # UUID-like patterns
+        r'dispatcher',  # Technical dispatcher tags
+        r'^(dom|util|fs|stream|event|parameter)-',  # Technical prefixes
+        r'^l[0-9]+$',  # Line number patterns like l123
+        r'^[0-9]+px$',  # CSS pixel values
+        r'^v[0-9]+\.[0-9]+\.[0-9]+',  # Full semantic versions only (keep shorter versions like v1.2)
+        r'^[a-zA-Z]{1,2}$',  # Very short 1-2 letter-only tags (allows v1, but not tags with digits)
+    ]),
+    re.IGNORECASE
+)
+NON_NUMERIC_RE = re.compile(r'[^\d_\-/.]+')
+TAG_CHARS_RE = re.compile(r'^[\w\-/.]+$')
+NESTED_PART_RE = re.compile(r'^[a-zA-Z0-9_\-]+$')
+
+
 def is_valid_tag(tag: str) -> bool:
     """
     Comprehensive tag validation to filter out noise.
@@ -147,7 +172,14 @@ def is_valid_tag(tag: str) -> bool:
     """
     if not tag or not isinstance(tag, str):
         return False
-    
+    return _is_valid_tag_string(tag)
+
+
+# Validation runs for every tag occurrence during extraction and analysis,
+# so each distinct spelling is checked once
+@lru_cache(maxsize=8192)
+def _is_valid_tag_string(tag: str) -> bool:
+    """is_valid_tag for a non-empty string."""
     # Remove leading # if present for validation
     clean_tag = tag.lstrip('#').strip()
     if not clean_tag:
@@ -166,28 +198,16 @@ def is_valid_tag(tag: str) -> bool:
         return False
     
     # Rule 4: Filter technical noise patterns
-    noise_patterns = [
-        r'^[a-f0-9]{8,}$',  # Long hex strings
-        r'^[0-9a-f]{2,}-[0-9a-f]{2,}',  # UUID-like patterns
-        r'dispatcher',  # Technical dispatcher tags
-        r'^(dom|util|fs|stream|event|parameter)-',  # Technical prefixes
-        r'^l[0-9]+$',  # Line number patterns like l123
-        r'^[0-9]+px$',  # CSS pixel values
-        r'^v[0-9]+\.[0-9]+\.[0-9]+',  # Full semantic versions only (keep shorter versions like v1.2)
-        r'^[a-zA-Z]{1,2}$',  # Very short 1-2 letter-only tags (allows v1, but not tags with digits)
-    ]
-    
-    for pattern in noise_patterns:
-        if re.search(pattern, clean_tag, re.IGNORECASE):
-            return False
+    if NOISE_TAG_RE.search(clean_tag):
+        return False
     
     # Rule 5: Must contain at least one letter (including international letters)
-    if not re.search(r'[^\d_\-/.]+', clean_tag):
+    if not NON_NUMERIC_RE.search(clean_tag):
         return False
     
     # Rule 6: Valid character set (letters, digits, underscore, dash, slash, dot)
     # Allow international characters by using \w+ but filtering out purely numeric/symbol tags
-    if not re.match(r'^[\w\-/.]+$', clean_tag):
+    if not TAG_CHARS_RE.match(clean_tag):
         return False
     
     # Rule 7: Slash validation for nested tags
@@ -198,7 +218,7 @@ def is_valid_tag(tag: str) -> bool:
             return False
         # Each part must be valid
         for part in parts:
-            if not re.match(r'^[a-zA-Z0-9_\-]+$', part):
+            if not NESTED_PART_RE.match(part):
                 return False
     
     return True
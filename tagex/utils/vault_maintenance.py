@@ -1,9 +1,12 @@
 """Vault maintenance utilities for cleanup operations."""
 
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
+from .file_discovery import iter_files_with_suffix
+
 
 class BakRemover:
   """Remove .bak backup files safely."""
@@ -16,6 +19,8 @@ class BakRemover:
       'deleted': 0,
       'errors': 0
     }
+    self._dir_fd: Optional[int] = None
+    self._dir_path: Optional[Path] = None
 
   def log(self, message: str, level: str = "INFO"):
     """Log a message."""
@@ -26,11 +31,7 @@ class BakRemover:
 
   def find_bak_files(self, directory: Path, recursive: bool = True) -> List[Path]:
     """Find all .bak files in directory."""
-    if recursive:
-      bak_files = list(directory.rglob("**/*.bak"))
-    else:
-      bak_files = list(directory.glob("*.bak"))
-    return sorted(bak_files)
+    return sorted(iter_files_with_suffix(directory, '.bak', recursive=recursive))
 
   def remove_files(self, directory: Path, recursive: bool = True):
     """Remove .bak files from directory."""
@@ -51,23 +52,56 @@ class BakRemover:
 
     self.log(f"Found {len(bak_files)} .bak files:\n")
 
-    for bak_file in bak_files:
-      try:
-        self.log(f"  {bak_file.name}")
+    # Sorted paths can put a subdirectory's files between its parent's;
+    # group them by directory so unlink opens each directory only once
+    bak_files.sort(key=lambda path: (path.parent, path.name))
+
+    try:
+      for bak_file in bak_files:
+        try:
+          self.log(f"  {bak_file.name}")
 
-        if self.dry_run:
-          self.log(f"    [DRY-RUN] Would delete", "DRYRUN")
-        else:
-          bak_file.unlink()
-          self.stats['deleted'] += 1
-          self.log(f"    ✓ Deleted", "SUCCESS")
+          if self.dry_run:
+            self.log(f"    [DRY-RUN] Would delete", "DRYRUN")
+          else:
+            self.unlink(bak_file)
+            self.stats['deleted'] += 1
+            self.log(f"    ✓ Deleted", "SUCCESS")
 
-      except Exception as e:
-        self.log(f"    ERROR: {e}", "ERROR")
-        self.stats['errors'] += 1
+        except Exception as e:
+          self.log(f"    ERROR: {e}", "ERROR")
+          self.stats['errors'] += 1
+    finally:
+      self._close_dir()
 
     self.print_summary()
 
+  def unlink(self, file_path: Path):
+    """
+    Delete a file by name relative to an open descriptor of its directory.
+
+    unlinkat skips resolving the whole path again for every file. One
+    descriptor is kept open and only replaced when the directory changes,
+    so callers should pass a directory's files together; call _close_dir
+    when done.
+    Platforms without dir_fd support delete by path.
+    """
+    if os.unlink not in os.supports_dir_fd:
+      file_path.unlink()
+      return
+    if file_path.parent != self._dir_path:
+      self._close_dir()
+      self._dir_fd = os.open(file_path.parent, os.O_RDONLY)
+      self._dir_path = file_path.parent
+    os.unlink(file_path.name, dir_fd=self._dir_fd)
+
+  def _close_dir(self):
+    """Close the directory descriptor kept open by unlink, if any."""
+    if self._dir_fd is not None:
+      os.close(self._dir_fd)
+    self._dir_fd = None
+    self._dir_path = None
+
   def print_summary(self):
     """Print summary statistics."""
     self.log(f"\n{'='*70}")
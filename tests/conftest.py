@@ -11,6 +11,13 @@ from pathlib import Path
 import json
 
 
+@pytest.fixture(autouse=True)
+def isolated_extraction_cache(tmp_path, monkeypatch):
+    """Keep the CLI extraction cache out of the user's real app directory."""
+    import click
+    monkeypatch.setattr(click, 'get_app_dir', lambda app_name, **kwargs: str(tmp_path / 'app_dir'))
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -2,6 +2,7 @@
 Tests for tag analysis tools - co-occurrence analysis and filtering.
 """
 
+import argparse
 import pytest
 import json
 import subprocess
@@ -34,6 +35,64 @@ class TestPairAnalyzer:
         help_text = result.output
         assert "pair" in help_text.lower() or "analysis" in help_text.lower()
     
+    def test_build_file_to_tags_map_sets_and_noise_filter(self):
+        """Test the map holds each file's tags as a set, with noise tags dropped when filtering."""
+        from tagex.analysis.pair_analyzer import build_file_to_tags_map
+
+        tag_data = [
+            {"tag": "python", "relativePaths": ["a.md", "b.md", "a.md"]},
+            {"tag": "123", "relativePaths": ["a.md"]},
+            {"tag": "notes", "relativePaths": ["b.md"]},
+        ]
+
+        assert build_file_to_tags_map(tag_data) == {"a.md": {"python", "123"}, "b.md": {"python", "notes"}}
+        assert build_file_to_tags_map(tag_data, filter_noise=True) == {"a.md": {"python"}, "b.md": {"python", "notes"}}
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_calculate_pairs_counts_and_order(self, monkeypatch, use_numpy):
+        """Test pair counts, the min_pairs cut-off and first-seen order, with and without numpy."""
+        from tagex.analysis import pair_analyzer
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(pair_analyzer, 'NUMPY_AVAILABLE', False)
+
+        file_to_tags = {
+            "a.md": {"work", "notes", "ideas"},
+            "b.md": {"work", "notes"},
+            "c.md": {"solo"},
+            "d.md": {"ideas", "work"},
+            "e.md": set(),
+        }
+
+        pairs = pair_analyzer.calculate_pairs(file_to_tags, min_pairs=1)
+
+        assert list(pairs.items()) == [
+            (("ideas", "notes"), 1),
+            (("ideas", "work"), 2),
+            (("notes", "work"), 2),
+        ]
+        assert pair_analyzer.calculate_pairs(file_to_tags, min_pairs=2) == {
+            ("ideas", "work"): 2,
+            ("notes", "work"): 2,
+        }
+        assert pair_analyzer.calculate_pairs({"c.md": {"solo"}}) == {}
+
+    def test_find_tag_clusters_long_chain(self):
+        """Test a chain of strongly connected tags longer than the recursion limit forms one cluster."""
+        import sys
+        from tagex.analysis.pair_analyzer import find_tag_clusters
+
+        length = sys.getrecursionlimit() + 100
+        pairs = {(f"t{i:06}", f"t{i + 1:06}"): 5 for i in range(length)}
+        pairs[("a", "b")] = 1  # Too weak to join anything
+
+        clusters = find_tag_clusters(pairs)
+
+        assert len(clusters) == 1
+        assert len(clusters[0]) == length + 1
+
     def test_pair_analysis_with_sample_data(self, temp_dir, sample_pair_data):
         """Test co-occurrence analysis with sample data."""
         from tagex.main import main as cli
@@ -116,6 +175,133 @@ class TestPairAnalyzer:
 class TestAnalysisDataProcessing:
     """Tests for analysis data processing functionality."""
     
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_load_tag_json_with_and_without_orjson(self, temp_dir, monkeypatch, use_orjson):
+        """Test both tag JSON layouts load as UTF-8 and malformed files raise JSONDecodeError."""
+        from tagex.utils.input_handler import load_or_extract_tags
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, 'orjson', None)
+
+        tags = [{"tag": "café", "tagCount": 1, "relativePaths": ["notes/été.md"]}]
+        list_file = temp_dir / "list.json"
+        list_file.write_bytes(json.dumps(tags, ensure_ascii=False).encode("utf-8"))
+        dict_file = temp_dir / "dict.json"
+        dict_file.write_bytes(json.dumps({"tags": tags}, ensure_ascii=False).encode("utf-8"))
+        bad_file = temp_dir / "bad.json"
+        bad_file.write_text("[{")
+
+        assert load_or_extract_tags(str(list_file)) == tags
+        assert load_or_extract_tags(str(dict_file)) == tags
+        with pytest.raises(json.JSONDecodeError):
+            load_or_extract_tags(str(bad_file))
+
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_find_similar_tags_groups(self, monkeypatch, use_rapidfuzz):
+        """Test similar-name groups, case-insensitive and skipping short tags, with and without rapidfuzz."""
+        from tagex.analysis import merge_analyzer
+
+        if use_rapidfuzz:
+            pytest.importorskip("rapidfuzz")
+            monkeypatch.setattr(merge_analyzer, 'SIMILARITY_BLOCK_ROWS', 2)
+        else:
+            monkeypatch.setattr(merge_analyzer, 'RAPIDFUZZ_AVAILABLE', False)
+
+        tags = ["writing", "books", "writng", "Writing", "tech", "techs", "project",
+                "book", "projects", "abcd", "abce", "abc", "abd"]
+
+        assert merge_analyzer.find_similar_tags(tags) == [
+            ["writing", "writng", "Writing"], ["books", "book"], ["tech", "techs"], ["project", "projects"]
+        ]
+        assert merge_analyzer.find_similar_tags(tags, 0.75)[-1] == ["abcd", "abce"]
+
+    def test_semantic_duplicates_independent_of_block_size(self, monkeypatch):
+        """Test TF-IDF groups and scores are the same however many rows each similarity block holds."""
+        pytest.importorskip("sklearn")
+        from tagex.analysis import merge_analyzer
+
+        tags = ["book", "books", "writing", "writings", "music", "musics", "tech", "ideas", "idea"]
+        tag_stats = {tag: {'count': len(tag), 'files': set()} for tag in tags}
+
+        results = []
+        for block_rows in (1, 4, 512):
+            monkeypatch.setattr(merge_analyzer, 'SIMILARITY_BLOCK_ROWS', block_rows)
+            results.append(merge_analyzer.find_semantic_duplicates_embedding(tag_stats))
+
+        assert results[0]
+        assert results[0] == results[1] == results[2]
+
+    def test_find_variant_patterns_groups_in_first_seen_order(self):
+        """Test variant groups list each tag once, in input order, including irregular plurals."""
+        from tagex.analysis.merge_analyzer import find_variant_patterns
+
+        tags = ["book", "books", "Books", "writing", "writ", "child", "children", "tested", "test", "solo"]
+
+        assert find_variant_patterns(tags) == {
+            "books": ["book", "books", "Books"],
+            "writ": ["writing", "writ"],
+            "children": ["child", "children"],
+            "test": ["tested", "test"],
+        }
+
+    def test_find_acronym_expansions(self):
+        """Test acronyms pair with multi-word tags whose initials match, when they share enough files."""
+        from tagex.analysis.synonym_analyzer import find_acronym_expansions
+
+        tag_stats = {
+            "AI": {"count": 4, "files": {"a.md", "b.md"}},
+            "artificial-intelligence": {"count": 9, "files": {"a.md", "b.md", "c.md"}},
+            "ai/interfaces": {"count": 2, "files": {"a.md"}},
+            "ml": {"count": 3, "files": {"d.md"}},
+            "machine/learning": {"count": 5, "files": {"e.md"}},
+            "aisle": {"count": 1, "files": {"a.md"}},
+        }
+
+        results = find_acronym_expansions(tag_stats)
+
+        assert [(r['acronym'], r['expansion'], r['shared_files']) for r in results] == [
+            ("AI", "artificial-intelligence", 2), ("AI", "ai/interfaces", 1),
+        ]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_find_overlapping_tags(self, monkeypatch, use_numpy):
+        """Test file-overlap pairs keep tag order and skip tags sharing fewer than five files."""
+        from tagex.analysis import pair_analyzer
+        from tagex.analysis.merge_analyzer import find_overlapping_tags
+
+        monkeypatch.setattr(pair_analyzer, 'NUMPY_AVAILABLE', use_numpy)
+        files = [f"n{i}.md" for i in range(10)]
+        tag_stats = {
+            "ml": {"count": 12, "files": set(files)},
+            "ai": {"count": 9, "files": set(files[:9])},
+            "tiny": {"count": 4, "files": set(files[:4])},
+            "tiny2": {"count": 4, "files": set(files[:4])},
+        }
+
+        assert find_overlapping_tags(tag_stats) == [{
+            'tag1': "ml", 'tag2': "ai", 'overlap_ratio': 0.9, 'shared_files': 9,
+            'total_files': 10, 'suggested_keep': "ml",
+        }]
+        assert find_overlapping_tags(tag_stats, overlap_threshold=0.95) == []
+
+    def test_suggest_merges_parallel_matches_serial(self, monkeypatch):
+        """Test running the analyzers in worker processes gives the same suggestions as serial."""
+        from tagex.analysis import merge_analyzer
+
+        files = [f"n{i}.md" for i in range(10)]
+        tags = ["book", "books", "writing", "writng", "ml", "ai", "child", "children", "tech"]
+        tag_stats = {tag: {'count': len(tag) + 2, 'files': set(files[:len(tag) + 2])} for tag in tags}
+        args = argparse.Namespace(no_sklearn=True)
+
+        serial = merge_analyzer.suggest_merges(tag_stats, min_usage=2, args=args, jobs=1)
+        monkeypatch.setattr(merge_analyzer, 'PARALLEL_MIN_TAGS', 0)
+        parallel = merge_analyzer.suggest_merges(tag_stats, min_usage=2, args=args, jobs=3)
+
+        assert serial['similar_names'] and serial['high_overlap'] and serial['variant_patterns']
+        assert parallel == serial
+
     def test_build_file_to_tags_mapping(self, sample_pair_data):
         """Test building file-to-tags mapping from extraction data."""
         # This tests the expected internal functionality
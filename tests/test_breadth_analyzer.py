@@ -6,6 +6,7 @@ import pytest
 from tagex.analysis.breadth_analyzer import (
     detect_overbroad_tags,
     calculate_tag_specificity,
+    count_cooccurring_tags,
     suggest_tag_refinements,
     analyze_tag_quality,
     format_quality_report,
@@ -165,6 +166,15 @@ class TestCalculateTagSpecificity:
         # Might be appropriately_specific or highly_specific depending on exact score
         assert nested['assessment'] in ['appropriately_specific', 'highly_specific']
 
+    def test_precomputed_cooccurrence_counts(self, sample_tag_stats):
+        """Test shared-file counts match the per-tag comparison used without them."""
+        counts = count_cooccurring_tags(sample_tag_stats)
+
+        assert counts == {'notes': 4, 'ideas': 4, 'project': 4, 'python': 4, 'python/data-analysis': 4}
+        for tag in sample_tag_stats:
+            assert (calculate_tag_specificity(tag, sample_tag_stats, 1000, counts)
+                    == calculate_tag_specificity(tag, sample_tag_stats, 1000))
+
 
 class TestSuggestTagRefinements:
     """Test tag refinement suggestions."""
@@ -48,6 +48,21 @@ class TestCLIBasics:
                 assert len(result.output.strip()) > 0
                 break
     
+    def test_configure_logging_applies_each_level(self):
+        """Test that repeated logging setup in one process honours the latest level."""
+        import logging
+        from tagex.main import _configure_logging
+
+        root = logging.getLogger()
+        original_level = root.level
+        try:
+            _configure_logging(logging.DEBUG)
+            assert root.level == logging.DEBUG
+            _configure_logging(logging.WARNING)
+            assert root.level == logging.WARNING
+        finally:
+            root.setLevel(original_level)
+
     def test_cli_without_args_shows_help(self):
         """Test CLI without arguments shows help or usage info."""
         from tagex.main import main as cli
@@ -140,7 +155,22 @@ class TestExtractCommand:
         
         content = output_file.read_text()
         assert "tag,tagCount,files" in content or "tag," in content
-    
+
+    def test_extract_command_csv_to_stdout(self, simple_vault):
+        """Test extract command writes CSV rows directly to stdout."""
+        from tagex.main import main as cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'tag', 'export', str(simple_vault),
+            '--format', 'csv'
+        ])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0] == "tag,count,files"
+        assert len(lines) > 1
+
     def test_extract_command_text_format(self, simple_vault):
         """Test extract command with text format."""
         from tagex.main import main as cli
@@ -695,6 +725,16 @@ class TestCLIErrorHandling:
         assert result.exit_code != 0
         assert "invalid" in result.output.lower() or "choice" in result.output.lower()
     
+    def test_stats_rejects_negative_top(self, simple_vault):
+        """Test stats refuses a negative --top instead of silently changing which tags are shown."""
+        from tagex.main import main as cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['stats', str(simple_vault), '--top', '-1', '--no-cache'])
+
+        assert result.exit_code != 0
+        assert "--top" in result.output
+
     def test_command_with_invalid_vault_path(self):
         """Test commands with invalid vault paths."""
         from tagex.main import main as cli
@@ -981,4 +1021,132 @@ This has an inline #old-tag in the content.
 
         assert result.exit_code == 0
         # Should indicate it would process the file (contains frontmatter tag)
-        assert "Files processed: 1" in result.output
\ No newline at end of file
+        assert "Files processed: 1" in result.output
+
+
+class TestStatsCalculations:
+    """Tests for the statistics helpers behind the stats command."""
+
+    def test_shannon_entropy(self):
+        """Test entropy of uniform and skewed distributions."""
+        from tagex.main import calculate_shannon_entropy
+
+        assert calculate_shannon_entropy([]) == 0
+        assert calculate_shannon_entropy([5]) == 0
+        assert calculate_shannon_entropy([1, 1]) == pytest.approx(1.0)
+        assert calculate_shannon_entropy([2, 2, 2, 2]) == pytest.approx(2.0)
+
+    def test_concentration_score(self):
+        """Test Gini-style concentration score."""
+        from tagex.main import calculate_concentration_score
+
+        assert calculate_concentration_score([7]) == 1.0
+        assert calculate_concentration_score([3, 3, 3]) == pytest.approx(0.0)
+        assert calculate_concentration_score([1, 9, 2]) == pytest.approx(
+            calculate_concentration_score([9, 2, 1], presorted=True)
+        )
+
+    def test_pure_python_fallback_matches(self, monkeypatch):
+        """Test that the no-numpy fallback gives the same results."""
+        import tagex.main as cli_module
+
+        counts = [9, 4, 4, 2, 1, 1, 1]
+        entropy = cli_module.calculate_shannon_entropy(counts)
+        concentration = cli_module.calculate_concentration_score(counts)
+
+        monkeypatch.setattr(cli_module, '_load_numpy', lambda: None)
+
+        assert cli_module.calculate_shannon_entropy(counts) == pytest.approx(entropy)
+        assert cli_module.calculate_concentration_score(counts) == pytest.approx(concentration)
+
+    def test_helpers_accept_numpy_arrays(self):
+        """Test that the helpers accept a pre-converted count array."""
+        np = pytest.importorskip('numpy')
+        from tagex.main import calculate_shannon_entropy, calculate_concentration_score
+
+        counts = [9, 4, 4, 2, 1]
+        array = np.asarray(counts, dtype=np.float64)
+
+        assert calculate_shannon_entropy(array) == pytest.approx(calculate_shannon_entropy(counts))
+        assert calculate_concentration_score(array, presorted=True) == pytest.approx(
+            calculate_concentration_score(counts)
+        )
+
+    def test_calculate_tag_statistics(self):
+        """Test distribution buckets and top tag ordering."""
+        from tagex.main import calculate_tag_statistics
+
+        tag_data = {
+            'work': {'count': 3, 'files': {'a.md', 'b.md', 'c.md'}},
+            'ideas': {'count': 1, 'files': {'a.md'}},
+            'notes': {'count': 2, 'files': {'a.md', 'b.md'}},
+            'misc': {'count': 1, 'files': {'d.md'}},
+        }
+        basic_stats = {'files_processed': 5, 'errors': 0, 'vault_path': '/vault'}
+
+        result = calculate_tag_statistics(tag_data, basic_stats, 2)
+
+        assert result['total_tags'] == 4
+        assert result['total_tag_uses'] == 7
+        assert result['top_tags'] == [('work', 3), ('notes', 2)]
+        assert result['tag_distribution']['singletons']['count'] == 2
+        assert result['tag_distribution']['doubletons']['count'] == 1
+        assert result['tag_distribution']['tripletons']['count'] == 1
+        assert result['tag_distribution']['frequent_tags']['count'] == 0
+        assert result['vault_health']['tagged_files'] == 4
+        assert result['vault_health']['untagged_files'] == 1
+        assert result['usage_distribution'] == {1: 2, 2: 1, 3: 1}
+
+    def test_interpret_vault_health_diversity(self, capsys):
+        """Test diversity assessment thresholds and the insufficient-data guard."""
+        from tagex.main import interpret_vault_health
+
+        distribution = {'singletons': {'percentage': 10.0}}
+
+        interpret_vault_health({'tag_coverage': 90, 'diversity_score': 2.0}, distribution, 4)
+        assert "High tag diversity" in capsys.readouterr().out
+
+        interpret_vault_health({'tag_coverage': 90, 'diversity_score': 0.5}, distribution, 4)
+        assert "Low diversity" in capsys.readouterr().out
+
+        interpret_vault_health({'tag_coverage': 90, 'diversity_score': 0}, distribution, 1)
+        assert "Insufficient data for diversity assessment" in capsys.readouterr().out
+
+    def test_stats_command_json(self, simple_vault):
+        """Test stats command emits parseable JSON."""
+        from tagex.main import main as cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['stats', str(simple_vault), '--format', 'json'])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data['total_tags'] > 0
+        assert 'vault_health' in data
+
+    def test_json_output_matches_without_orjson(self, simple_vault, monkeypatch):
+        """Test that the stdlib JSON fallback produces the same documents."""
+        import sys
+        from tagex.main import main as cli
+
+        runner = CliRunner()
+        default_stats = runner.invoke(cli, ['stats', str(simple_vault), '--format', 'json'])
+        default_export = runner.invoke(cli, ['tag', 'export', str(simple_vault), '--quiet'])
+
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+        fallback_stats = runner.invoke(cli, ['stats', str(simple_vault), '--format', 'json'])
+        fallback_export = runner.invoke(cli, ['tag', 'export', str(simple_vault), '--quiet'])
+
+        assert json.loads(default_stats.output) == json.loads(fallback_stats.output)
+        assert json.loads(default_export.output) == json.loads(fallback_export.output)
+
+    def test_stats_command_text(self, simple_vault):
+        """Test stats command text report."""
+        from tagex.main import main as cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['stats', str(simple_vault)])
+
+        assert result.exit_code == 0
+        assert "Vault Tag Statistics" in result.output
+        assert "Health Assessment:" in result.output
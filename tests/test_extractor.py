@@ -92,6 +92,18 @@ class TestTagExtractor:
         assert "errors" in stats
         assert "vault_path" in stats
         assert stats["files_processed"] > 0
+
+    def test_extract_statistics_tagged_file_count(self, simple_vault):
+        """Test that extractor counts files that contributed at least one tag."""
+        from tagex.core.extractor.core import TagExtractor
+
+        extractor = TagExtractor(str(simple_vault))
+        results = extractor.extract_tags()
+        stats = extractor.get_statistics()
+
+        tagged_files = set().union(*(data["files"] for data in results.values()))
+        assert stats["tagged_file_count"] == len(tagged_files)
+        assert stats["tagged_file_count"] < stats["files_processed"]
     
     def test_extract_handles_file_errors(self, temp_dir):
         """Test extraction handles file processing errors gracefully."""
@@ -284,6 +296,81 @@ Content with #project tag""")
         assert "frontmatter-work" not in results
         assert "frontmatter-project" not in results
 
+    def test_extract_handles_crlf_and_latin1_files(self, temp_dir):
+        """Test that CRLF line endings and non-UTF-8 files are read correctly."""
+        from tagex.core.extractor.core import TagExtractor
+
+        vault_path = temp_dir / "encoding_vault"
+        vault_path.mkdir()
+        (vault_path / "crlf.md").write_bytes(b"---\r\ntags: [windows]\r\n---\r\nBody #crlf-inline\r\n")
+        (vault_path / "latin1.md").write_bytes("---\ntags: [caf\u00e9]\n---\n".encode('latin-1'))
+
+        results = TagExtractor(str(vault_path), tag_types='both').extract_tags()
+
+        assert "windows" in results
+        assert "crlf-inline" in results
+        assert "caf\u00e9" in results
+
+    def test_extract_parallel_matches_serial(self, complex_vault, monkeypatch):
+        """Test that parsing in a process pool gives the same results as serial parsing."""
+        from tagex.core.extractor import core
+        from tagex.core.extractor.core import TagExtractor
+
+        serial = TagExtractor(str(complex_vault), tag_types='both').extract_tags()
+
+        monkeypatch.setattr(core, 'PARALLEL_MIN_FILES', 0)
+        extractor = TagExtractor(str(complex_vault), tag_types='both', jobs=2)
+        assert extractor._worker_count(10) == 2
+        parallel = extractor.extract_tags()
+
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+
+    def test_extract_with_cache_reuses_unchanged_files(self, simple_vault, temp_dir, monkeypatch):
+        """Test that a warm cache skips parsing files whose mtime and size are unchanged."""
+        from tagex.core.extractor.core import TagExtractor
+
+        cache_dir = temp_dir / "cache"
+        cold = TagExtractor(str(simple_vault), cache_dir=cache_dir).extract_tags()
+        assert list(cache_dir.glob("extract_*.json.gz"))
+
+        warm_extractor = TagExtractor(str(simple_vault), cache_dir=cache_dir)
+        parsed = []
+        original = warm_extractor._process_file
+        monkeypatch.setattr(warm_extractor, '_process_file', lambda path: parsed.append(path) or original(path))
+        warm = warm_extractor.extract_tags()
+
+        assert parsed == []
+        assert warm == cold
+        assert warm_extractor.get_statistics()["files_processed"] == 4
+
+    def test_extract_with_cache_detects_modified_files(self, simple_vault, temp_dir):
+        """Test that files edited after caching are parsed again."""
+        from tagex.core.extractor.core import TagExtractor
+
+        cache_dir = temp_dir / "cache"
+        TagExtractor(str(simple_vault), cache_dir=cache_dir).extract_tags()
+
+        (simple_vault / "no_tags.md").write_text("""---
+tags: [freshly-added]
+---
+Now tagged.
+""")
+        results = TagExtractor(str(simple_vault), cache_dir=cache_dir).extract_tags()
+
+        assert "freshly-added" in results
+
+    def test_extract_cache_is_keyed_on_tag_types(self, simple_vault, temp_dir):
+        """Test that different tag type settings do not share cached tags."""
+        from tagex.core.extractor.core import TagExtractor
+
+        cache_dir = temp_dir / "cache"
+        TagExtractor(str(simple_vault), tag_types='frontmatter', cache_dir=cache_dir).extract_tags()
+        results = TagExtractor(str(simple_vault), tag_types='inline', cache_dir=cache_dir).extract_tags()
+
+        assert "inline-tag" in results
+        assert "ideas" not in results
+
 
 class TestOutputFormatter:
     """Tests for output formatting functionality."""
@@ -325,6 +412,17 @@ class TestOutputFormatter:
         # Should have data rows sorted by count (descending)
         assert csv_output[1][0] == "work"  # tag name
         assert csv_output[1][1] == "5"     # count as string
+
+    def test_iter_csv_rows_streams_same_rows(self, test_output_formats):
+        """Test that the CSV row generator yields the same rows lazily."""
+        from tagex.core.extractor.output_formatter import format_as_csv, iter_csv_rows
+
+        tags_data = test_output_formats["raw"]
+        rows = iter_csv_rows(tags_data)
+
+        assert not isinstance(rows, list)
+        assert next(rows) == ["tag", "count", "files"]
+        assert [["tag", "count", "files"]] + list(rows) == format_as_csv(tags_data)
     
     def test_format_as_text(self, test_output_formats):
         """Test text output formatting.""" 
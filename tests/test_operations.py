@@ -4,8 +4,10 @@ Tests for the operations module - tag rename, merge, and operation logging.
 
 import pytest
 import json
+import os
 from pathlib import Path
 import shutil
+import time
 
 
 class TestTagOperationEngine:
@@ -179,7 +181,70 @@ Content with #work #workflow and #workspace tags.
         # But should preserve 'workflow' and 'workspace' (similar but different tags)
         assert "workflow" in modified_content
         assert "workspace" in modified_content
-    
+
+    def test_rename_multiline_array_keeps_layout(self, temp_dir):
+        """Test rename in a multi-line tag array keeps indentation and neighbouring keys."""
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        test_vault = temp_dir / "multiline_vault"
+        test_vault.mkdir()
+
+        test_file = test_vault / "multiline.md"
+        test_file.write_text("""---
+title: Notes
+tags:
+  - work
+
+  - "ideas"
+status: draft
+---
+
+Body text.
+""")
+
+        operation = RenameOperation(
+            vault_path=str(test_vault),
+            old_tag="work",
+            new_tag="professional",
+            dry_run=False
+        )
+
+        operation.run_operation()
+
+        assert test_file.read_text() == """---
+title: Notes
+tags:
+  - professional
+
+  - ideas
+status: draft
+---
+
+Body text.
+"""
+
+    def test_rename_inline_only_leaves_frontmatter_untouched(self, temp_dir):
+        """Test frontmatter without the target tag is copied verbatim, quoting and spacing included."""
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        test_vault = temp_dir / "inline_only_vault"
+        test_vault.mkdir()
+
+        frontmatter = '---\ntags: ["notes" ,  ideas]\naliases:\n  - "Note"\n---\n'
+        test_file = test_vault / "inline.md"
+        test_file.write_text(frontmatter + "Body with #work tag.\n")
+
+        operation = RenameOperation(
+            vault_path=str(test_vault),
+            old_tag="work",
+            new_tag="professional",
+            dry_run=False,
+            tag_types='both'
+        )
+        operation.run_operation()
+
+        assert test_file.read_text() == frontmatter + "Body with #professional tag.\n"
+
     def test_rename_handles_no_matching_files(self, simple_vault):
         """Test rename operation when no files contain the target tag."""
         from tagex.core.operations.tag_operations import RenameOperation
@@ -322,6 +387,116 @@ Content""")
         # Files that had any of the source tags should be modified
         assert "thinking" in partial_content or "thinking" in multiple_content
 
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_merge_many_sources_prefilter(self, temp_dir, monkeypatch, use_automaton):
+        """Test the substring pre-filter with enough source tags to use the automaton or union regex."""
+        from tagex.core.operations import tag_operations
+        from tagex.core.operations.tag_operations import MergeOperation
+
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(tag_operations, 'AHOCORASICK_AVAILABLE', False)
+
+        test_vault = temp_dir / "many_sources_vault"
+        test_vault.mkdir()
+
+        (test_vault / "match.md").write_text("""---
+tags: [Source-7, keep]
+---
+Content with #source-3""")
+        (test_vault / "other.md").write_text("""---
+tags: [keep]
+---
+Content""")
+
+        operation = MergeOperation(
+            vault_path=str(test_vault),
+            source_tags=[f"source-{i}" for i in range(10)],
+            target_tag="merged",
+            dry_run=False
+        )
+
+        assert (operation._needle_automaton is not None) == use_automaton
+        assert not operation.may_contain_target_tags("tags: [keep]")
+        assert operation.may_contain_target_tags("#SOURCE-9")
+
+        results = operation.run_operation()
+
+        assert results["stats"]["files_modified"] == 1
+        match_content = (test_vault / "match.md").read_text()
+        assert "tags: [merged, keep]" in match_content
+        assert "#merged" in match_content
+
+    def test_raw_bytes_prefilter(self):
+        """Test the undecoded-bytes pre-filter; only ASCII files are ruled out."""
+        from tagex.core.operations.tag_operations import MergeOperation, RenameOperation
+
+        ascii_op = MergeOperation("/test/vault", ["Ideas", "notes"], "thinking", dry_run=True)
+        assert ascii_op.raw_may_contain_target_tags(b"tags: [IDEAS]")
+        assert not ascii_op.raw_may_contain_target_tags(b"tags: [other]")
+        # Left to the decoded check, which rules it out
+        assert ascii_op.raw_may_contain_target_tags("tags: [café]".encode())
+
+        # KELVIN SIGN lowercases to an ASCII 'k'
+        kelvin_op = RenameOperation("/test/vault", "key", "lock", dry_run=True)
+        assert kelvin_op.raw_may_contain_target_tags("tags: [\u212aey, other]".encode())
+        assert kelvin_op.may_contain_target_tags("tags: [\u212aey, other]")
+
+        unicode_op = MergeOperation("/test/vault", ["café", "tea"], "drinks", dry_run=True)
+        assert not unicode_op.raw_may_contain_target_tags(b"tags: [other]")
+        assert unicode_op.raw_may_contain_target_tags(b"tags: [TEA]")
+        assert unicode_op.raw_may_contain_target_tags("tags: [CAFÉ]".encode())
+
+    @pytest.mark.parametrize("source_count", [2, 10])
+    def test_body_prefilter_reuses_lowered_content(self, source_count):
+        """Test the body check against the whole file's lowercased text, including length-changing case folds."""
+        from tagex.core.operations.tag_operations import MergeOperation
+
+        operation = MergeOperation("/test/vault", [f"idea-{i}" for i in range(source_count)], "thought", dry_run=True)
+
+        for frontmatter in ["---\ntags: [idea-1]\n---\n", "---\ntitle: İstanbul\ntags: [idea-1]\n---\n"]:
+            for body, expected in [("Plain body\n", False), ("Body with #IDEA-1\n", True)]:
+                content = frontmatter + body
+                assert operation._body_may_contain_target_tags(content, content.lower(), body) is expected
+
+    @pytest.mark.parametrize("operation_name", ["merge", "rename"])
+    def test_inline_tags_next_to_code_spans(self, operation_name):
+        """Test tags touching inline code are transformed while code spans and fences stay verbatim."""
+        from tagex.core.operations.tag_operations import MergeOperation, RenameOperation
+
+        if operation_name == "merge":
+            operation = MergeOperation("/test/vault", ["idea", "draft"], "thought", tag_types='inline', dry_run=True)
+        else:
+            operation = RenameOperation("/test/vault", "idea", "thought", tag_types='inline', dry_run=True)
+
+        content = "Use #idea`x` and `#idea` here\n```\n#idea __INLINE_CODE_0__\n```\n#Idea\n"
+
+        assert operation._transform_inline_tags(content) == (
+            "Use #thought`x` and `#idea` here\n```\n#idea __INLINE_CODE_0__\n```\n#thought\n"
+        )
+        assert operation.operation_log["stats"]["tags_modified"] == 2
+
+    @pytest.mark.parametrize("operation_name", ["merge", "rename", "delete"])
+    def test_stray_backtick_before_fenced_block(self, operation_name):
+        """Test an unmatched backtick in prose doesn't expose a later fenced block to the rewrite."""
+        from tagex.core.operations.tag_operations import DeleteOperation, MergeOperation, RenameOperation
+
+        if operation_name == "merge":
+            operation = MergeOperation("/test/vault", ["work", "draft"], "job", tag_types='inline', dry_run=True)
+        elif operation_name == "rename":
+            operation = RenameOperation("/test/vault", "work", "job", tag_types='inline', dry_run=True)
+        else:
+            operation = DeleteOperation("/test/vault", ["work"], tag_types='inline', dry_run=True)
+
+        content = "#work today. Press the ` key.\n\n```bash\n#work\necho hi\n```\n"
+        first = "" if operation_name == "delete" else "#job"
+
+        assert operation._transform_inline_tags(content) == (
+            f"{first} today. Press the ` key.\n\n```bash\n#work\necho hi\n```\n"
+        )
+        assert operation.operation_log["stats"]["tags_modified"] == 1
+
 
 class TestOperationLogging:
     """Tests for operation logging functionality."""
@@ -357,6 +532,31 @@ Content""")
         # Should have created at least one log file
         assert len(log_files) > 0
     
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_saved_log_round_trips(self, temp_dir, monkeypatch, use_orjson):
+        """Test the saved log file is one JSON document equal to the in-memory log, with or without orjson."""
+        import sys
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, 'orjson', None)
+
+        test_vault = temp_dir / "round_trip_vault"
+        test_vault.mkdir()
+        (test_vault / "café.md").write_text("---\ntags: [work]\n---\nNotes with #work")
+        monkeypatch.chdir(temp_dir)
+
+        operation = RenameOperation(str(test_vault), "work", "trabajo", dry_run=True, quiet=True)
+        operation.run_operation()
+        log_path = operation.save_operation_log()
+
+        raw = log_path.read_bytes()
+        assert "café.md".encode() in raw
+        assert json.loads(raw) == operation.operation_log
+        assert json.loads(raw)["changes"][0]["file"] == "café.md"
+
     def test_log_file_structure(self, mock_operation_log):
         """Test that log file has expected structure."""
         # This tests the expected structure based on the fixture
@@ -419,7 +619,114 @@ Content to check integrity."""
         
         # Size should be similar (tag rename shouldn't drastically change file size)
         assert abs(new_size - original_size) < 100  # Allow for reasonable tag name differences
-    
+
+    @pytest.mark.parametrize("use_xxhash", [True, False])
+    def test_change_hashes_match_file_bytes(self, temp_dir, monkeypatch, use_xxhash):
+        """Test that logged hashes are taken from the file bytes before and after the change."""
+        import hashlib
+        from tagex.core.operations import tag_operations
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        if use_xxhash:
+            xxhash = pytest.importorskip("xxhash")
+            digest = xxhash.xxh3_64_hexdigest
+        else:
+            monkeypatch.setattr(tag_operations, 'XXHASH_AVAILABLE', False)
+
+            def digest(data):
+                return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+        test_vault = temp_dir / "hash_vault"
+        test_vault.mkdir()
+
+        test_file = test_vault / "hashed.md"
+        test_file.write_text("---\ntags: [old-tag]\n---\n\nContent.\n")
+        before_bytes = test_file.read_bytes()
+
+        operation = RenameOperation(
+            vault_path=str(test_vault),
+            old_tag="old-tag",
+            new_tag="new-tag",
+            dry_run=False
+        )
+        operation.run_operation()
+
+        assert operation.operation_log["hash_algorithm"] == ("xxh3_64" if use_xxhash else "blake2b-64")
+        change = operation.operation_log["changes"][0]
+        assert change["before_hash"] == digest(before_bytes)
+        assert change["after_hash"] == digest(test_file.read_bytes())
+
+    def test_failed_write_keeps_original_file(self, temp_dir, monkeypatch):
+        """Test that a write failing midway leaves the note and its permissions untouched."""
+        import os
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        test_vault = temp_dir / "atomic_vault"
+        test_vault.mkdir()
+        test_file = test_vault / "note.md"
+        original = "---\ntags: [old-tag]\n---\n\nContent.\n"
+        test_file.write_text(original)
+        test_file.chmod(0o640)
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, 'replace', failing_replace)
+        operation = RenameOperation(str(test_vault), "old-tag", "new-tag", dry_run=False, quiet=True)
+        operation.run_operation()
+
+        assert test_file.read_text() == original
+        assert operation.operation_log["stats"]["errors"] == 1
+        assert not (test_vault / "note.md.tmp").exists()
+
+        monkeypatch.undo()
+        RenameOperation(str(test_vault), "old-tag", "new-tag", dry_run=False, quiet=True).run_operation()
+
+        assert "new-tag" in test_file.read_text()
+        assert test_file.stat().st_mode & 0o777 == 0o640
+        assert not (test_vault / "note.md.tmp").exists()
+
+    def test_non_utf8_files_counted_as_errors(self, temp_dir):
+        """Test notes that aren't UTF-8 are reported as errors even when they can't contain the target tag."""
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        test_vault = temp_dir / "encoding_vault"
+        test_vault.mkdir()
+        (test_vault / "latin1.md").write_bytes("---\ntags: [café]\n---\n".encode("latin-1"))
+        (test_vault / "ascii.md").write_bytes(b"---\ntags: [other]\n---\n")
+        (test_vault / "utf8.md").write_bytes("---\ntags: [café]\n---\n".encode())
+
+        operation = RenameOperation(str(test_vault), "old-tag", "new-tag", dry_run=True, quiet=True)
+        operation.run_operation()
+
+        assert operation.operation_log["stats"]["errors"] == 1
+        assert [change["file"] for change in operation.operation_log["changes"]] == ["latin1.md"]
+
+    def test_write_follows_symlinks_and_keeps_hard_links(self, temp_dir):
+        """Test that symlinked notes update their target and hard-linked notes stay linked."""
+        import os
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        test_vault = temp_dir / "link_vault"
+        test_vault.mkdir()
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        content = "---\ntags: [old-tag]\n---\n\nContent.\n"
+        target = outside / "target.md"
+        target.write_text(content)
+        (test_vault / "linked.md").symlink_to(target)
+        hard = test_vault / "hard.md"
+        hard.write_text(content)
+        os.link(hard, outside / "hard-copy.md")
+
+        RenameOperation(str(test_vault), "old-tag", "new-tag", dry_run=False, quiet=True).run_operation()
+
+        assert (test_vault / "linked.md").is_symlink()
+        assert "new-tag" in target.read_text()
+        assert "new-tag" in (outside / "hard-copy.md").read_text()
+        assert hard.stat().st_ino == (outside / "hard-copy.md").stat().st_ino
+        assert not (outside / "target.md.tmp").exists()
+
     def test_dry_run_produces_log(self, temp_dir):
         """Test that dry-run mode also produces logs."""
         from tagex.core.operations.tag_operations import RenameOperation
@@ -464,6 +771,38 @@ class TestDeleteOperation:
         assert operation is not None
         assert operation.tags_to_delete == ["unwanted-tag", "another-tag"]
 
+    def test_delete_last_frontmatter_key_keeps_preceding_lines(self, temp_dir):
+        """Test removing a trailing tag key leaves the keys above it byte-for-byte intact."""
+        from tagex.core.operations.tag_operations import DeleteOperation
+
+        test_vault = temp_dir / "trailing_key_vault"
+        test_vault.mkdir()
+
+        test_file = test_vault / "trailing.md"
+        test_file.write_text("""---
+title: Notes
+aliases:
+  - jot
+tag: unwanted-tag
+---
+Body
+""")
+
+        operation = DeleteOperation(
+            vault_path=str(test_vault),
+            tags_to_delete=["unwanted-tag"],
+            dry_run=False
+        )
+        operation.run_operation()
+
+        assert test_file.read_text() == """---
+title: Notes
+aliases:
+  - jot
+---
+Body
+"""
+
     def test_delete_single_tag_frontmatter_only(self, temp_dir):
         """Test deleting a tag that only appears in frontmatter."""
         from tagex.core.operations.tag_operations import DeleteOperation
@@ -963,10 +1302,146 @@ Content with #unwanted-inline tag that will generate warning.
         assert "message" in warning
         assert "readability" in warning["message"].lower()
 
+    def test_delete_parallel_matches_serial(self, temp_dir, monkeypatch):
+        """Test that processing in a process pool gives the same log and counters as serial."""
+        from tagex.core.operations import tag_operations
+        from tagex.core.operations.tag_operations import DeleteOperation
+
+        def make_vault(name):
+            vault = temp_dir / name
+            vault.mkdir()
+            for i in range(12):
+                (vault / f"note{i:02}.md").write_text(f"""---
+tags: [{'drop, ' if i % 3 == 0 else ''}keep]
+---
+Body {'with #drop inline' if i % 4 == 0 else 'text'}.
+""")
+            return vault
+
+        serial = DeleteOperation(str(make_vault("serial_vault")), ["drop"], tag_types='both', quiet=True)
+        serial_log = serial.run_operation()
+
+        monkeypatch.setattr(tag_operations, 'PARALLEL_MIN_FILES', 0)
+        parallel_vault = make_vault("parallel_vault")
+        parallel = DeleteOperation(str(parallel_vault), ["drop"], tag_types='both', quiet=True, jobs=2)
+        assert parallel._worker_count(12) == 2
+        parallel_log = parallel.run_operation()
+
+        assert parallel_log["stats"] == serial_log["stats"]
+        assert parallel_log["stats"]["files_processed"] == 12
+
+        def by_file(entries):
+            return sorted(entries, key=lambda entry: entry["file"])
+
+        assert by_file(parallel_log["changes"]) == by_file(serial_log["changes"])
+        assert by_file(parallel_log["warnings"]) == by_file(serial_log["warnings"])
+        assert parallel.inline_deletions == serial.inline_deletions == 3
+        assert parallel.frontmatter_deletions == serial.frontmatter_deletions == 4
+        assert "drop" not in (parallel_vault / "note00.md").read_text()
+
+    def test_parallel_keeps_results_when_a_worker_dies(self, temp_dir, monkeypatch):
+        """Test that files finished before a worker died stay in the log and the rest are processed serially."""
+        from tagex.core.operations import tag_operations
+
+        vault = temp_dir / "crash_vault"
+        vault.mkdir()
+        for i in range(12):
+            (vault / f"note{i:02}.md").write_text("---\ntags: [old-tag]\n---\nBody.\n")
+
+        monkeypatch.setattr(tag_operations, 'PARALLEL_MIN_FILES', 0)
+        operation = CrashingRenameOperation(str(vault), "old-tag", "new-tag", quiet=True, jobs=2)
+        log = operation.run_operation()
+
+        assert log["stats"]["files_processed"] == 12
+        assert log["stats"]["files_modified"] == 12
+        assert sorted(change["file"] for change in log["changes"]) == [f"note{i:02}.md" for i in range(12)]
+        assert all("new-tag" in note.read_text() for note in vault.iterdir())
+
 
 class TestOperationEdgeCases:
     """Tests for edge cases and error conditions in operations."""
 
+    def test_find_markdown_files_skips_obsidian_dirs(self, temp_dir):
+        """Test file discovery skips every path containing .obsidian at any depth and ignores non-markdown files."""
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        vault = temp_dir / "discovery_vault"
+        for directory in ["", "notes/deep", ".obsidian/plugins", "notes/.obsidian", "notes.obsidian-backup"]:
+            (vault / directory).mkdir(parents=True, exist_ok=True)
+            (vault / directory / "note.md").write_text("#tag")
+            (vault / directory / "image.png").write_text("")
+        (vault / "folder.md").mkdir()
+        (vault / "notes" / "x.obsidian.md").write_text("#tag")
+
+        operation = RenameOperation(str(vault), "tag", "other", dry_run=True)
+        found = sorted(path.relative_to(vault).as_posix() for path in operation.find_markdown_files())
+
+        assert found == ["note.md", "notes/deep/note.md"]
+
+        nested = vault / ".obsidian" / "plugins"
+        assert RenameOperation(str(nested), "tag", "other", dry_run=True).find_markdown_files() == []
+
+    def test_find_markdown_files_order_independent_of_threads(self, temp_dir):
+        """Test threaded directory listing returns files in the same depth-first order as a single job."""
+        from tagex.core.operations.tag_operations import RenameOperation
+
+        vault = temp_dir / "ordered_vault"
+        for directory in ["a/x", "a/y/z", "b", "c/x"]:
+            (vault / directory).mkdir(parents=True, exist_ok=True)
+            (vault / directory / "note.md").write_text("#tag")
+            (vault / directory.split("/")[0] / "top.md").write_text("#tag")
+
+        serial = RenameOperation(str(vault), "tag", "other", dry_run=True, jobs=1).find_markdown_files()
+        threaded = RenameOperation(str(vault), "tag", "other", dry_run=True, jobs=4).find_markdown_files()
+
+        assert len(serial) == 7
+        assert threaded == serial
+
+    def test_frontmatter_only_file_without_trailing_newline(self, temp_dir):
+        """Test a file that ends right after the closing --- keeps its frontmatter when tags change."""
+        from tagex.core.operations.tag_operations import MergeOperation
+
+        vault = temp_dir / "eof_vault"
+        vault.mkdir()
+        test_file = vault / "eof.md"
+        test_file.write_text("---\ntags: [draft, keep]\n---")
+
+        MergeOperation(str(vault), ["draft"], "wip", dry_run=False, quiet=True).run_operation()
+
+        assert test_file.read_text() == "---\ntags: [wip, keep]\n---"
+
+    def test_malformed_frontmatter_is_not_duplicated(self, temp_dir):
+        """Test inline changes in a file with unparseable YAML leave exactly one copy of the frontmatter."""
+        from tagex.core.operations.tag_operations import MergeOperation
+
+        vault = temp_dir / "malformed_vault"
+        vault.mkdir()
+        test_file = vault / "malformed.md"
+        test_file.write_text("---\ntags: [draft\nbad: : :\n---\nBody #draft\n")
+
+        MergeOperation(str(vault), ["draft"], "wip", dry_run=False, quiet=True).run_operation()
+
+        assert test_file.read_text() == "---\ntags: [draft\nbad: : :\n---\nBody #wip\n"
+
+    def test_sequential_operations_share_frontmatter_parse(self, temp_dir):
+        """Test a second operation over unchanged files reuses the cached frontmatter parse."""
+        from tagex.core.operations.tag_operations import (
+            RenameOperation, DeleteOperation, _load_frontmatter_tags
+        )
+
+        vault = temp_dir / "template_vault"
+        vault.mkdir()
+        for i in range(3):
+            (vault / f"note{i}.md").write_text("---\ntags: [draft, meeting]\n---\nBody\n")
+
+        _load_frontmatter_tags.cache_clear()
+        RenameOperation(str(vault), "draft", "wip", dry_run=True, quiet=True).run_operation()
+        DeleteOperation(str(vault), ["meeting"], dry_run=True, quiet=True).run_operation()
+
+        info = _load_frontmatter_tags.cache_info()
+        assert info.misses == 1
+        assert info.hits == 5
+
     def test_operation_with_nonexistent_vault(self):
         """Test operation with nonexistent vault path."""
         from tagex.core.operations.tag_operations import RenameOperation
@@ -1273,4 +1748,205 @@ Content with #inline-only tag""")
         # File content should be unchanged
         content = test_file.read_text()
         assert "#inline-only" in content
-        assert "renamed" not in content
\ No newline at end of file
+        assert "renamed" not in content
+
+
+class TestDuplicateTagsFixer:
+    """Tests for fixing duplicate tags: fields."""
+
+    def test_fix_keeps_original_in_backup(self, temp_dir):
+        """Test the .bak snapshot keeps the original content after the file is rewritten."""
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        test_file = temp_dir / "dupes.md"
+        original = "---\ntags: [one]\ntitle: Note\ntags:\n---\nBody\n"
+        test_file.write_text(original)
+
+        fixer = DuplicateTagsFixer(dry_run=False, quiet=True)
+        assert fixer.fix_file(test_file)
+
+        assert test_file.read_text().count("tags:") == 1
+        backup = temp_dir / "dupes.md.bak"
+        assert backup.read_text() == original
+        assert backup.stat().st_ino != test_file.stat().st_ino
+        assert not (temp_dir / "dupes.md.tmp").exists()
+
+    def test_fix_follows_symlinks_and_keeps_hard_links(self, temp_dir):
+        """Test symlinked notes are fixed at their target and hard-linked notes stay linked, with backups of the original."""
+        import os
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        original = "---\ntags: [one]\ntitle: Note\ntags:\n---\nBody\n"
+        target = temp_dir / "target.md"
+        target.write_text(original)
+        linked = temp_dir / "linked.md"
+        linked.symlink_to(target)
+        hard = temp_dir / "hard.md"
+        hard.write_text(original)
+        os.link(hard, temp_dir / "hard-copy.md")
+
+        fixer = DuplicateTagsFixer(dry_run=False, quiet=True)
+        assert fixer.fix_file(linked)
+        assert fixer.fix_file(hard)
+
+        assert linked.is_symlink()
+        assert target.read_text().count("tags:") == 1
+        assert (temp_dir / "linked.md.bak").read_text() == original
+        assert (temp_dir / "hard-copy.md").read_text().count("tags:") == 1
+        assert hard.stat().st_ino == (temp_dir / "hard-copy.md").stat().st_ino
+        assert (temp_dir / "hard.md.bak").read_text() == original
+        assert not (temp_dir / "target.md.tmp").exists()
+
+    def test_fix_rules_out_notes_from_head(self, temp_dir, monkeypatch):
+        """Test duplicates beyond the first read are still fixed, while notes ruled out by their head are skipped unless it isn't UTF-8."""
+        from tagex.core.operations import fix_duplicates
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        monkeypatch.setattr(fix_duplicates, 'HEAD_SIZE', 16)
+        long_frontmatter = temp_dir / "long.md"
+        long_frontmatter.write_text("---\ntitle: A long title\ntags: [one]\ntags: [two]\n---\nBody\n")
+        plain = temp_dir / "plain.md"
+        plain.write_text("No frontmatter here, tags: tags: tags:\n")
+        single = temp_dir / "single.md"
+        single.write_text("---\ntags: x\n---\ntags: tags: in the body\n")
+        latin1 = temp_dir / "latin1.md"
+        latin1.write_bytes("A café in the head\n".encode("latin-1"))
+        split = temp_dir / "split.md"
+        split.write_bytes("No frontmatter é".encode() + b"\n")
+
+        fixer = DuplicateTagsFixer(dry_run=False, quiet=True)
+        assert fixer.fix_file(long_frontmatter)
+        assert not fixer.fix_file(plain)
+        assert not fixer.fix_file(single)
+        assert not fixer.fix_file(latin1)
+        assert not fixer.fix_file(split)
+
+        assert long_frontmatter.read_text().count("tags:") == 1
+        assert fixer.stats['files_skipped'] == 3
+        assert fixer.stats['errors'] == 1
+
+    def test_fix_reads_crlf_files(self, temp_dir):
+        """Test files with Windows line endings are detected and fixed like text-mode reads."""
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        test_file = temp_dir / "windows.md"
+        test_file.write_bytes(b"---\r\ntags: [one]\r\ntags: [two]\r\n---\r\nBody\r\n")
+
+        fixer = DuplicateTagsFixer(dry_run=False, quiet=True)
+        assert fixer.fix_file(test_file)
+
+        assert test_file.read_text().count("tags:") == 1
+        assert (temp_dir / "windows.md.bak").exists()
+
+    def test_threaded_fix_matches_serial_run(self, temp_dir, monkeypatch):
+        """Test fixing with worker threads gives the same files, stats and log order as a serial run."""
+        from tagex.core.operations import fix_duplicates
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        monkeypatch.setattr(fix_duplicates, 'PARALLEL_MIN_FILES', 1)
+        runs = {}
+        for jobs in (1, 4):
+            vault = temp_dir / f"vault_{jobs}"
+            vault.mkdir()
+            paths = []
+            for i in range(12):
+                path = vault / f"note{i:02}.md"
+                path.write_text("---\ntags: [a]\ntags:\n---\n" if i % 3 else "---\ntags: [a]\n---\n")
+                paths.append(path)
+            paths.append(vault / "missing.md")
+
+            fixer = DuplicateTagsFixer(dry_run=False, quiet=True, jobs=jobs)
+            fixer.fix_files(paths)
+            # Drop the timestamps, which differ between runs
+            entries = [entry.split("] ", 1)[1].replace(str(vault), "") for entry in fixer.log_entries]
+            runs[jobs] = (fixer.stats, entries, [p.read_text() for p in paths[:-1]])
+
+        assert runs[4] == runs[1]
+        assert runs[1][0]['files_fixed'] == 8
+        assert runs[1][0]['errors'] == 1
+
+    def test_fix_files_prints_every_log_line_in_order(self, temp_dir, capsys, monkeypatch):
+        """Test batched console output prints the whole log, in order, and restores print afterwards."""
+        from tagex.core.operations import fix_duplicates
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        monkeypatch.setattr(fix_duplicates, 'ECHO_BATCH_SIZE', 3)
+        paths = []
+        for i in range(5):
+            path = temp_dir / f"note{i}.md"
+            path.write_text("---\ntags: [a]\ntags:\n---\n")
+            paths.append(path)
+
+        fixer = DuplicateTagsFixer(dry_run=True)
+        fixer.fix_files(paths)
+
+        assert capsys.readouterr().out == "".join(entry + "\n" for entry in fixer.log_entries)
+        assert fixer._echo is print
+
+    def test_run_operation_finds_files_like_rglob(self, temp_dir):
+        """Test file discovery covers nested and hidden folders, or only the top level when not recursive."""
+        from tagex.core.operations.fix_duplicates import run_operation
+        from tagex.utils.file_discovery import iter_files_with_suffix
+
+        vault = temp_dir / "fix_vault"
+        (vault / "sub" / "deeper").mkdir(parents=True)
+        (vault / ".hidden").mkdir()
+        for rel in ("top.md", "sub/mid.md", "sub/deeper/low.md", ".hidden/secret.md", "sub/readme.txt"):
+            (vault / rel).write_text("---\ntags: [a]\ntags:\n---\n")
+
+        assert sorted(iter_files_with_suffix(vault, ".md")) == sorted(vault.rglob("*.md"))
+        assert list(iter_files_with_suffix(vault, ".md", recursive=False)) == [vault / "top.md"]
+
+        stats = run_operation(str(vault), recursive=False, quiet=True)
+        assert stats['total_files'] == 1
+        stats = run_operation(str(vault), quiet=True)
+        assert stats['total_files'] == 4
+        assert stats['files_with_duplicates'] == 4
+
+    def test_find_duplicate_tags_matches_indented_fields(self):
+        """Test that indented tags: lines count as duplicates and their values are stripped."""
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        fixer = DuplicateTagsFixer(quiet=True)
+        content = "---\ntitle: Note\n  tags:\n\ttags:  [one, two]  \nmytags: x\n---\nBody\n"
+
+        has_duplicates, fixed = fixer.find_duplicate_tags(content)
+
+        assert has_duplicates
+        assert fixed.startswith("---\ntitle: Note\ntags: [one, two]\nmytags: x\n")
+        assert fixed.endswith("---\nBody\n")
+        assert fixer.find_duplicate_tags("---\ntitle: Note\nmytags: x\n---\nBody\n") == (False, None)
+
+    def test_failed_validation_leaves_file_untouched(self, temp_dir, monkeypatch):
+        """Test a fix that fails validation is never written and leaves no backup."""
+        from tagex.core.operations.fix_duplicates import DuplicateTagsFixer
+
+        test_file = temp_dir / "stubborn.md"
+        original = "---\ntags: [one]\ntags: [two]\n---\nBody\n"
+        test_file.write_text(original)
+
+        fixer = DuplicateTagsFixer(dry_run=False, quiet=True)
+        # Report duplicates but "fix" them by returning the content unchanged
+        monkeypatch.setattr(fixer, 'find_duplicate_tags', lambda content: (True, content))
+
+        assert not fixer.fix_file(test_file)
+        assert test_file.read_text() == original
+        assert fixer.stats['errors'] == 1
+        assert not (temp_dir / "stubborn.md.bak").exists()
+
+
+from tagex.core.operations.tag_operations import RenameOperation  # noqa: E402
+
+
+class CrashingRenameOperation(RenameOperation):
+    """RenameOperation whose worker exits abruptly on note11.md; module level so workers can unpickle it."""
+
+    def _process_file_isolated(self, file_path):
+        if file_path.name == "note11.md":
+            # Let every other note be rewritten and its result reach the pool first
+            others = [note for note in file_path.parent.iterdir() if note != file_path]
+            while not all("new-tag" in note.read_text() for note in others):
+                time.sleep(0.01)
+            time.sleep(0.2)
+            os._exit(1)
+        return super()._process_file_isolated(file_path)
@@ -316,6 +316,31 @@ Tags like #work, #notes. #ideas! #project? #research; should all work.
         assert "project" in tags
         assert "research" in tags
 
+    def test_backtick_inside_html_comment(self):
+        """Test a stray backtick in an HTML comment doesn't pair with later inline code."""
+        content = "<!-- a stray ` here --> #keep and `#code`\n"
+        from tagex.core.parsers.inline_parser import extract_inline_tags
+
+        assert extract_inline_tags(content) == ["keep"]
+
+    def test_stray_backtick_before_fenced_block(self):
+        """Test an unmatched backtick in prose doesn't open up a later fenced block."""
+        content = "Press the ` key to open the menu.\n\n```bash\n#work\necho hi\n```\nsee #x-y\n"
+        from tagex.core.parsers.inline_parser import extract_inline_tags
+
+        assert extract_inline_tags(content) == ["x-y"]
+
+    def test_repeated_tags_share_one_string(self):
+        """Test repeated tags, inline or in frontmatter, come back as the same interned string."""
+        from tagex.core.parsers.inline_parser import extract_inline_tags
+        from tagex.core.parsers.frontmatter_parser import extract_tags_from_frontmatter
+
+        first, second = extract_inline_tags("#project-" + "x" * 3 + " and #project-" + "x" * 3)
+        frontmatter_tag = extract_tags_from_frontmatter({"tags": ["project-" + "x" * 3]})[0]
+
+        assert first is second
+        assert frontmatter_tag is first
+
 
 class TestParserIntegration:
     """Integration tests for both parsers working together."""
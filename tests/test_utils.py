@@ -121,6 +121,51 @@ class TestFileDiscovery:
             assert isinstance(file_path, Path)
             assert len(str(file_path)) > 0
 
+    def test_find_bak_files_skips_directories_and_symlinked_trees(self, temp_dir):
+        """Test .bak discovery returns sorted regular files and doesn't follow directory symlinks."""
+        from tagex.utils.vault_maintenance import BakRemover
+
+        (temp_dir / "sub" / "deep").mkdir(parents=True)
+        (temp_dir / "folder.bak").mkdir()
+        for rel in ("b.md.bak", "a.md.bak", "sub/deep/c.md.bak", "sub/keep.md"):
+            (temp_dir / rel).write_text("x")
+        (temp_dir / "link").symlink_to(temp_dir / "sub", target_is_directory=True)
+
+        remover = BakRemover(quiet=True)
+
+        assert remover.find_bak_files(temp_dir) == [
+            temp_dir / "a.md.bak", temp_dir / "b.md.bak", temp_dir / "sub" / "deep" / "c.md.bak"
+        ]
+        assert remover.find_bak_files(temp_dir, recursive=False) == [temp_dir / "a.md.bak", temp_dir / "b.md.bak"]
+
+    def test_remove_files_deletes_across_directories(self, temp_dir, monkeypatch):
+        """Test live removal deletes every .bak file in nested directories, opening each directory once."""
+        import os
+        from tagex.utils.vault_maintenance import BakRemover
+
+        (temp_dir / "sub" / "deep").mkdir(parents=True)
+        for rel in ("a.md.bak", "sub/b.md.bak", "sub/deep/c.md.bak", "sub/deep/d.md.bak", "sub/e.md.bak", "sub/keep.md"):
+            (temp_dir / rel).write_text("x")
+
+        opened = []
+        real_open = os.open
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, 'open', counting_open)
+        remover = BakRemover(dry_run=False, quiet=True)
+        remover.remove_files(temp_dir)
+        monkeypatch.undo()
+
+        if os.unlink in os.supports_dir_fd:
+            assert sorted(opened) == [temp_dir, temp_dir / "sub", temp_dir / "sub" / "deep"]
+        assert remover.stats['deleted'] == 5
+        assert remover.stats['errors'] == 0
+        assert remover.find_bak_files(temp_dir) == []
+        assert (temp_dir / "sub" / "keep.md").exists()
+
 
 class TestTagNormalizer:
     """Tests for tag normalization functionality."""